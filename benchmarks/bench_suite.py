@@ -0,0 +1,459 @@
+"""
+Headless benchmark suite for the annotation hot paths.
+
+Usage:
+    python benchmarks/bench_suite.py [--quick] [--only io,undo,...] [--json results.json]
+
+Runs under QT_QPA_PLATFORM=offscreen (set automatically) against synthetic datasets
+generated in a temporary folder. Groups:
+
+    io      load_yolo_txt / save_yolo_txt at 10 .. 100k rows
+    undo    UndoStack.push with large change lists, begin_modify on a big polygon
+    load    MainWindow._load_image end to end (decode + parse + scene), cold and cached;
+            a 6000x4000 JPEG with and without the progressive preview
+    scene   _rebuild_scene_from_bboxes with thousands of boxes (per-item and layered)
+    list    annotation list model reset with thousands of rows
+    folder  open_folder on a folder with 100k image files
+    drag    simulated drag sequences on rect / obb / polygon items (ms per frame)
+    startup main.py --startup-time in a fresh process (imports to first frame)
+
+Every result is a dict {group, name, params, repeat, best_ms, median_ms}; --json writes
+them together with environment metadata so runs can be compared over time.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from PyQt5.QtCore import QEvent, QEventLoop, QElapsedTimer, QPoint, QSettings, Qt, QT_VERSION_STR
+from PyQt5.QtCore import PYQT_VERSION_STR
+from PyQt5.QtGui import QColor, QImage, QMouseEvent
+from PyQt5.QtTest import QTest
+from PyQt5.QtWidgets import QApplication, QFileDialog
+
+from core.bbox import BBox
+from core.undo_stack import Change, UndoStack
+from core.yolo_io import load_yolo_txt, save_yolo_txt
+
+GROUPS = ("io", "undo", "load", "scene", "list", "folder", "drag", "startup")
+
+
+# ======================= 工具 =======================
+
+def measure(fn, repeat: int, setup=None):
+    """返回每次耗时（秒）；setup 在每次计时前执行，不计入"""
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+class Recorder:
+    def __init__(self, only):
+        self.only = only
+        self.results = []
+
+    def wants(self, group):
+        return not self.only or group in self.only
+
+    def add(self, group, name, params, times, unit_divisor=1):
+        result = {
+            "group": group,
+            "name": name,
+            "params": params,
+            "repeat": len(times),
+            "best_ms": round(min(times) * 1000 / unit_divisor, 4),
+            "median_ms": round(statistics.median(times) * 1000 / unit_divisor, 4),
+        }
+        self.results.append(result)
+        shown = ", ".join(f"{k}={v}" for k, v in params.items())
+        print(f"{group:<7} {name:<34} {shown:<32} {result['best_ms']:10.3f} ms"
+              f"  (median {result['median_ms']:.3f})", flush=True)
+
+
+def pump(ms=0):
+    app = QApplication.instance()
+    timer = QElapsedTimer()
+    timer.start()
+    app.processEvents(QEventLoop.AllEvents)
+    while timer.elapsed() < ms:
+        app.processEvents(QEventLoop.AllEvents, 10)
+
+
+def wait_until(cond, timeout_ms=60000):
+    timer = QElapsedTimer()
+    timer.start()
+    while not cond():
+        if timer.elapsed() > timeout_ms:
+            raise TimeoutError("benchmark step did not finish")
+        QApplication.instance().processEvents(QEventLoop.AllEvents, 5)
+
+
+def random_bboxes(n, rng, polygon_vertices=12):
+    bboxes = []
+    for i in range(n):
+        kind = rng.random()
+        cx, cy = rng.uniform(0.05, 0.95), rng.uniform(0.05, 0.95)
+        if kind < 0.7:
+            bboxes.append(BBox(id=i, class_id=rng.randrange(80), type='rect', x_center=cx,
+                               y_center=cy, width=rng.uniform(0.005, 0.05),
+                               height=rng.uniform(0.005, 0.05)))
+        elif kind < 0.85:
+            d = rng.uniform(0.005, 0.03)
+            points = [(cx - d, cy - d), (cx + d, cy - d), (cx + d, cy + d), (cx - d, cy + d)]
+            bboxes.append(BBox(id=i, class_id=rng.randrange(80), type='obb', points=points))
+        else:
+            d = rng.uniform(0.005, 0.03)
+            points = [(cx + d * rng.uniform(0.6, 1.0) * c, cy + d * rng.uniform(0.6, 1.0) * s)
+                      for c, s in _unit_circle(polygon_vertices)]
+            bboxes.append(BBox(id=i, class_id=rng.randrange(80), type='polygon', points=points))
+    return bboxes
+
+
+def _unit_circle(n):
+    import math
+    return [(math.cos(2 * math.pi * k / n), math.sin(2 * math.pi * k / n)) for k in range(n)]
+
+
+def write_image(path: Path, width=1280, height=960):
+    image = QImage(width, height, QImage.Format_RGB32)
+    image.fill(QColor(90, 120, 150))
+    image.save(str(path))
+
+
+# ======================= 各组 =======================
+
+def bench_io(rec, tmp, args, rng):
+    for rows in args.rows:
+        path = tmp / f"io_{rows}.txt"
+        bboxes = random_bboxes(rows, rng)
+        save_yolo_txt(path, bboxes, skip_unchanged=False)
+        repeat = args.repeat if rows <= 10000 else max(1, args.repeat // 2)
+        rec.add("io", "load_yolo_txt", {"rows": rows}, measure(lambda: load_yolo_txt(path), repeat))
+        rec.add("io", "save_yolo_txt", {"rows": rows},
+                measure(lambda: save_yolo_txt(path, bboxes, skip_unchanged=False), repeat))
+        rec.add("io", "save_yolo_txt (unchanged)", {"rows": rows},
+                measure(lambda: save_yolo_txt(path, bboxes), repeat))
+
+
+def bench_undo(rec, tmp, args, rng):
+    for n in args.boxes:
+        bboxes = random_bboxes(n, rng)
+        changes = [Change(b.id, i, b, None) for i, b in enumerate(bboxes)]
+
+        def push_many():
+            stack = UndoStack()
+            for _ in range(20):
+                stack.push(list(changes))
+
+        rec.add("undo", "push (all boxes, x20)", {"boxes": n}, measure(push_many, args.repeat))
+
+    polygon = BBox(id=0, class_id=0, type='polygon',
+                   points=[(0.5 + 0.3 * c, 0.5 + 0.3 * s) for c, s in _unit_circle(5000)])
+    stack = UndoStack()
+
+    def modify():
+        for k in range(100):
+            stack.begin_modify(polygon, 0)
+            polygon.points[k] = (polygon.points[k][0] + 1e-4, polygon.points[k][1])
+        stack.push([])
+
+    rec.add("undo", "begin_modify x100", {"vertices": 5000}, measure(modify, args.repeat))
+
+
+class Window:
+    """MainWindow 与一个临时数据集（图片目录 + 标注目录）"""
+
+    def __init__(self, tmp):
+        from ui.main_window import MainWindow
+        self.images = tmp / "images"
+        self.labels = tmp / "labels"
+        self.images.mkdir(exist_ok=True)
+        self.labels.mkdir(exist_ok=True)
+        self.w = MainWindow()
+        self.w.resize(1600, 1000)
+        self.w.show()
+        self.w.save_folder_path = self.labels
+        pump(50)
+
+    def open(self, folder):
+        QFileDialog.getExistingDirectory = staticmethod(lambda *a, **k: str(folder))
+        self.w.open_folder()
+        self.wait_loaded()
+
+    def wait_loaded(self):
+        wait_until(lambda: not self.w._is_loading())
+
+    def show_image(self, name, bboxes, layer_threshold=0):
+        path = self.images / name
+        if not path.exists():
+            write_image(path)
+        save_yolo_txt(self.labels / Path(name).with_suffix(".txt"), bboxes, skip_unchanged=False)
+        self.w._scene_reconciler.layer_threshold = layer_threshold
+        self.w._image_cache.clear()
+        self.w._load_image(path)
+        self.wait_loaded()
+        pump()
+
+    def close(self):
+        self.w._dirty_images.clear()
+        self.w.close()
+        pump()
+
+
+def bench_load(rec, win, args, rng):
+    w = win.w
+    for n in args.boxes:
+        name = f"load_{n}.jpg"
+        win.show_image(name, random_bboxes(n, rng))
+        path = win.images / name
+
+        def load():
+            w._load_image(path)
+            win.wait_loaded()
+
+        rec.add("load", "_load_image (cold)", {"boxes": n},
+                measure(load, args.repeat, setup=w._image_cache.clear))
+        rec.add("load", "_load_image (cached)", {"boxes": n}, measure(load, args.repeat))
+
+    # 大图：可编辑的首帧（渐进加载时为预览）与原图显示完成
+    path = win.images / "load_large.jpg"
+    write_image(path, 6000, 4000)
+    win.show_image(path.name, random_bboxes(args.boxes[0], rng))
+
+    def full_resolution_shown():
+        item = w.image_view.image_item
+        return not w._is_loading() and item is not None and item.transform().isIdentity()
+
+    for progressive in (False, True):
+        w._load_pipeline.progressive = progressive
+
+        def first_frame():
+            w._load_image(path)
+            win.wait_loaded()
+
+        def full():
+            w._load_image(path)
+            wait_until(full_resolution_shown)
+
+        params = {"size": "6000x4000", "progressive": progressive}
+        rec.add("load", "_load_image large (first frame)", params,
+                measure(first_frame, args.repeat, setup=w._image_cache.clear))
+        rec.add("load", "_load_image large (full resolution)", params,
+                measure(full, args.repeat, setup=w._image_cache.clear))
+    w._load_pipeline.progressive = w._app_settings.progressive_load
+
+
+def bench_scene(rec, win, args, rng):
+    w = win.w
+    for n in args.boxes:
+        for layered in (False, True):
+            threshold = 1 if layered else 0
+            win.show_image(f"scene_{n}.jpg", random_bboxes(n, rng), layer_threshold=threshold)
+
+            def setup():
+                w._scene_reconciler.clear()
+
+            def rebuild():
+                w._rebuild_scene_from_bboxes()
+                w.image_view.viewport().repaint()
+
+            rec.add("scene", "_rebuild_scene_from_bboxes", {"boxes": n, "layered": layered},
+                    measure(rebuild, args.repeat, setup=setup))
+    w._scene_reconciler.layer_threshold = w._app_settings.layer_threshold
+
+
+def bench_list(rec, win, args, rng):
+    w = win.w
+    for n in args.boxes:
+        bboxes = random_bboxes(n, rng)
+
+        def reset():
+            w.label_manager.set_bboxes(bboxes)
+            w.bbox_list.viewport().repaint()
+
+        rec.add("list", "bbox list reset", {"boxes": n}, measure(reset, args.repeat))
+
+
+def bench_folder(rec, win, args, tmp):
+    folder = tmp / "folder"
+    folder.mkdir()
+    # 只有排序后的第一张需要能解码
+    write_image(folder / "000000.jpg", 320, 240)
+    for i in range(1, args.folder_files):
+        (folder / f"{i:06d}.jpg").touch()
+    rec.add("folder", "open_folder", {"files": args.folder_files},
+            measure(lambda: win.open(folder), max(1, args.repeat // 2)))
+
+
+def bench_drag(rec, win, args, rng):
+    from ui.drag_coalescer import drag_coalescer
+    from ui.graphics_utils import select_only
+    w = win.w
+    polygon = [(0.7 + 0.1 * c, 0.5 + 0.1 * s) for c, s in _unit_circle(args.drag_vertices)]
+    bboxes = [
+        BBox(id=0, class_id=0, type='rect', x_center=0.2, y_center=0.5, width=0.1, height=0.1),
+        BBox(id=1, class_id=0, type='obb',
+             points=[(0.4, 0.45), (0.5, 0.45), (0.5, 0.55), (0.4, 0.55)]),
+        BBox(id=2, class_id=0, type='polygon', points=polygon),
+    ]
+    win.show_image("drag.jpg", bboxes)
+    view = w.image_view
+    view.fit_to_view()
+    pump()
+    moves = args.drag_moves
+
+    for bbox_id, label in ((0, "rect"), (1, "obb"), (2, "polygon")):
+        item = w.bbox_items[bbox_id]
+        select_only(item)
+        pump()
+
+        def drag():
+            start = view.mapFromScene(item.sceneBoundingRect().center())
+            QTest.mousePress(view.viewport(), Qt.LeftButton, Qt.NoModifier, start)
+            for i in range(1, moves + 1):
+                pos = start + QPoint(i % 20 - 10, i % 14 - 7)
+                QApplication.sendEvent(view.viewport(), QMouseEvent(
+                    QEvent.MouseMove, pos, Qt.LeftButton, Qt.LeftButton, Qt.NoModifier))
+                # 每次移动都当作新的一帧：应用几何并同步重绘
+                drag_coalescer().flush()
+                view.viewport().repaint()
+            QTest.mouseRelease(view.viewport(), Qt.LeftButton, Qt.NoModifier, start)
+
+        params = {"type": label, "moves": moves}
+        if label == "polygon":
+            params["vertices"] = args.drag_vertices
+        rec.add("drag", "drag frame", params, measure(drag, args.repeat), unit_divisor=moves)
+    w._undo_stack.clear()
+
+
+def bench_startup(rec, tmp, args):
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", XDG_CONFIG_HOME=str(tmp / "settings"))
+    runs = []
+    for _ in range(args.repeat):
+        out = subprocess.run([sys.executable, str(ROOT / "main.py"), "--startup-time"], cwd=ROOT,
+                             env=env, capture_output=True, text=True, timeout=120)
+        lines = [line for line in out.stdout.splitlines() if line.startswith("{")]
+        if out.returncode != 0 or not lines:
+            raise RuntimeError(f"main.py --startup-time failed: {out.stderr.strip()}")
+        runs.append(json.loads(lines[-1]))
+    rec.add("startup", "main.py to first frame", {},
+            [r["total_ms"] / 1000 for r in runs])
+    for phase in runs[0]["phases_ms"]:
+        rec.add("startup", f"phase: {phase}", {},
+                [r["phases_ms"][phase] / 1000 for r in runs])
+
+
+# ======================= 入口 =======================
+
+def _git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                             capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="smaller sizes for a fast check")
+    parser.add_argument("--only", default="", help=f"comma-separated groups: {','.join(GROUPS)}")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", type=Path, default=None, help="write results to this file")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    only = {g for g in args.only.split(",") if g}
+    unknown = only - set(GROUPS)
+    if unknown:
+        print(f"unknown groups: {', '.join(sorted(unknown))}", file=sys.stderr)
+        return 2
+    if args.quick:
+        args.rows = [10, 1000, 10000]
+        args.boxes = [1000]
+        args.folder_files = 10000
+        args.drag_moves = 30
+        args.drag_vertices = 500
+        args.repeat = min(args.repeat, 3)
+    else:
+        args.rows = [10, 1000, 10000, 100000]
+        args.boxes = [1000, 5000]
+        args.folder_files = 100000
+        args.drag_moves = 60
+        args.drag_vertices = 2000
+
+    rec = Recorder(only)
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        # 设置写到临时目录，不影响本机的偏好
+        for fmt in (QSettings.NativeFormat, QSettings.IniFormat):
+            QSettings.setPath(fmt, QSettings.UserScope, str(tmp / "settings"))
+        app = QApplication.instance() or QApplication(sys.argv[:1])
+
+        if rec.wants("io"):
+            bench_io(rec, tmp, args, rng)
+        if rec.wants("undo"):
+            bench_undo(rec, tmp, args, rng)
+        if rec.wants("startup"):
+            bench_startup(rec, tmp, args)
+        gui_groups = [g for g in ("load", "scene", "list", "folder", "drag") if rec.wants(g)]
+        if gui_groups:
+            win = Window(tmp)
+            try:
+                if rec.wants("load"):
+                    bench_load(rec, win, args, rng)
+                if rec.wants("scene"):
+                    bench_scene(rec, win, args, rng)
+                if rec.wants("list"):
+                    bench_list(rec, win, args, rng)
+                if rec.wants("drag"):
+                    bench_drag(rec, win, args, rng)
+                if rec.wants("folder"):
+                    bench_folder(rec, win, args, tmp)
+            finally:
+                win.close()
+        app.processEvents()
+
+    if args.json is not None:
+        report = {
+            "meta": {
+                "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "commit": _git_commit(),
+                "python": platform.python_version(),
+                "qt": QT_VERSION_STR,
+                "pyqt": PYQT_VERSION_STR,
+                "platform": platform.platform(),
+                "qpa": os.environ.get("QT_QPA_PLATFORM"),
+                "quick": args.quick,
+                "repeat": args.repeat,
+            },
+            "results": rec.results,
+        }
+        args.json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"wrote {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""
+Compare the columnar YOLO label parser against the original per-row loop.
+
+Usage:
+    python benchmarks/bench_yolo_io.py --rows 5000 --files 200
+"""
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.bbox import BBox
+from core.yolo_io import (
+    _is_polygon_row, load_yolo_txt, load_yolo_columns, load_yolo_columns_many,
+)
+
+
+def legacy_load_yolo_txt(txt_path: Path):
+    """The per-row str.split/float() loop that load_yolo_txt used before."""
+    bboxes = []
+    if not txt_path.exists():
+        return bboxes
+    with open(txt_path, "r", encoding="utf-8") as f:
+        for idx, line in enumerate(f):
+            parts = line.strip().split()
+            if not parts:
+                continue
+            if len(parts) == 5:
+                class_id, x, y, w, h = parts
+                bboxes.append(BBox(id=idx, class_id=int(class_id), type='rect',
+                                   x_center=float(x), y_center=float(y),
+                                   width=float(w), height=float(h)))
+            elif len(parts) == 9:
+                points = [(float(parts[i]), float(parts[i + 1])) for i in range(1, 9, 2)]
+                bboxes.append(BBox(id=idx, class_id=int(parts[0]), type='obb', points=points))
+            elif _is_polygon_row(len(parts)):
+                points = [(float(parts[i]), float(parts[i + 1])) for i in range(1, len(parts), 2)]
+                bboxes.append(BBox(id=idx, class_id=int(parts[0]), type='polygon', points=points))
+    return bboxes
+
+
+def write_synthetic_file(path: Path, rows: int, rng: random.Random, poly_vertices: int = 12):
+    lines = []
+    for _ in range(rows):
+        kind = rng.random()
+        class_id = rng.randrange(80)
+        if kind < 0.7:
+            n_values = 4
+        elif kind < 0.85:
+            n_values = 8
+        else:
+            n_values = poly_vertices * 2
+        values = " ".join(f"{rng.random():.6f}" for _ in range(n_values))
+        lines.append(f"{class_id} {values}")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000, help="rows in the single-file case")
+    parser.add_argument("--files", type=int, default=200, help="files in the dataset case")
+    parser.add_argument("--rows-per-file", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        big = tmp / "big.txt"
+        write_synthetic_file(big, args.rows, rng)
+        small = []
+        for i in range(args.files):
+            p = tmp / f"img_{i:06d}.txt"
+            write_synthetic_file(p, args.rows_per_file, rng)
+            small.append(p)
+
+        assert load_yolo_txt(big) == legacy_load_yolo_txt(big)
+
+        results = [
+            (f"single file, {args.rows} rows: legacy loop",
+             best_of(lambda: legacy_load_yolo_txt(big), args.repeat)),
+            (f"single file, {args.rows} rows: load_yolo_columns",
+             best_of(lambda: load_yolo_columns(big), args.repeat)),
+            (f"single file, {args.rows} rows: load_yolo_txt (columns -> BBox)",
+             best_of(lambda: load_yolo_txt(big), args.repeat)),
+            (f"{args.files} files: legacy loop",
+             best_of(lambda: [legacy_load_yolo_txt(p) for p in small], args.repeat)),
+            (f"{args.files} files: load_yolo_columns_many",
+             best_of(lambda: load_yolo_columns_many(small), args.repeat)),
+        ]
+
+    width = max(len(name) for name, _ in results)
+    for name, seconds in results:
+        print(f"{name:<{width}}  {seconds * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
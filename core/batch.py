@@ -0,0 +1,319 @@
+"""
+整个标注目录的批量操作（不依赖 PyQt5，供 yolo_batch.py 使用）
+
+文件按块分发到进程池，每块返回一个 BatchSummary，由主进程合并。
+"""
+import math
+import os
+from collections import Counter
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from core.bbox import BBox
+from core.polygon_simplify import simplify_normalized
+from core.yolo_io import (
+    TYPE_NAMES, LabelColumns, _is_polygon_row, format_yolo_txt, load_yolo_columns,
+    load_yolo_columns_many, load_yolo_txt, parse_yolo_bytes, save_yolo_txt, write_bytes_atomic,
+)
+
+DEFAULT_CHUNK_SIZE = 256
+# 每个文件最多记录的问题数，避免一个损坏文件刷屏
+MAX_ISSUES_PER_FILE = 20
+
+
+class BatchSummary:
+    """一块（或合并后全部）文件的处理结果"""
+
+    __slots__ = ("files", "changed", "empty_files", "boxes", "class_counts", "type_counts",
+                 "issues", "errors", "vertices_before", "vertices_after", "bytes_before",
+                 "bytes_after")
+
+    def __init__(self):
+        self.files = 0
+        self.changed = 0
+        self.empty_files = 0
+        self.boxes = 0
+        self.class_counts = Counter()
+        self.type_counts = Counter()
+        self.issues = []   # (文件名, 行号, 说明)
+        self.errors = []   # (文件名, 说明)
+        # simplify：多边形顶点数与文件字节数（处理前 / 后）
+        self.vertices_before = 0
+        self.vertices_after = 0
+        self.bytes_before = 0
+        self.bytes_after = 0
+
+    def merge(self, other: "BatchSummary"):
+        self.files += other.files
+        self.changed += other.changed
+        self.empty_files += other.empty_files
+        self.boxes += other.boxes
+        self.class_counts.update(other.class_counts)
+        self.type_counts.update(other.type_counts)
+        self.issues.extend(other.issues)
+        self.errors.extend(other.errors)
+        self.vertices_before += other.vertices_before
+        self.vertices_after += other.vertices_after
+        self.bytes_before += other.bytes_before
+        self.bytes_after += other.bytes_after
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+
+def list_label_files(folder: Path) -> List[Path]:
+    folder = Path(folder)
+    with os.scandir(folder) as it:
+        names = [e.name for e in it if e.name.endswith(".txt") and e.is_file()]
+    return [folder / name for name in sorted(names)]
+
+
+# ======================= 单块操作（在工作进程中执行） =======================
+
+def _check_line(parts, num_classes: Optional[int]) -> Optional[str]:
+    n = len(parts)
+    if not (n == 5 or n == 9 or _is_polygon_row(n)):
+        return f"unexpected field count {n}"
+    try:
+        class_id = int(parts[0])
+    except ValueError:
+        return f"class id {parts[0]!r} is not an integer"
+    if class_id < 0 or (num_classes is not None and class_id >= num_classes):
+        return f"class id {class_id} out of range"
+    try:
+        values = [float(v) for v in parts[1:]]
+    except ValueError:
+        return "non-numeric coordinate"
+    if not all(0.0 <= v <= 1.0 for v in values):
+        return "coordinate outside [0, 1]"
+    if n == 5 and (values[2] <= 0.0 or values[3] <= 0.0):
+        return "zero-size box"
+    return None
+
+
+def validate_chunk(paths: List[Path], options: Dict) -> BatchSummary:
+    summary = BatchSummary()
+    num_classes = options.get("num_classes")
+    for path in paths:
+        summary.files += 1
+        try:
+            text = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError) as e:
+            summary.errors.append((path.name, str(e)))
+            continue
+        found = 0
+        for lineno, line in enumerate(text.splitlines(), 1):
+            parts = line.split()
+            if not parts:
+                continue
+            problem = _check_line(parts, num_classes)
+            if problem is None:
+                continue
+            summary.issues.append((path.name, lineno, problem))
+            found += 1
+            if found >= MAX_ISSUES_PER_FILE:
+                break
+    return summary
+
+
+def _rewrite_chunk(paths: List[Path], options: Dict, transform) -> BatchSummary:
+    summary = BatchSummary()
+    dry_run = options.get("dry_run", False)
+    for path in paths:
+        summary.files += 1
+        try:
+            bboxes = transform(load_yolo_txt(path))
+            if dry_run:
+                data = format_yolo_txt(bboxes).encode("utf-8")
+                if path.read_bytes() != data:
+                    summary.changed += 1
+            elif save_yolo_txt(path, bboxes):
+                summary.changed += 1
+        except (OSError, ValueError) as e:
+            summary.errors.append((path.name, str(e)))
+    return summary
+
+
+def normalize_chunk(paths: List[Path], options: Dict) -> BatchSummary:
+    """按 save_yolo_txt 的格式重写（裁剪到 [0, 1]、统一小数位，丢弃无法解析的行）"""
+    return _rewrite_chunk(paths, options, lambda bboxes: bboxes)
+
+
+def _points_bounds(points):
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _rect_corners(bbox: BBox):
+    x0 = bbox.x_center - bbox.width / 2
+    y0 = bbox.y_center - bbox.height / 2
+    x1 = bbox.x_center + bbox.width / 2
+    y1 = bbox.y_center + bbox.height / 2
+    return [(x0, y0), (x1, y0), (x1, y1), (x0, y1)]
+
+
+def convert_bbox(bbox: BBox, target: str) -> BBox:
+    """
+    转换标注类型
+
+    - rect: obb/polygon 取外接矩形
+    - obb: rect 取四个角点，polygon 取外接矩形的四个角点
+    4 点多边形在 txt 中与 obb 无法区分，因此不支持转换为 polygon。
+    """
+    if bbox.type == target:
+        return bbox
+    if target == 'rect':
+        x0, y0, x1, y1 = _points_bounds(bbox.points)
+        return BBox(id=bbox.id, class_id=bbox.class_id, type='rect',
+                    x_center=(x0 + x1) / 2, y_center=(y0 + y1) / 2,
+                    width=x1 - x0, height=y1 - y0)
+    if target == 'obb':
+        if bbox.type == 'rect':
+            points = _rect_corners(bbox)
+        else:
+            x0, y0, x1, y1 = _points_bounds(bbox.points)
+            points = [(x0, y0), (x1, y0), (x1, y1), (x0, y1)]
+        return BBox(id=bbox.id, class_id=bbox.class_id, type='obb', points=points)
+    raise ValueError(f"unsupported target type: {target}")
+
+
+def convert_chunk(paths: List[Path], options: Dict) -> BatchSummary:
+    target = options["target"]
+    sources = set(options.get("sources") or TYPE_NAMES)
+
+    def transform(bboxes):
+        return [convert_bbox(b, target) if b.type in sources else b for b in bboxes]
+
+    return _rewrite_chunk(paths, options, transform)
+
+
+def _load_columns_per_file(paths: List[Path], summary: BatchSummary) -> LabelColumns:
+    """逐个解析，出错的文件记入 errors，其余文件照常统计"""
+    parts = []
+    for path in paths:
+        try:
+            parts.append(load_yolo_columns(path))
+        except (OSError, ValueError) as e:
+            summary.errors.append((path.name, str(e)))
+    return LabelColumns.concatenate(parts)
+
+
+def stats_chunk(paths: List[Path], options: Dict) -> BatchSummary:
+    summary = BatchSummary()
+    summary.files = len(paths)
+    try:
+        columns = load_yolo_columns_many(paths)
+    except (OSError, ValueError):
+        # 整块一起解析时无法知道是哪个文件出错，退回逐个解析
+        columns = _load_columns_per_file(paths, summary)
+    summary.boxes = len(columns)
+    summary.empty_files = int(np.count_nonzero(np.diff(columns.file_offsets) == 0))
+    if len(columns):
+        values, counts = np.unique(columns.class_ids, return_counts=True)
+        summary.class_counts.update(dict(zip(values.tolist(), counts.tolist())))
+        values, counts = np.unique(columns.types, return_counts=True)
+        summary.type_counts.update({TYPE_NAMES[v]: c for v, c in zip(values.tolist(), counts.tolist())})
+    return summary
+
+
+def simplify_chunk(paths: List[Path], options: Dict) -> BatchSummary:
+    """
+    简化多边形顶点
+
+    容差以像素计，按 image_size（宽, 高）换算为归一化坐标；标注目录中没有图片尺寸，
+    因此用同一个名义尺寸（通常为训练输入尺寸）。只有多边形实际变化的文件才重写。
+    """
+    summary = BatchSummary()
+    tolerance = options.get("tolerance", 1.0)
+    width, height = options.get("image_size") or (640, 640)
+    method = options.get("method") or "rdp"
+    dry_run = options.get("dry_run", False)
+    for path in paths:
+        summary.files += 1
+        try:
+            raw = path.read_bytes()
+            bboxes = parse_yolo_bytes(raw).to_bboxes()
+            changed = False
+            for bbox in bboxes:
+                if bbox.type != 'polygon':
+                    continue
+                points = simplify_normalized(bbox.points, tolerance, width, height, method)
+                summary.vertices_before += len(bbox.points)
+                summary.vertices_after += len(points)
+                if len(points) < len(bbox.points):
+                    bbox.points = points
+                    changed = True
+            data = format_yolo_txt(bboxes).encode("utf-8") if changed else raw
+            summary.bytes_before += len(raw)
+            summary.bytes_after += len(data)
+            if changed:
+                summary.changed += 1
+                if not dry_run:
+                    write_bytes_atomic(path, data)
+        except (OSError, ValueError) as e:
+            summary.errors.append((path.name, str(e)))
+    return summary
+
+
+OPERATIONS: Dict[str, Callable[[List[Path], Dict], BatchSummary]] = {
+    "validate": validate_chunk,
+    "normalize": normalize_chunk,
+    "convert": convert_chunk,
+    "stats": stats_chunk,
+    "simplify": simplify_chunk,
+}
+
+
+def _run_chunk(args) -> BatchSummary:
+    op, paths, options = args
+    return OPERATIONS[op]([Path(p) for p in paths], options)
+
+
+# ======================= 调度 =======================
+
+def run_batch(op: str, paths: List[Path], options: Optional[Dict] = None,
+              jobs: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+              progress: Optional[Callable[[int, int], None]] = None) -> BatchSummary:
+    """
+    在进程池中对 paths 执行 OPERATIONS[op]
+
+    jobs 默认为 CPU 核数，jobs=1 时在当前进程顺序执行；progress(已完成文件数, 总数) 每块回调一次。
+    结果中的 issues / errors 按文件名排序，与块的完成顺序无关。
+    """
+    if op not in OPERATIONS:
+        raise ValueError(f"unknown operation: {op}")
+    options = options or {}
+    # 以字符串传给工作进程，减少序列化开销
+    paths = [str(p) for p in paths]
+    chunk_size = max(1, chunk_size)
+    chunks = [paths[i:i + chunk_size] for i in range(0, len(paths), chunk_size)]
+    tasks = [(op, chunk, options) for chunk in chunks]
+    jobs = jobs or os.cpu_count() or 1
+    jobs = max(1, min(jobs, len(chunks)))
+
+    summary = BatchSummary()
+    if jobs == 1:
+        for part in map(_run_chunk, tasks):
+            summary.merge(part)
+            if progress is not None:
+                progress(summary.files, len(paths))
+    else:
+        # 块数远多于进程数时，每次多取几块以减少进程间通信
+        per_task = max(1, math.ceil(len(tasks) / (jobs * 16)))
+        with Pool(jobs) as pool:
+            for part in pool.imap_unordered(_run_chunk, tasks, chunksize=per_task):
+                summary.merge(part)
+                if progress is not None:
+                    progress(summary.files, len(paths))
+
+    summary.issues.sort()
+    summary.errors.sort()
+    return summary
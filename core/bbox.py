@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import List, Tuple, Optional
 
-@dataclass
+@dataclass(slots=True)
 class BBox:
     id: int
     class_id: int
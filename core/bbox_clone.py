@@ -1,8 +1,16 @@
-import copy
 from typing import List
 
 from core.bbox import BBox
 
 
+def clone_bbox(bbox: BBox) -> BBox:
+    # points 中是不可变的 tuple，复制列表即可，无需 deepcopy
+    return BBox(
+        bbox.id, bbox.class_id, bbox.type,
+        bbox.x_center, bbox.y_center, bbox.width, bbox.height,
+        list(bbox.points) if bbox.points is not None else None,
+    )
+
+
 def clone_bboxes(bboxes: List[BBox]) -> List[BBox]:
-    return copy.deepcopy(bboxes)
+    return [clone_bbox(b) for b in bboxes]
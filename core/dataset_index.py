@@ -0,0 +1,245 @@
+import hashlib
+import os
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from core.yolo_io import LabelColumns, TYPE_NAMES, load_yolo_columns_many
+
+SCHEMA_VERSION = 1
+# 等待其它连接释放锁的秒数；索引只是缓存，宁可这次失败也不要长时间阻塞
+BUSY_TIMEOUT_S = 1.0
+
+# 一次解析并写入的文件数
+_REFRESH_BATCH = 512
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    name TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    box_count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS boxes (
+    file TEXT NOT NULL,
+    row INTEGER NOT NULL,
+    class_id INTEGER NOT NULL,
+    type INTEGER NOT NULL,
+    coords BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS boxes_file ON boxes(file);
+CREATE INDEX IF NOT EXISTS boxes_class ON boxes(class_id);
+"""
+
+
+def _cache_root() -> Path:
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "YOLOTxtMaker" / "index"
+
+
+def default_index_path(save_folder: Path) -> Path:
+    """
+    索引数据库的默认位置：本机缓存目录下按保存目录路径区分的文件
+
+    不放在保存目录里：保存目录常在网络共享上，SQLite 的 WAL 模式在网络文件系统上不可用。
+    """
+    key = hashlib.sha1(str(Path(save_folder).resolve()).encode("utf-8")).hexdigest()[:16]
+    return _cache_root() / f"{key}.sqlite3"
+
+
+class DatasetIndex:
+    """
+    保存目录的持久化标注索引（SQLite）
+
+    每个 txt 以 名称 + size + mtime_ns 为键记录解析后的全部标注，refresh() 只重新解析
+    发生变化的文件；save_txt 写盘后调用 update_file() 同步单个文件。
+    数据库默认位于 default_index_path()。GUI 中只由 IndexRefresher 的工作线程访问。
+    """
+
+    def __init__(self, save_folder: Path, db_path: Optional[Path] = None):
+        self.folder = Path(save_folder)
+        self.db_path = Path(db_path) if db_path else default_index_path(self.folder)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), timeout=BUSY_TIMEOUT_S)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_schema()
+
+    def _init_schema(self):
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            with self._conn:
+                self._conn.execute("DROP TABLE IF EXISTS files")
+                self._conn.execute("DROP TABLE IF EXISTS boxes")
+                self._conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ======================= 更新 =======================
+
+    def _scan_folder(self) -> Dict[str, tuple]:
+        found = {}
+        with os.scandir(self.folder) as it:
+            for entry in it:
+                if not entry.name.endswith(".txt"):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    st = entry.stat()
+                except OSError:
+                    continue
+                found[entry.name] = (st.st_size, st.st_mtime_ns)
+        return found
+
+    def refresh(self, progress=None):
+        """
+        与磁盘同步：解析新增/修改的文件，删除已不存在的文件
+
+        返回 (更新的文件数, 删除的文件数)。progress(done, total) 可选。
+        """
+        on_disk = self._scan_folder()
+        known = {
+            name: (size, mtime)
+            for name, size, mtime in self._conn.execute("SELECT name, size, mtime_ns FROM files")
+        }
+        changed = [name for name, stat in on_disk.items() if known.get(name) != stat]
+        removed = [name for name in known if name not in on_disk]
+
+        with self._conn:
+            self._conn.executemany(
+                "DELETE FROM boxes WHERE file = ?", ((n,) for n in removed)
+            )
+            self._conn.executemany(
+                "DELETE FROM files WHERE name = ?", ((n,) for n in removed)
+            )
+
+        for start in range(0, len(changed), _REFRESH_BATCH):
+            names = changed[start:start + _REFRESH_BATCH]
+            try:
+                columns = load_yolo_columns_many(self.folder / n for n in names)
+                per_file = [columns.file_columns(i) for i in range(len(names))]
+            except (OSError, ValueError):
+                per_file = [self._parse_one(n) for n in names]
+            with self._conn:
+                for name, cols in zip(names, per_file):
+                    self._store_columns(name, on_disk[name], cols)
+            if progress is not None:
+                progress(min(start + _REFRESH_BATCH, len(changed)), len(changed))
+
+        return len(changed), len(removed)
+
+    def _parse_one(self, name: str) -> LabelColumns:
+        try:
+            return load_yolo_columns_many([self.folder / name])
+        except (OSError, ValueError):
+            # 无法解析的文件按空文件记录，避免每次 refresh 都重试
+            return LabelColumns.empty()
+
+    def _store_columns(self, name: str, stat: tuple, cols: LabelColumns):
+        self._conn.execute("DELETE FROM boxes WHERE file = ?", (name,))
+        offsets = cols.offsets.tolist()
+        coords = cols.coords
+        self._conn.executemany(
+            "INSERT INTO boxes (file, row, class_id, type, coords) VALUES (?, ?, ?, ?, ?)",
+            (
+                (name, row, class_id, kind, coords[offsets[i]:offsets[i + 1]].tobytes())
+                for i, (row, class_id, kind) in enumerate(
+                    zip(cols.ids.tolist(), cols.class_ids.tolist(), cols.types.tolist())
+                )
+            ),
+        )
+        self._conn.execute(
+            "INSERT OR REPLACE INTO files (name, size, mtime_ns, box_count) VALUES (?, ?, ?, ?)",
+            (name, stat[0], stat[1], len(cols)),
+        )
+
+    def update_file(self, txt_path: Path):
+        """按磁盘上实际写入的内容同步单个 txt"""
+        txt_path = Path(txt_path)
+        try:
+            st = txt_path.stat()
+        except OSError:
+            self.remove_file(txt_path.name)
+            return
+        cols = self._parse_one(txt_path.name)
+        with self._conn:
+            self._store_columns(txt_path.name, (st.st_size, st.st_mtime_ns), cols)
+
+    def remove_file(self, name: str):
+        with self._conn:
+            self._conn.execute("DELETE FROM boxes WHERE file = ?", (name,))
+            self._conn.execute("DELETE FROM files WHERE name = ?", (name,))
+
+    # ======================= 查询 =======================
+
+    def file_count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def box_count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM boxes").fetchone()[0]
+
+    def labeled_names(self) -> List[str]:
+        return [r[0] for r in self._conn.execute(
+            "SELECT name FROM files WHERE box_count > 0 ORDER BY name"
+        )]
+
+    def empty_names(self) -> List[str]:
+        return [r[0] for r in self._conn.execute(
+            "SELECT name FROM files WHERE box_count = 0 ORDER BY name"
+        )]
+
+    def class_counts(self) -> Dict[int, int]:
+        return dict(self._conn.execute(
+            "SELECT class_id, COUNT(*) FROM boxes GROUP BY class_id ORDER BY class_id"
+        ))
+
+    def type_counts(self) -> Dict[str, int]:
+        return {
+            TYPE_NAMES[kind]: count
+            for kind, count in self._conn.execute(
+                "SELECT type, COUNT(*) FROM boxes GROUP BY type ORDER BY type"
+            )
+        }
+
+    def stats(self) -> Dict:
+        """数据集统计：files / labeled / boxes / types / classes"""
+        return {
+            "files": self.file_count(),
+            "labeled": len(self.labeled_names()),
+            "boxes": self.box_count(),
+            "types": self.type_counts(),
+            "classes": self.class_counts(),
+        }
+
+    def names_with_class(self, class_id: int) -> List[str]:
+        return [r[0] for r in self._conn.execute(
+            "SELECT DISTINCT file FROM boxes WHERE class_id = ? ORDER BY file", (class_id,)
+        )]
+
+    def file_boxes(self, name: str):
+        """返回 [(row, class_id, type_name, coords ndarray), ...]"""
+        return [
+            (row, class_id, TYPE_NAMES[kind], np.frombuffer(blob, dtype=np.float64))
+            for row, class_id, kind, blob in self._conn.execute(
+                "SELECT row, class_id, type, coords FROM boxes WHERE file = ? ORDER BY row",
+                (name,),
+            )
+        ]
+
@@ -1,12 +1,132 @@
+from typing import Iterable, List, Optional
+
+from core.bbox import BBox
+
+
 class LabelManager:
+    """
+    当前图片的标注列表
+
+    bboxes 的顺序即列表显示与 txt 保存的顺序；_rows 为 id -> 行号索引，
+    get()/row_of() 为 O(1)。id 由 next_id() 单调分配，删除后不会复用。
+    insert()/remove() 需要重建其后各行的索引，为 O(n - row)；一次删除多个标注时
+    请用 remove_many()，只重建一次索引。
+    bboxes 只读，修改请通过 add/insert/replace/remove/remove_many/set_bboxes；
+    原地修改某个标注后调用 notify_changed()。
+
+    监听者（如列表模型）需实现 labels_about_to_change(kind, row) 与 labels_changed(kind, row)，
+    kind 为 "insert" / "remove" / "update" / "reset"（reset 时 row 为 -1）。
+    """
+
     def __init__(self):
-        self.bboxes = []
+        self._bboxes: List[BBox] = []
+        self._rows = {}
+        self._next_id = 0
+        self._listeners = []
+
+    def add_listener(self, listener):
+        self._listeners.append(listener)
+
+    def _about_to_change(self, kind: str, row: int):
+        for listener in self._listeners:
+            listener.labels_about_to_change(kind, row)
+
+    def _changed(self, kind: str, row: int):
+        for listener in self._listeners:
+            listener.labels_changed(kind, row)
+
+    @property
+    def bboxes(self) -> List[BBox]:
+        return self._bboxes
+
+    @bboxes.setter
+    def bboxes(self, bboxes: Iterable[BBox]):
+        self.set_bboxes(bboxes)
+
+    def __len__(self):
+        return len(self._bboxes)
+
+    def set_bboxes(self, bboxes: Iterable[BBox]):
+        self._about_to_change("reset", -1)
+        self._bboxes = list(bboxes)
+        self._rows = {b.id: i for i, b in enumerate(self._bboxes)}
+        self._next_id = max(self._rows, default=-1) + 1
+        self._changed("reset", -1)
+
+    def next_id(self) -> int:
+        bbox_id = self._next_id
+        self._next_id += 1
+        return bbox_id
+
+    def get(self, bbox_id) -> Optional[BBox]:
+        row = self._rows.get(bbox_id)
+        return None if row is None else self._bboxes[row]
+
+    def row_of(self, bbox_id) -> int:
+        return self._rows.get(bbox_id, -1)
+
+    def _reindex_from(self, row: int):
+        rows = self._rows
+        bboxes = self._bboxes
+        for i in range(row, len(bboxes)):
+            rows[bboxes[i].id] = i
+
+    def add(self, bbox):
+        row = len(self._bboxes)
+        self._about_to_change("insert", row)
+        self._rows[bbox.id] = row
+        self._bboxes.append(bbox)
+        self._next_id = max(self._next_id, bbox.id + 1)
+        self._changed("insert", row)
+
+    def insert(self, row, bbox):
+        row = max(0, min(row, len(self._bboxes)))
+        self._about_to_change("insert", row)
+        self._bboxes.insert(row, bbox)
+        self._reindex_from(row)
+        self._next_id = max(self._next_id, bbox.id + 1)
+        self._changed("insert", row)
+
+    def replace(self, bbox) -> int:
+        """用 bbox 替换同 id 的标注，返回行号（不存在时返回 -1）"""
+        row = self._rows.get(bbox.id, -1)
+        if row >= 0:
+            self._bboxes[row] = bbox
+            self._changed("update", row)
+        return row
+
+    def notify_changed(self, bbox_id):
+        row = self._rows.get(bbox_id, -1)
+        if row >= 0:
+            self._changed("update", row)
+
+    def remove(self, bbox_id) -> int:
+        """删除并返回原行号（不存在时返回 -1）"""
+        row = self._rows.get(bbox_id)
+        if row is None:
+            return -1
+        self._about_to_change("remove", row)
+        del self._rows[bbox_id]
+        del self._bboxes[row]
+        self._reindex_from(row)
+        self._changed("remove", row)
+        return row
 
-    def add(self,bbox):
-        self.bboxes.append(bbox)
+    def remove_many(self, bbox_ids) -> List[int]:
+        """批量删除，返回被删除的原行号（升序，不存在的 id 忽略）
 
-    def remove(self,bbox_id):
-        self.bboxes=[b for b in self.bboxes if b.id !=bbox_id]
+        按行号从大到小逐行通知监听者，全部删除后再统一重建索引。
+        """
+        rows = sorted({self._rows[i] for i in bbox_ids if i in self._rows}, reverse=True)
+        for row in rows:
+            self._about_to_change("remove", row)
+            del self._rows[self._bboxes[row].id]
+            del self._bboxes[row]
+            self._changed("remove", row)
+        if rows:
+            self._reindex_from(rows[-1])
+        rows.reverse()
+        return rows
 
     def clear(self):
-        self.bboxes.clear()
\ No newline at end of file
+        self.set_bboxes([])
@@ -0,0 +1,57 @@
+import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+class LabelStatusIndex:
+    """
+    保存目录中 txt 文件的 名称 -> (size, mtime_ns) 索引
+
+    scan() 只做一次 os.scandir（目录项自带的 stat 信息在多数平台上无需额外请求），
+    之后列表渲染通过 is_labeled() 查询；save_txt 写盘后用 update() 原地刷新单个条目。
+    """
+
+    def __init__(self):
+        self.folder: Optional[Path] = None
+        self._entries: Dict[str, Tuple[int, int]] = {}
+
+    def scan(self, folder: Path):
+        self.folder = Path(folder)
+        entries = {}
+        try:
+            with os.scandir(self.folder) as it:
+                for entry in it:
+                    if not entry.name.endswith(".txt"):
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    entries[entry.name] = (st.st_size, st.st_mtime_ns)
+        except OSError:
+            pass
+        self._entries = entries
+
+    def clear(self):
+        self.folder = None
+        self._entries = {}
+
+    def get(self, txt_name: str) -> Optional[Tuple[int, int]]:
+        return self._entries.get(txt_name)
+
+    def is_labeled(self, txt_name: str) -> bool:
+        entry = self._entries.get(txt_name)
+        return entry is not None and entry[0] > 0
+
+    def update(self, txt_path: Path):
+        txt_path = Path(txt_path)
+        if self.folder is None or txt_path.parent != self.folder:
+            return
+        try:
+            st = txt_path.stat()
+        except OSError:
+            self._entries.pop(txt_path.name, None)
+            return
+        self._entries[txt_path.name] = (st.st_size, st.st_mtime_ns)
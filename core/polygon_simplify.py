@@ -0,0 +1,180 @@
+"""
+多边形顶点简化（Douglas-Peucker / Visvalingam-Whyatt）
+
+tolerance 与坐标同单位：DP 为点到弦的最大距离，Visvalingam 为有效三角形面积 tolerance²。
+对 YOLO 标注使用 simplify_normalized()，容差按图片像素给出。
+"""
+import heapq
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+Point = Tuple[float, float]
+
+METHODS = ("rdp", "visvalingam")
+# 简化后至少保留的顶点数
+MIN_VERTICES = 3
+
+
+def _rdp_keep(pts: np.ndarray, first: int, last: int, tolerance: float, keep: np.ndarray):
+    """Douglas-Peucker：在 keep 中标记 pts[first..last] 之间需要保留的点（迭代，避免递归过深）"""
+    stack = [(first, last)]
+    while stack:
+        a, b = stack.pop()
+        if b - a < 2:
+            continue
+        ax, ay = pts[a]
+        sx, sy = pts[b] - pts[a]
+        rel = pts[a + 1:b] - pts[a]
+        seg_len = np.hypot(sx, sy)
+        if seg_len == 0.0:
+            dist = np.hypot(rel[:, 0], rel[:, 1])
+        else:
+            dist = np.abs(sx * rel[:, 1] - sy * rel[:, 0]) / seg_len
+        i = int(np.argmax(dist))
+        if dist[i] > tolerance:
+            mid = a + 1 + i
+            keep[mid] = True
+            stack.append((a, mid))
+            stack.append((mid, b))
+
+
+def rdp_mask(points, tolerance: float, closed: bool = True) -> np.ndarray:
+    """
+    返回保留点的布尔掩码
+
+    closed=True 时按闭合多边形处理：以第 0 点和距其最远的点为锚点，两段分别简化，
+    避免折线首尾相接处被当成一条边；结果至少保留 MIN_VERTICES 个点。
+    """
+    pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    n = len(pts)
+    keep = np.zeros(n, dtype=bool)
+    if n == 0:
+        return keep
+    keep[0] = True
+    keep[-1] = True
+    if n < 3:
+        return keep
+    if closed:
+        far = int(np.argmax(np.hypot(*(pts - pts[0]).T)))
+        if far != 0:
+            keep[far] = True
+            _rdp_keep(pts, 0, far, tolerance, keep)
+            _rdp_keep(pts, far, n - 1, tolerance, keep)
+        # far 为最后一点时只剩两个锚点，多边形退化成线段：补回偏离最大的点
+        while int(keep.sum()) < MIN_VERTICES:
+            _restore_one(pts, keep)
+    else:
+        _rdp_keep(pts, 0, n - 1, tolerance, keep)
+    return keep
+
+
+def simplify_rdp(points: Sequence[Point], tolerance: float, closed: bool = True) -> List[Point]:
+    """Douglas-Peucker 简化，tolerance 与 points 同单位"""
+    if len(points) < 3 or tolerance <= 0:
+        return [tuple(p) for p in points]
+    pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    kept = pts[rdp_mask(pts, tolerance, closed)]
+    return [(float(x), float(y)) for x, y in kept]
+
+
+def _triangle_areas(pts: np.ndarray, prev: np.ndarray, nxt: np.ndarray) -> np.ndarray:
+    a = pts[prev]
+    c = pts[nxt]
+    return 0.5 * np.abs(
+        (a[:, 0] - pts[:, 0]) * (c[:, 1] - pts[:, 1]) - (c[:, 0] - pts[:, 0]) * (a[:, 1] - pts[:, 1])
+    )
+
+
+def visvalingam_mask(points, tolerance: float, closed: bool = True) -> np.ndarray:
+    """
+    Visvalingam-Whyatt：反复删除与相邻两点构成三角形面积最小的点，直到最小面积不小于 tolerance²
+
+    初始面积一次性向量化计算；删除后只重算两个邻点。开放折线保留两个端点。
+    """
+    pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    n = len(pts)
+    keep = np.ones(n, dtype=bool)
+    if n <= MIN_VERTICES:
+        return keep
+    prev = np.arange(-1, n - 1) % n
+    nxt = np.arange(1, n + 1) % n
+    areas = _triangle_areas(pts, prev, nxt)
+    if not closed:
+        areas[0] = areas[-1] = np.inf
+    threshold = tolerance * tolerance
+    heap = [(areas[i], i) for i in np.flatnonzero(areas < threshold).tolist()]
+    heapq.heapify(heap)
+    prev = prev.tolist()
+    nxt = nxt.tolist()
+    remaining = n
+    while heap and remaining > MIN_VERTICES:
+        area, i = heapq.heappop(heap)
+        if not keep[i] or area != areas[i]:
+            continue
+        keep[i] = False
+        remaining -= 1
+        p, q = prev[i], nxt[i]
+        nxt[p] = q
+        prev[q] = p
+        for j in (p, q):
+            if not closed and (j == 0 or j == n - 1):
+                continue
+            a, b, c = pts[prev[j]], pts[j], pts[nxt[j]]
+            # 邻点的面积不小于刚删除的点，保证删除顺序单调
+            new_area = max(area, 0.5 * abs((a[0] - b[0]) * (c[1] - b[1]) - (c[0] - b[0]) * (a[1] - b[1])))
+            areas[j] = new_area
+            if new_area < threshold:
+                heapq.heappush(heap, (new_area, j))
+    return keep
+
+
+def simplify_mask(points, tolerance: float, method: str = "rdp", closed: bool = True) -> np.ndarray:
+    if method == "rdp":
+        return rdp_mask(points, tolerance, closed)
+    if method == "visvalingam":
+        return visvalingam_mask(points, tolerance, closed)
+    raise ValueError(f"unknown simplification method: {method}")
+
+
+def _restore_one(pts: np.ndarray, keep: np.ndarray):
+    """把偏离当前多边形最远的一个被删点加回来"""
+    kept = np.flatnonzero(keep)
+    best, best_dist = -1, -1.0
+    for k in range(len(kept)):
+        a = kept[k]
+        b = kept[(k + 1) % len(kept)]
+        inner = np.arange(a + 1, b if b > a else b + len(pts)) % len(pts)
+        if len(inner) == 0:
+            continue
+        sx, sy = pts[b] - pts[a]
+        rel = pts[inner] - pts[a]
+        seg_len = np.hypot(sx, sy)
+        if seg_len == 0.0:
+            dist = np.hypot(rel[:, 0], rel[:, 1])
+        else:
+            dist = np.abs(sx * rel[:, 1] - sy * rel[:, 0]) / seg_len
+        i = int(np.argmax(dist))
+        if dist[i] > best_dist:
+            best, best_dist = int(inner[i]), float(dist[i])
+    if best >= 0:
+        keep[best] = True
+
+
+def simplify_normalized(points: Sequence[Point], tolerance_px: float, width: float, height: float,
+                        method: str = "rdp") -> List[Point]:
+    """
+    简化 YOLO 多边形（归一化坐标），容差为图片像素
+
+    结果不会恰好是 4 个顶点：txt 中 4 点的行会被读成 OBB，此时补回偏离最大的一个点。
+    """
+    n = len(points)
+    if n <= MIN_VERTICES or tolerance_px <= 0:
+        return list(points)
+    pts = np.asarray(points, dtype=np.float64).reshape(-1, 2) * (float(width), float(height))
+    keep = simplify_mask(pts, tolerance_px, method, closed=True)
+    if int(keep.sum()) == 4 and n > 4:
+        _restore_one(pts, keep)
+    if int(keep.sum()) >= n:
+        return list(points)
+    return [tuple(p) for p in np.asarray(points, dtype=np.float64).reshape(-1, 2)[keep].tolist()]
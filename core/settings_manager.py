@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
 from PyQt5.QtCore import QSettings, Qt
 from PyQt5.QtGui import QKeySequence
@@ -15,11 +16,29 @@ KEY_PERIODIC_INTERVAL_MIN = "periodic_interval_min"
 KEY_SAVE_FOLDER = "save_folder_path"
 KEY_LAST_IMAGE_DIR = "last_image_dir"
 KEY_LAST_FOLDER = "last_folder_path"
+KEY_IMAGE_CACHE_MB = "image_cache_mb"
+KEY_PREFETCH_AHEAD = "prefetch_ahead"
+KEY_PREFETCH_BEHIND = "prefetch_behind"
+KEY_TILED_THRESHOLD_MP = "tiled_threshold_mp"
+KEY_LAZY_HANDLES = "lazy_handles"
+KEY_LAYER_THRESHOLD = "layer_threshold"
+KEY_SIMPLIFY_TOLERANCE_PX = "simplify_tolerance_px"
+KEY_SIMPLIFY_ON_LOAD = "simplify_on_load"
+KEY_PROGRESSIVE_LOAD = "progressive_load"
 
 DEFAULT_AUTO_SAVE_ON_NAV = True
 DEFAULT_LANGUAGE = "zh"
 DEFAULT_PERIODIC_AUTO_SAVE = False
 DEFAULT_PERIODIC_INTERVAL_MIN = 5
+DEFAULT_IMAGE_CACHE_MB = 512
+DEFAULT_PREFETCH_AHEAD = 3
+DEFAULT_PREFETCH_BEHIND = 1
+DEFAULT_TILED_THRESHOLD_MP = 100
+DEFAULT_LAZY_HANDLES = True
+DEFAULT_LAYER_THRESHOLD = 2000
+DEFAULT_SIMPLIFY_TOLERANCE_PX = 1.0
+DEFAULT_SIMPLIFY_ON_LOAD = False
+DEFAULT_PROGRESSIVE_LOAD = True
 
 VALID_LANGUAGES = ("zh", "en", "ja")
 
@@ -28,10 +47,12 @@ class ShortcutKey(str, Enum):
     RECT = "shortcut_rect"
     OBB = "shortcut_obb"
     POLYGON = "shortcut_polygon"
+    FREEHAND = "shortcut_freehand"
     POLYGON_FINISH = "shortcut_polygon_finish"
     POLYGON_CANCEL = "shortcut_polygon_cancel"
     SAVE = "shortcut_save"
     UNDO = "shortcut_undo"
+    REDO = "shortcut_redo"
     ADD = "shortcut_add"
     DELETE = "shortcut_delete"
     PREV_IMAGE = "shortcut_prev_image"
@@ -42,10 +63,12 @@ DEFAULT_SHORTCUTS = {
     ShortcutKey.RECT: "R",
     ShortcutKey.OBB: "O",
     ShortcutKey.POLYGON: "P",
+    ShortcutKey.FREEHAND: "F",
     ShortcutKey.POLYGON_FINISH: "Return",
     ShortcutKey.POLYGON_CANCEL: "Escape",
     ShortcutKey.SAVE: "Ctrl+S",
     ShortcutKey.UNDO: "Ctrl+Z",
+    ShortcutKey.REDO: "Ctrl+Y",
     ShortcutKey.ADD: "A",
     ShortcutKey.DELETE: "Delete",
     ShortcutKey.PREV_IMAGE: "Left",
@@ -59,6 +82,15 @@ class AppSettings:
     language: str = DEFAULT_LANGUAGE
     periodic_auto_save: bool = DEFAULT_PERIODIC_AUTO_SAVE
     periodic_interval_min: int = DEFAULT_PERIODIC_INTERVAL_MIN
+    image_cache_mb: int = DEFAULT_IMAGE_CACHE_MB
+    prefetch_ahead: int = DEFAULT_PREFETCH_AHEAD
+    prefetch_behind: int = DEFAULT_PREFETCH_BEHIND
+    tiled_threshold_mp: int = DEFAULT_TILED_THRESHOLD_MP
+    lazy_handles: bool = DEFAULT_LAZY_HANDLES
+    layer_threshold: int = DEFAULT_LAYER_THRESHOLD
+    simplify_tolerance_px: float = DEFAULT_SIMPLIFY_TOLERANCE_PX
+    simplify_on_load: bool = DEFAULT_SIMPLIFY_ON_LOAD
+    progressive_load: bool = DEFAULT_PROGRESSIVE_LOAD
     shortcuts: dict = None
 
     def __post_init__(self):
@@ -70,12 +102,17 @@ def _settings() -> QSettings:
     return QSettings(ORG, APP)
 
 
+def open_settings() -> QSettings:
+    """启动时打开一次，传给各 load_* 批量读取"""
+    return _settings()
+
+
 def default_shortcuts() -> dict:
     return {k.value: v for k, v in DEFAULT_SHORTCUTS.items()}
 
 
-def load_all() -> AppSettings:
-    s = _settings()
+def load_all(s: Optional[QSettings] = None) -> AppSettings:
+    s = s or _settings()
     shortcuts = default_shortcuts()
     for key in ShortcutKey:
         val = s.value(key.value, shortcuts[key.value])
@@ -85,21 +122,48 @@ def load_all() -> AppSettings:
     if lang not in VALID_LANGUAGES:
         lang = DEFAULT_LANGUAGE
 
-    try:
-        interval = int(s.value(KEY_PERIODIC_INTERVAL_MIN, DEFAULT_PERIODIC_INTERVAL_MIN))
-    except (TypeError, ValueError):
-        interval = DEFAULT_PERIODIC_INTERVAL_MIN
-    interval = max(1, min(60, interval))
-
     return AppSettings(
         auto_save_on_nav=_read_bool(s, KEY_AUTO_SAVE_ON_NAV, DEFAULT_AUTO_SAVE_ON_NAV),
         language=lang,
         periodic_auto_save=_read_bool(s, KEY_PERIODIC_AUTO_SAVE, DEFAULT_PERIODIC_AUTO_SAVE),
-        periodic_interval_min=interval,
+        periodic_interval_min=_read_int(
+            s, KEY_PERIODIC_INTERVAL_MIN, DEFAULT_PERIODIC_INTERVAL_MIN, 1, 60
+        ),
+        image_cache_mb=_read_int(s, KEY_IMAGE_CACHE_MB, DEFAULT_IMAGE_CACHE_MB, 0, 65536),
+        prefetch_ahead=_read_int(s, KEY_PREFETCH_AHEAD, DEFAULT_PREFETCH_AHEAD, 0, 16),
+        prefetch_behind=_read_int(s, KEY_PREFETCH_BEHIND, DEFAULT_PREFETCH_BEHIND, 0, 16),
+        tiled_threshold_mp=_read_int(
+            s, KEY_TILED_THRESHOLD_MP, DEFAULT_TILED_THRESHOLD_MP, 0, 100000
+        ),
+        lazy_handles=_read_bool(s, KEY_LAZY_HANDLES, DEFAULT_LAZY_HANDLES),
+        layer_threshold=_read_int(
+            s, KEY_LAYER_THRESHOLD, DEFAULT_LAYER_THRESHOLD, 0, 1000000
+        ),
+        simplify_tolerance_px=_read_float(
+            s, KEY_SIMPLIFY_TOLERANCE_PX, DEFAULT_SIMPLIFY_TOLERANCE_PX, 0.1, 50.0
+        ),
+        simplify_on_load=_read_bool(s, KEY_SIMPLIFY_ON_LOAD, DEFAULT_SIMPLIFY_ON_LOAD),
+        progressive_load=_read_bool(s, KEY_PROGRESSIVE_LOAD, DEFAULT_PROGRESSIVE_LOAD),
         shortcuts=shortcuts,
     )
 
 
+def _read_int(settings: QSettings, key: str, default: int, lo: int, hi: int) -> int:
+    try:
+        value = int(settings.value(key, default))
+    except (TypeError, ValueError):
+        value = default
+    return max(lo, min(hi, value))
+
+
+def _read_float(settings: QSettings, key: str, default: float, lo: float, hi: float) -> float:
+    try:
+        value = float(settings.value(key, default))
+    except (TypeError, ValueError):
+        value = default
+    return max(lo, min(hi, value))
+
+
 def _read_bool(settings: QSettings, key: str, default: bool) -> bool:
     v = settings.value(key, default, type=bool)
     if isinstance(v, bool):
@@ -115,8 +179,10 @@ def _to_bool(value, default: bool) -> bool:
     return str(value).lower() in ("true", "1", "yes")
 
 
-def load_language() -> str:
-    return load_all().language
+def load_language(s: Optional[QSettings] = None) -> str:
+    s = s or _settings()
+    lang = str(s.value(KEY_LANGUAGE, DEFAULT_LANGUAGE))
+    return lang if lang in VALID_LANGUAGES else DEFAULT_LANGUAGE
 
 
 def _valid_dir(path_str) -> Optional[str]:
@@ -132,8 +198,8 @@ def _valid_dir(path_str) -> Optional[str]:
     return None
 
 
-def load_path_prefs() -> dict:
-    s = _settings()
+def load_path_prefs(s: Optional[QSettings] = None) -> dict:
+    s = s or _settings()
     return {
         "save_folder": _valid_dir(s.value(KEY_SAVE_FOLDER)),
         "last_image_dir": _valid_dir(s.value(KEY_LAST_IMAGE_DIR)),
@@ -153,6 +219,15 @@ def save_settings(settings: AppSettings):
     s.setValue(KEY_LANGUAGE, settings.language)
     s.setValue(KEY_PERIODIC_AUTO_SAVE, bool(settings.periodic_auto_save))
     s.setValue(KEY_PERIODIC_INTERVAL_MIN, int(settings.periodic_interval_min))
+    s.setValue(KEY_IMAGE_CACHE_MB, int(settings.image_cache_mb))
+    s.setValue(KEY_PREFETCH_AHEAD, int(settings.prefetch_ahead))
+    s.setValue(KEY_PREFETCH_BEHIND, int(settings.prefetch_behind))
+    s.setValue(KEY_TILED_THRESHOLD_MP, int(settings.tiled_threshold_mp))
+    s.setValue(KEY_LAZY_HANDLES, bool(settings.lazy_handles))
+    s.setValue(KEY_LAYER_THRESHOLD, int(settings.layer_threshold))
+    s.setValue(KEY_SIMPLIFY_TOLERANCE_PX, float(settings.simplify_tolerance_px))
+    s.setValue(KEY_SIMPLIFY_ON_LOAD, bool(settings.simplify_on_load))
+    s.setValue(KEY_PROGRESSIVE_LOAD, bool(settings.progressive_load))
     for key in ShortcutKey:
         s.setValue(key.value, settings.shortcuts.get(key.value, DEFAULT_SHORTCUTS[key]))
     s.sync()
@@ -168,31 +243,69 @@ def get_shortcut(settings: AppSettings, key: ShortcutKey) -> str:
     return settings.shortcuts.get(key.value, DEFAULT_SHORTCUTS[key])
 
 
-def _normalize_shortcut_for_conflict(shortcut_str: str) -> str:
-    s = shortcut_str.strip().lower()
-    if s in ("return", "enter"):
-        return "return"
-    return s
+KeyCombo = Tuple[int, int]  # (Qt.Key, Qt.KeyboardModifiers)
+
+_ENTER_KEYS = (Qt.Key_Return, Qt.Key_Enter)
+
+
+@lru_cache(maxsize=256)
+def shortcut_combos(shortcut_str: str) -> Tuple[KeyCombo, ...]:
+    """
+    快捷键字符串对应的按键组合 (key, modifiers)
+
+    只支持单个按键组合（多段序列在 keyPressEvent 中无法匹配，返回空）。
+    不带修饰键的 Return / Enter 互为别名，且都接受小键盘上的回车。
+    """
+    if not shortcut_str or not str(shortcut_str).strip():
+        return ()
+    seq = QKeySequence(str(shortcut_str).strip())
+    if seq.count() != 1:
+        return ()
+    combo = int(seq[0])
+    key = combo & ~int(Qt.KeyboardModifierMask)
+    modifiers = combo & int(Qt.KeyboardModifierMask)
+    if key in _ENTER_KEYS and modifiers == 0:
+        keypad = int(Qt.KeypadModifier)
+        return tuple((k, m) for k in _ENTER_KEYS for m in (0, keypad))
+    return ((key, modifiers),)
+
+
+def event_combo(event) -> KeyCombo:
+    return event.key(), int(event.modifiers())
 
 
 def key_event_matches(event, shortcut_str: str) -> bool:
     """Match a QKeyEvent against a shortcut string (PyQt5-safe)."""
-    if not shortcut_str or not str(shortcut_str).strip():
-        return False
-    expected = QKeySequence(str(shortcut_str).strip())
-    pressed = QKeySequence(int(event.modifiers()) | event.key())
-    if expected.matches(pressed) == QKeySequence.ExactMatch:
-        return True
-    if event.key() in (Qt.Key_Return, Qt.Key_Enter) and expected.count() == 1:
-        for alt in ("Return", "Enter"):
-            if QKeySequence(alt).matches(expected) == QKeySequence.ExactMatch:
-                return (event.modifiers() & ~Qt.KeypadModifier) == Qt.NoModifier
-    return False
+    return event_combo(event) in shortcut_combos(shortcut_str)
+
+
+def compile_shortcuts(shortcuts: dict) -> Dict[KeyCombo, ShortcutKey]:
+    """
+    (key, modifiers) -> ShortcutKey 的查找表，设置变化时重新生成
+
+    冲突的组合保留按 ShortcutKey 顺序在前的一个（设置对话框不允许保存冲突）。
+    """
+    table = {}
+    for key in ShortcutKey:
+        for combo in shortcut_combos(shortcuts.get(key.value, DEFAULT_SHORTCUTS[key])):
+            table.setdefault(combo, key)
+    return table
+
+
+def _conflict_keys(shortcut_str: str) -> set:
+    """用于冲突检测的键：单个组合用 shortcut_combos()，多段序列用规范化后的字符串"""
+    combos = set(shortcut_combos(shortcut_str))
+    if combos or not shortcut_str or not str(shortcut_str).strip():
+        return combos
+    text = str(shortcut_str).strip()
+    return {QKeySequence(text).toString(QKeySequence.PortableText) or text}
 
 
 def shortcuts_conflict(shortcuts: dict) -> bool:
-    values = [shortcuts.get(k.value, DEFAULT_SHORTCUTS[k]) for k in ShortcutKey]
-    normalized = [
-        _normalize_shortcut_for_conflict(v) for v in values if v and str(v).strip()
-    ]
-    return len(normalized) != len(set(normalized))
+    seen = set()
+    for key in ShortcutKey:
+        combos = _conflict_keys(shortcuts.get(key.value, DEFAULT_SHORTCUTS[key]))
+        if combos & seen:
+            return True
+        seen |= combos
+    return False
@@ -0,0 +1,105 @@
+from typing import Dict, Iterable, List, Set, Tuple
+
+from core.bbox import BBox
+
+# 每个方向的网格数；标注坐标为归一化值，网格覆盖 [0, 1] x [0, 1]
+DEFAULT_GRID_CELLS = 64
+
+Bounds = Tuple[float, float, float, float]
+
+
+def bbox_bounds(bbox: BBox) -> Bounds:
+    """标注的归一化外接矩形 (x0, y0, x1, y1)"""
+    if bbox.type == 'rect':
+        hw = bbox.width / 2
+        hh = bbox.height / 2
+        return (bbox.x_center - hw, bbox.y_center - hh, bbox.x_center + hw, bbox.y_center + hh)
+    points = bbox.points or ()
+    if not points:
+        return (0.0, 0.0, 0.0, 0.0)
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+class GridIndex:
+    """
+    归一化坐标上的均匀网格索引
+
+    每个 key 登记在其外接矩形覆盖的所有网格中；query() 先取相交网格中的 key，
+    再用外接矩形精确过滤。超出 [0, 1] 的部分归入边缘网格。
+    """
+
+    def __init__(self, cells: int = DEFAULT_GRID_CELLS):
+        self._n = cells
+        self._cells: Dict[int, Set[int]] = {}
+        self._bounds: Dict[int, Bounds] = {}
+
+    def __len__(self):
+        return len(self._bounds)
+
+    def __contains__(self, key):
+        return key in self._bounds
+
+    def clear(self):
+        self._cells.clear()
+        self._bounds.clear()
+
+    def _span(self, lo: float, hi: float) -> range:
+        n = self._n
+        a = min(n - 1, max(0, int(lo * n)))
+        b = min(n - 1, max(0, int(hi * n)))
+        return range(a, b + 1)
+
+    def _cell_keys(self, bounds: Bounds) -> Iterable[int]:
+        x0, y0, x1, y1 = bounds
+        xs = self._span(x0, x1)
+        for cy in self._span(y0, y1):
+            row = cy * self._n
+            for cx in xs:
+                yield row + cx
+
+    def insert(self, key: int, bounds: Bounds):
+        """登记或更新 key 的外接矩形"""
+        if key in self._bounds:
+            self.remove(key)
+        self._bounds[key] = bounds
+        cells = self._cells
+        for cell in self._cell_keys(bounds):
+            bucket = cells.get(cell)
+            if bucket is None:
+                cells[cell] = {key}
+            else:
+                bucket.add(key)
+
+    def bounds(self, key: int):
+        return self._bounds.get(key)
+
+    def remove(self, key: int):
+        bounds = self._bounds.pop(key, None)
+        if bounds is None:
+            return
+        for cell in self._cell_keys(bounds):
+            bucket = self._cells.get(cell)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._cells[cell]
+
+    def query(self, x0: float, y0: float, x1: float, y1: float) -> Set[int]:
+        """外接矩形与给定矩形相交的 key"""
+        found = set()
+        cells = self._cells
+        for cell in self._cell_keys((x0, y0, x1, y1)):
+            bucket = cells.get(cell)
+            if bucket:
+                found |= bucket
+        bounds = self._bounds
+        return {
+            k for k in found
+            if not (bounds[k][2] < x0 or bounds[k][0] > x1 or bounds[k][3] < y0 or bounds[k][1] > y1)
+        }
+
+    def query_point(self, x: float, y: float) -> List[int]:
+        """外接矩形包含该点的 key"""
+        return list(self.query(x, y, x, y))
@@ -0,0 +1,159 @@
+"""
+热点路径的计时区间（span），可导出为 Chrome trace-event JSON（chrome://tracing / Perfetto）
+
+    with span("load.decode", path=name):
+        ...
+
+    @traced("save_txt")
+    def save_txt(...): ...
+
+关闭时 span() 返回共用的空上下文、traced 只多一次布尔判断，几乎没有开销。
+开启后事件写入固定容量的环形缓冲区（deque），只保留最近 capacity 个。
+环境变量 YOLO_TRACE=1 在启动时开启；YOLO_TRACE_OUT=path 时退出前自动导出。
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Optional
+
+ENV_ENABLE = "YOLO_TRACE"
+ENV_OUTPUT = "YOLO_TRACE_OUT"
+DEFAULT_CAPACITY = 100000
+
+_enabled = False
+_events = deque(maxlen=DEFAULT_CAPACITY)  # (name, 开始 ns, 时长 ns, 线程 id, args)
+_thread_names = {}
+_NULL = nullcontext()
+_clock = time.perf_counter_ns
+_origin = _clock()
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def set_enabled(enabled: bool):
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def set_capacity(capacity: int):
+    global _events
+    _events = deque(_events, maxlen=max(1, capacity))
+
+
+def clear():
+    _events.clear()
+
+
+def event_count() -> int:
+    return len(_events)
+
+
+def _record(name, start, end, args):
+    tid = threading.get_ident()
+    if tid not in _thread_names:
+        _thread_names[tid] = threading.current_thread().name
+    _events.append((name, start, end - start, tid, args))
+
+
+class _Span:
+    __slots__ = ("name", "args", "start")
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = _clock()
+        return self
+
+    def __exit__(self, *exc):
+        _record(self.name, self.start, _clock(), self.args)
+        return False
+
+
+def span(name: str, **args):
+    """计时区间；args 会出现在 trace 的事件详情中"""
+    if not _enabled:
+        return _NULL
+    return _Span(name, args or None)
+
+
+def now() -> int:
+    return _clock()
+
+
+def add_span(name: str, start: int, end: Optional[int] = None, **args):
+    """记录跨越多个调用（如异步加载）的区间，start/end 取自 now()"""
+    if not _enabled:
+        return
+    _record(name, start, _clock() if end is None else end, args or None)
+
+
+def traced(name: Optional[str] = None):
+    """
+    把整个函数记为一个 span（默认名为函数的 __qualname__）
+
+    包装函数接受任意参数，PyQt 会把信号参数（如 QAction.triggered 的 checked）一并传入；
+    直接连接到信号的槽不要用它，改在函数体内用 span()。
+    """
+
+    def decorator(fn):
+        label = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            with _Span(label, None):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def chrome_trace() -> dict:
+    """当前缓冲区内容，Chrome trace-event 格式（时间单位为微秒）"""
+    pid = os.getpid()
+    events = [
+        {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+        for tid, name in list(_thread_names.items())
+    ]
+    for name, start, duration, tid, args in list(_events):
+        event = {
+            "name": name,
+            "cat": name.split(".", 1)[0],
+            "ph": "X",
+            "ts": (start - _origin) / 1000.0,
+            "dur": duration / 1000.0,
+            "pid": pid,
+            "tid": tid,
+        }
+        if args:
+            event["args"] = {k: v if isinstance(v, (int, float, bool)) else str(v)
+                             for k, v in args.items()}
+        events.append(event)
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def export_chrome_trace(path) -> int:
+    """写出 trace JSON，返回事件数"""
+    data = chrome_trace()
+    Path(path).write_text(json.dumps(data), encoding="utf-8")
+    return sum(1 for e in data["traceEvents"] if e["ph"] == "X")
+
+
+def configure_from_env():
+    """按环境变量开启；返回 YOLO_TRACE_OUT 指定的导出路径（未设置为 None）"""
+    value = os.environ.get(ENV_ENABLE, "").strip().lower()
+    output = os.environ.get(ENV_OUTPUT) or None
+    if value not in ("", "0", "false", "no", "off") or output:
+        set_enabled(True)
+    return output
@@ -1,29 +1,127 @@
-import copy
 from typing import List, Optional
 
 from core.bbox import BBox
+from core.bbox_clone import clone_bbox
 
-MAX_UNDO = 50
+# 撤回历史的内存上限（按 Change 中保存的标注估算）
+MAX_UNDO_BYTES = 32 * 1024 * 1024
+
+# 估算用：一个 BBox 对象本身 / 每个顶点（tuple + 两个 float + list 槽位）
+_BBOX_BYTES = 200
+_POINT_BYTES = 112
+
+
+def _bbox_cost(bbox: Optional[BBox]) -> int:
+    if bbox is None:
+        return 0
+    return _BBOX_BYTES + _POINT_BYTES * len(bbox.points or ())
+
+
+class Change:
+    """
+    单个标注的变化：before/after 为 None 分别表示新增/删除
+
+    row 为该标注在列表中的位置（删除/撤回新增时用于还原顺序）。
+    """
+
+    __slots__ = ("bbox_id", "row", "before", "after")
+
+    def __init__(self, bbox_id: int, row: int, before: Optional[BBox], after: Optional[BBox]):
+        self.bbox_id = bbox_id
+        self.row = row
+        self.before = before
+        self.after = after
+
+    def cost(self) -> int:
+        return 64 + _bbox_cost(self.before) + _bbox_cost(self.after)
+
+
+class Command:
+    __slots__ = ("changes", "cost")
+
+    def __init__(self, changes: List[Change]):
+        self.changes = changes
+        self.cost = sum(c.cost() for c in changes)
 
 
 class UndoStack:
-    def __init__(self, max_size: int = MAX_UNDO):
-        self._stack: List[List[BBox]] = []
-        self._max_size = max_size
+    """
+    增量撤回/重做历史
+
+    每条记录只保存发生变化的标注（新增/删除/修改/类别变化）。拖拽编辑在按下时
+    begin_modify() 记下原状态，结束状态在下一次 push/undo/redo 时才读取，
+    因此没有实际移动的点击不会产生记录。总大小超过 max_bytes 时丢弃最早的记录。
+    """
+
+    def __init__(self, max_bytes: int = MAX_UNDO_BYTES):
+        self._undo: List[Command] = []
+        self._redo: List[Command] = []
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._pending = None  # (bbox, row, before)
 
     def clear(self):
-        self._stack.clear()
+        self._undo.clear()
+        self._redo.clear()
+        self._bytes = 0
+        self._pending = None
+
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    def begin_modify(self, bbox: BBox, row: int):
+        """bbox 即将被原地修改（拖拽/缩放/旋转）"""
+        self._commit_pending()
+        self._pending = (bbox, row, clone_bbox(bbox))
+
+    def push(self, changes: List[Change]):
+        self._commit_pending()
+        self._push(changes)
 
-    def push_snapshot(self, bboxes: List[BBox]):
-        snapshot = copy.deepcopy(bboxes)
-        self._stack.append(snapshot)
-        if len(self._stack) > self._max_size:
-            self._stack.pop(0)
+    def _push(self, changes: List[Change]):
+        if not changes:
+            return
+        command = Command(changes)
+        self._undo.append(command)
+        self._bytes += command.cost
+        for old in self._redo:
+            self._bytes -= old.cost
+        self._redo.clear()
+        while self._bytes > self._max_bytes and len(self._undo) > 1:
+            self._bytes -= self._undo.pop(0).cost
 
-    def undo(self) -> Optional[List[BBox]]:
-        if not self._stack:
+    def commit_pending(self):
+        """立即结束 begin_modify() 的记录；原地修改标注前调用，避免新修改混入拖拽记录"""
+        self._commit_pending()
+
+    def _commit_pending(self):
+        if self._pending is None:
+            return
+        bbox, row, before = self._pending
+        self._pending = None
+        if bbox != before:
+            self._push([Change(bbox.id, row, before, clone_bbox(bbox))])
+
+    def undo(self) -> Optional[Command]:
+        """返回需要反向应用的记录（按 changes 倒序把每个标注恢复为 before）"""
+        self._commit_pending()
+        if not self._undo:
             return None
-        return self._stack.pop()
+        command = self._undo.pop()
+        self._redo.append(command)
+        return command
+
+    def redo(self) -> Optional[Command]:
+        """返回需要正向应用的记录（按 changes 顺序把每个标注设为 after）"""
+        self._commit_pending()
+        if not self._redo:
+            return None
+        command = self._redo.pop()
+        self._undo.append(command)
+        return command
 
     def can_undo(self) -> bool:
-        return bool(self._stack)
+        return bool(self._undo) or self._pending is not None
+
+    def can_redo(self) -> bool:
+        return bool(self._redo)
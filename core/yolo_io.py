@@ -1,80 +1,369 @@
+import os
+import uuid
+import warnings
 from pathlib import Path
+from typing import Iterable, List, Optional
+
+import numpy as np
+
 from core.bbox import BBox
 
+TYPE_RECT = 0
+TYPE_OBB = 1
+TYPE_POLYGON = 2
+TYPE_NAMES = ('rect', 'obb', 'polygon')
+
 
 def _is_polygon_row(num_parts: int) -> bool:
     return num_parts >= 7 and (num_parts - 1) % 2 == 0 and num_parts != 9
 
 
-def load_yolo_txt(txt_path: Path):
-    bboxes = []
+def _classify_counts(counts: np.ndarray) -> np.ndarray:
+    """Map per-line token counts to TYPE_* codes, -1 for rows that are skipped."""
+    kinds = np.full(counts.shape, -1, dtype=np.int8)
+    kinds[counts == 5] = TYPE_RECT
+    kinds[counts == 9] = TYPE_OBB
+    kinds[(counts >= 7) & ((counts - 1) % 2 == 0) & (counts != 9)] = TYPE_POLYGON
+    return kinds
 
-    if not txt_path.exists():
-        return bboxes
 
-    with open(txt_path, "r", encoding="utf-8") as f:
-        for idx, line in enumerate(f):
-            parts = line.strip().split()
-            if not parts:
-                continue
-            if len(parts) == 5:
-                class_id, x, y, w, h = parts
+class LabelColumns:
+    """
+    列式存储的 YOLO 标注（可来自一个或多个 txt 文件）
+
+    每行标注拆成平行数组：
+    - ids / class_ids / types: 每行一个值（ids 为该行在原文件中的行号）
+    - coords: 所有行的坐标首尾相接（rect 为 x y w h，obb/polygon 为 x1 y1 x2 y2 ...）
+    - offsets: 第 i 行坐标为 coords[offsets[i]:offsets[i + 1]]
+    - file_offsets: 第 f 个文件的行为 [file_offsets[f], file_offsets[f + 1])
+
+    需要 BBox 对象时再通过 bbox() / to_bboxes() 按需构造。
+    """
+
+    __slots__ = ("ids", "class_ids", "types", "coords", "offsets", "file_offsets")
+
+    def __init__(self, ids, class_ids, types, coords, offsets, file_offsets=None):
+        self.ids = ids
+        self.class_ids = class_ids
+        self.types = types
+        self.coords = coords
+        self.offsets = offsets
+        if file_offsets is None:
+            file_offsets = np.array([0, len(ids)], dtype=np.int64)
+        self.file_offsets = file_offsets
+
+    @classmethod
+    def empty(cls) -> "LabelColumns":
+        return cls(
+            np.empty(0, dtype=np.int64),
+            np.empty(0, dtype=np.int64),
+            np.empty(0, dtype=np.int8),
+            np.empty(0, dtype=np.float64),
+            np.zeros(1, dtype=np.int64),
+        )
+
+    @classmethod
+    def concatenate(cls, parts: List["LabelColumns"]) -> "LabelColumns":
+        """Join per-file columns; each part becomes one file in file_offsets."""
+        if not parts:
+            return cls.empty()
+        row_counts = [len(p) for p in parts]
+        coord_counts = [int(p.offsets[-1]) for p in parts]
+        offsets = [parts[0].offsets]
+        base = coord_counts[0]
+        for p, n in zip(parts[1:], coord_counts[1:]):
+            offsets.append(p.offsets[1:] + base)
+            base += n
+        file_offsets = np.zeros(len(parts) + 1, dtype=np.int64)
+        file_offsets[1:] = np.cumsum(row_counts)
+        return cls(
+            np.concatenate([p.ids for p in parts]),
+            np.concatenate([p.class_ids for p in parts]),
+            np.concatenate([p.types for p in parts]),
+            np.concatenate([p.coords for p in parts]),
+            np.concatenate(offsets),
+            file_offsets,
+        )
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def num_files(self) -> int:
+        return len(self.file_offsets) - 1
+
+    def row_coords(self, row: int) -> np.ndarray:
+        return self.coords[self.offsets[row]:self.offsets[row + 1]]
+
+    def vertex_counts(self) -> np.ndarray:
+        """Number of coordinate pairs per row (rect rows report 2)."""
+        return np.diff(self.offsets) // 2
+
+    def file_rows(self, file_index: int):
+        return int(self.file_offsets[file_index]), int(self.file_offsets[file_index + 1])
+
+    def file_columns(self, file_index: int) -> "LabelColumns":
+        start, stop = self.file_rows(file_index)
+        c0, c1 = self.offsets[start], self.offsets[stop]
+        return LabelColumns(
+            self.ids[start:stop],
+            self.class_ids[start:stop],
+            self.types[start:stop],
+            self.coords[c0:c1],
+            self.offsets[start:stop + 1] - c0,
+        )
+
+    def bbox(self, row: int) -> BBox:
+        return self.to_bboxes(row, row + 1)[0]
+
+    def to_bboxes(self, start: int = 0, stop: Optional[int] = None) -> List[BBox]:
+        if stop is None:
+            stop = len(self)
+        ids = self.ids[start:stop].tolist()
+        class_ids = self.class_ids[start:stop].tolist()
+        types = self.types[start:stop].tolist()
+        offsets = self.offsets[start:stop + 1].tolist()
+        if not ids:
+            return []
+        coords = self.coords[offsets[0]:offsets[-1]].tolist()
+        base = offsets[0]
+
+        bboxes = []
+        for i, bbox_id in enumerate(ids):
+            c = coords[offsets[i] - base:offsets[i + 1] - base]
+            kind = types[i]
+            if kind == TYPE_RECT:
                 bboxes.append(
                     BBox(
-                        id=idx,
-                        class_id=int(class_id),
+                        id=bbox_id,
+                        class_id=class_ids[i],
                         type='rect',
-                        x_center=float(x),
-                        y_center=float(y),
-                        width=float(w),
-                        height=float(h),
-                    )
-                )
-            elif len(parts) == 9:
-                class_id = int(parts[0])
-                points = [(float(parts[i]), float(parts[i + 1])) for i in range(1, 9, 2)]
-                bboxes.append(
-                    BBox(
-                        id=idx,
-                        class_id=class_id,
-                        type='obb',
-                        points=points,
+                        x_center=c[0],
+                        y_center=c[1],
+                        width=c[2],
+                        height=c[3],
                     )
                 )
-            elif _is_polygon_row(len(parts)):
-                class_id = int(parts[0])
-                points = [(float(parts[i]), float(parts[i + 1])) for i in range(1, len(parts), 2)]
+            else:
                 bboxes.append(
                     BBox(
-                        id=idx,
-                        class_id=class_id,
-                        type='polygon',
-                        points=points,
+                        id=bbox_id,
+                        class_id=class_ids[i],
+                        type=TYPE_NAMES[kind],
+                        points=list(zip(c[0::2], c[1::2])),
                     )
                 )
+        return bboxes
+
+
+def _columns_from_rows(line_ids, rows) -> LabelColumns:
+    """Build columns from already split and filtered rows (fallback path)."""
+    if not rows:
+        return LabelColumns.empty()
+    counts = np.fromiter((len(r) for r in rows), dtype=np.int64, count=len(rows))
+    class_ids = np.array([int(r[0]) for r in rows], dtype=np.int64)
+    coords = np.array([float(v) for r in rows for v in r[1:]], dtype=np.float64)
+    offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(counts - 1)
+    return LabelColumns(
+        np.asarray(line_ids, dtype=np.int64),
+        class_ids,
+        _classify_counts(counts),
+        coords,
+        offsets,
+    )
+
+
+def _parse_text_rows(text: str) -> LabelColumns:
+    """逐行解析（仅在快速路径遇到非数字内容时使用，语义与旧实现一致）"""
+    line_ids = []
+    rows = []
+    for idx, line in enumerate(text.splitlines()):
+        parts = line.split()
+        n = len(parts)
+        if n == 5 or n == 9 or _is_polygon_row(n):
+            line_ids.append(idx)
+            rows.append(parts)
+    return _columns_from_rows(line_ids, rows)
+
+
+def _parse_buffer(raw: bytes):
+    """
+    向量化解析整段 txt 内容
+
+    返回的 ids 为全局行号；若内容含非数字字段返回 None，由调用方回退到逐行解析。
+    """
+    if not raw.endswith(b"\n"):
+        raw += b"\n"
+    data = np.frombuffer(raw, dtype=np.uint8)
+    # 控制字符一并视为分隔符；若其并非空白，下面 fromstring 的字段数校验会失败并回退
+    space = data <= 32
+    prev_space = np.empty_like(space)
+    prev_space[0] = True
+    prev_space[1:] = space[:-1]
+    tok_pos = np.flatnonzero(~space & prev_space)
+
+    newlines = np.flatnonzero(data == 10)
+    tok_end = np.searchsorted(tok_pos, newlines)
+    counts = np.diff(tok_end, prepend=0)
+    line_start_tok = tok_end - counts
+
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            values = np.fromstring(raw, dtype=np.float64, sep=" ")
+    except ValueError:
+        return None
+    if values.size != tok_pos.size:
+        return None
+
+    kinds = _classify_counts(counts)
+    kept_lines = np.flatnonzero(kinds >= 0)
+
+    # 与 int() 保持一致：类别字段只能由数字和正负号组成；"1.0"、"nan" 等交给逐行解析报错
+    class_tok = line_start_tok[kept_lines]
+    if class_tok.size:
+        tok_last = np.flatnonzero(~space & np.append(space[1:], True))
+        not_int = ~(((data >= 48) & (data <= 57)) | (data == 43) | (data == 45))
+        bad_before = np.zeros(data.size + 1, dtype=np.int64)
+        np.cumsum(not_int, out=bad_before[1:])
+        if np.any(bad_before[tok_last[class_tok] + 1] > bad_before[tok_pos[class_tok]]):
+            return None
+    class_ids = values[class_tok].astype(np.int64)
+
+    tok_is_first = np.zeros(tok_pos.size, dtype=bool)
+    tok_is_first[line_start_tok[counts > 0]] = True
+    tok_kept = np.repeat(kinds >= 0, counts)
+    coords = values[tok_kept & ~tok_is_first]
+
+    offsets = np.zeros(len(kept_lines) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(counts[kept_lines] - 1)
+
+    return LabelColumns(
+        kept_lines.astype(np.int64),
+        class_ids,
+        kinds[kept_lines],
+        coords,
+        offsets,
+    )
+
+
+def parse_yolo_bytes(raw: bytes) -> LabelColumns:
+    if not raw.strip():
+        return LabelColumns.empty()
+    columns = _parse_buffer(raw)
+    if columns is None:
+        return _parse_text_rows(raw.decode("utf-8"))
+    return columns
+
+
+def load_yolo_columns(txt_path: Path) -> LabelColumns:
+    """读取单个 txt 为列式数组；文件不存在时返回空结果"""
+    try:
+        raw = Path(txt_path).read_bytes()
+    except FileNotFoundError:
+        return LabelColumns.empty()
+    return parse_yolo_bytes(raw)
+
+
+def load_yolo_columns_many(txt_paths: Iterable[Path]) -> LabelColumns:
+    """
+    批量读取多个 txt，拼接后一次性向量化解析
+
+    结果中第 f 个文件的行为 file_rows(f)；不存在的文件对应空区间。
+    """
+    chunks = []
+    for path in txt_paths:
+        try:
+            raw = Path(path).read_bytes()
+        except FileNotFoundError:
+            raw = b""
+        if raw and not raw.endswith(b"\n"):
+            raw += b"\n"
+        chunks.append(raw)
+    if not chunks:
+        return LabelColumns.empty()
+
+    columns = _parse_buffer(b"".join(chunks)) if any(chunks) else None
+    if columns is None:
+        return LabelColumns.concatenate([parse_yolo_bytes(raw) for raw in chunks])
+
+    line_counts = np.array([raw.count(b"\n") for raw in chunks], dtype=np.int64)
+    line_starts = np.zeros(len(chunks) + 1, dtype=np.int64)
+    line_starts[1:] = np.cumsum(line_counts)
+
+    # 行号 -> 文件序号，并把全局行号换算回文件内行号
+    file_of_row = np.searchsorted(line_starts, columns.ids, side="right") - 1
+    columns.ids = columns.ids - line_starts[file_of_row]
+    file_offsets = np.zeros(len(chunks) + 1, dtype=np.int64)
+    file_offsets[1:] = np.cumsum(np.bincount(file_of_row, minlength=len(chunks)))
+    columns.file_offsets = file_offsets
+    return columns
+
+
+def load_yolo_txt(txt_path: Path):
+    if not txt_path.exists():
+        return []
+    return load_yolo_columns(txt_path).to_bboxes()
+
+
+def _clamp01(v: float) -> float:
+    return max(0.0, min(1.0, v))
+
+
+def format_yolo_txt(bboxes) -> str:
+    lines = []
+    for bbox in bboxes:
+        if bbox.type == 'rect':
+            x = _clamp01(bbox.x_center)
+            y = _clamp01(bbox.y_center)
+            w = _clamp01(bbox.width)
+            h = _clamp01(bbox.height)
+            lines.append(f"{bbox.class_id} {x:.6f} {y:.6f} {w:.6f} {h:.6f}\n")
+        elif bbox.type in ('obb', 'polygon'):
+            pts = " ".join(
+                f"{_clamp01(px):.6f} {_clamp01(py):.6f}" for px, py in bbox.points
+            )
+            lines.append(f"{bbox.class_id} {pts}\n")
+    return "".join(lines)
+
+
+def write_bytes_atomic(path: Path, data: bytes):
+    """写入同目录临时文件后 rename，避免中途失败留下半截文件"""
+    path = Path(path)
+    tmp_name = path.with_name(f".{path.name}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp")
+    # 0o666 经 umask 后与直接 open(path, "w") 创建的文件权限一致
+    fd = os.open(tmp_name, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def _same_content(path: Path, data: bytes) -> bool:
+    try:
+        if path.stat().st_size != len(data):
+            return False
+        return path.read_bytes() == data
+    except OSError:
+        return False
+
+
+def save_yolo_txt(txt_path: Path, bboxes, skip_unchanged: bool = True) -> bool:
+    """
+    保存 YOLO txt（临时文件 + rename）
 
-    return bboxes
-
-
-def save_yolo_txt(txt_path: Path, bboxes):
-    with open(txt_path, "w", encoding='utf-8') as f:
-        for bbox in bboxes:
-            if bbox.type == 'rect':
-                x = max(0.0, min(1.0, bbox.x_center))
-                y = max(0.0, min(1.0, bbox.y_center))
-                w = max(0.0, min(1.0, bbox.width))
-                h = max(0.0, min(1.0, bbox.height))
-                line = f"{bbox.class_id} {x:.6f} {y:.6f} {w:.6f} {h:.6f}\n"
-                f.write(line)
-            elif bbox.type == 'obb':
-                pts = []
-                for px, py in bbox.points:
-                    pts.append(f"{max(0.0, min(1.0, px)):.6f} {max(0.0, min(1.0, py)):.6f}")
-                line = f"{bbox.class_id} {' '.join(pts)}\n"
-                f.write(line)
-            elif bbox.type == 'polygon':
-                pts = []
-                for px, py in bbox.points:
-                    pts.append(f"{max(0.0, min(1.0, px)):.6f} {max(0.0, min(1.0, py)):.6f}")
-                line = f"{bbox.class_id} {' '.join(pts)}\n"
-                f.write(line)
+    skip_unchanged 时若磁盘内容与序列化结果一致则不写盘。返回是否实际写入。
+    """
+    txt_path = Path(txt_path)
+    data = format_yolo_txt(bboxes).encode("utf-8")
+    if skip_unchanged and _same_content(txt_path, data):
+        return False
+    write_bytes_atomic(txt_path, data)
+    return True
@@ -3,9 +3,13 @@ STRINGS = {
     "menu.file": "File",
     "menu.open_image": "Open Image",
     "menu.open_folder": "Open Folder",
+    "menu.dataset_stats": "Dataset Statistics…",
     "menu.theme": "Theme",
     "menu.settings": "Settings",
     "menu.preferences": "Preferences…",
+    "menu.debug": "Debug",
+    "menu.trace_enabled": "Record performance trace",
+    "menu.trace_export": "Export performance trace…",
     "theme.light_blue": "Light Blue",
     "theme.light_pink": "Light Pink",
     "theme.deep_blue": "Deep Blue",
@@ -21,8 +25,10 @@ STRINGS = {
     "mode.rect": "Rectangle (Rect)",
     "mode.obb": "OBB",
     "mode.polygon": "Polygon (Seg)",
+    "mode.freehand": "Freehand polygon (Seg)",
     "btn.add": "Add",
     "btn.delete": "Delete",
+    "btn.simplify_polygon": "Simplify polygon",
     "label.class_id": "Class ID:",
     "btn.save_yolo": "Save YOLO txt",
     "dialog.select_save_path": "Select Save Path",
@@ -40,9 +46,18 @@ STRINGS = {
     "msg.open_folder_first": "Please open a folder first",
     "msg.open_image_first": "Please open an image first",
     "msg.save_txt_failed": "Failed to save txt file: {error}",
+    "msg.dataset_stats": "Dataset Statistics",
+    "msg.index_failed": "Failed to read label index: {error}",
+    "stats.summary": "Label files: {files}\nLabeled: {labeled}\nEmpty: {empty}\nTotal boxes: {boxes}",
+    "stats.types": "Rect {rect} / OBB {obb} / Polygon {polygon}",
+    "stats.class_row": "Class {class_id}: {count}",
+    "view.loading": "Loading… {name}",
     "toast.save_success": "✓ Saved",
+    "toast.stats_running": "Collecting statistics…",
     "toast.auto_save_skipped": "Not saved: set save path first",
     "toast.periodic_save_done": "✓ Auto-saved all",
+    "toast.simplified": "✓ Polygon vertices {before} → {after}",
+    "toast.trace_exported": "✓ Exported {count} trace events",
     "list.modified": "● {name}",
     "list.labeled": "✓ {name}",
     "list.unlabeled": "○ {name}",
@@ -52,15 +67,27 @@ STRINGS = {
     "settings.nav_save_hint": "When off, edits are not saved on image switch. Save manually or enable this option.",
     "settings.periodic_auto_save": "Enable periodic auto-save (entire folder)",
     "settings.periodic_interval": "Interval (minutes):",
+    "settings.simplify_tolerance": "Polygon simplify tolerance (px):",
+    "settings.simplify_on_load": "Simplify polygons when loading (not saved automatically)",
+    "settings.performance": "Performance",
+    "settings.image_cache_mb": "Image cache (MB):",
+    "settings.prefetch_ahead": "Prefetch next images:",
+    "settings.prefetch_behind": "Prefetch previous images:",
+    "settings.tiled_threshold_mp": "Tiled display above (MP, 0 = off):",
+    "settings.layer_threshold": "Batched drawing above (annotations, 0 = off):",
+    "settings.lazy_handles": "Create edit handles only for the selected annotation (faster on dense images)",
+    "settings.progressive_load": "Show a low-resolution preview of large images first, then swap in full resolution",
     "settings.language": "Language",
     "settings.shortcuts": "Shortcuts",
     "settings.shortcut_save": "Save",
     "settings.shortcut_undo": "Undo",
+    "settings.shortcut_redo": "Redo",
     "settings.shortcut_add": "Add annotation",
     "settings.shortcut_delete": "Delete annotation",
     "settings.shortcut_rect": "Rectangle (Rect)",
     "settings.shortcut_obb": "OBB",
     "settings.shortcut_polygon": "Polygon (Seg)",
+    "settings.shortcut_freehand": "Freehand polygon (Seg)",
     "settings.shortcut_finish": "Close polygon",
     "settings.shortcut_cancel": "Cancel drawing",
     "settings.shortcut_prev_image": "Previous image",
@@ -3,9 +3,13 @@ STRINGS = {
     "menu.file": "ファイル",
     "menu.open_image": "画像を開く",
     "menu.open_folder": "フォルダを開く",
+    "menu.dataset_stats": "データセット統計…",
     "menu.theme": "テーマ",
     "menu.settings": "設定",
     "menu.preferences": "環境設定…",
+    "menu.debug": "デバッグ",
+    "menu.trace_enabled": "パフォーマンストレースを記録",
+    "menu.trace_export": "パフォーマンストレースを書き出し…",
     "theme.light_blue": "ライトブルー",
     "theme.light_pink": "ライトピンク",
     "theme.deep_blue": "ディープブルー",
@@ -21,8 +25,10 @@ STRINGS = {
     "mode.rect": "矩形 (Rect)",
     "mode.obb": "OBB",
     "mode.polygon": "多角形 (Seg)",
+    "mode.freehand": "フリーハンド多角形 (Seg)",
     "btn.add": "追加",
     "btn.delete": "削除",
+    "btn.simplify_polygon": "ポリゴンを簡略化",
     "label.class_id": "Class ID:",
     "btn.save_yolo": "YOLO txt を保存",
     "dialog.select_save_path": "保存先を選択",
@@ -40,9 +46,18 @@ STRINGS = {
     "msg.open_folder_first": "先にフォルダを開いてください",
     "msg.open_image_first": "先に画像を開いてください",
     "msg.save_txt_failed": "txtの保存に失敗: {error}",
+    "msg.dataset_stats": "データセット統計",
+    "msg.index_failed": "ラベルインデックスの読み込みに失敗: {error}",
+    "stats.summary": "ラベルファイル: {files}\nラベルあり: {labeled}\n空ファイル: {empty}\nアノテーション総数: {boxes}",
+    "stats.types": "矩形 {rect} / 回転矩形 {obb} / ポリゴン {polygon}",
+    "stats.class_row": "クラス {class_id}: {count}",
+    "view.loading": "読み込み中… {name}",
     "toast.save_success": "✓ 保存しました",
+    "toast.stats_running": "集計中…",
     "toast.auto_save_skipped": "未保存：先に保存先を設定してください",
     "toast.periodic_save_done": "✓ すべて自動保存しました",
+    "toast.simplified": "✓ ポリゴン頂点 {before} → {after}",
+    "toast.trace_exported": "✓ トレースイベント {count} 件を書き出しました",
     "list.modified": "● {name}",
     "list.labeled": "✓ {name}",
     "list.unlabeled": "○ {name}",
@@ -52,15 +67,27 @@ STRINGS = {
     "settings.nav_save_hint": "オフの場合、切替時に編集は保存されません。手動保存するかこの項目をオンにしてください。",
     "settings.periodic_auto_save": "定期自動保存を有効（フォルダ全体）",
     "settings.periodic_interval": "間隔（分）:",
+    "settings.simplify_tolerance": "ポリゴン簡略化の許容誤差（px）:",
+    "settings.simplify_on_load": "読み込み時にポリゴンを簡略化（自動保存はしません）",
+    "settings.performance": "パフォーマンス",
+    "settings.image_cache_mb": "画像キャッシュ（MB）:",
+    "settings.prefetch_ahead": "先読み（次の画像）:",
+    "settings.prefetch_behind": "先読み（前の画像）:",
+    "settings.tiled_threshold_mp": "タイル表示の閾値（MP、0 で無効）:",
+    "settings.layer_threshold": "一括描画の閾値（アノテーション数、0 で無効）:",
+    "settings.lazy_handles": "選択中のアノテーションにのみ編集ハンドルを作成（高密度画像で高速）",
+    "settings.progressive_load": "大きな画像は先に低解像度プレビューを表示し、フル解像度に差し替える",
     "settings.language": "言語",
     "settings.shortcuts": "ショートカット",
     "settings.shortcut_save": "保存",
     "settings.shortcut_undo": "元に戻す",
+    "settings.shortcut_redo": "やり直し",
     "settings.shortcut_add": "アノテーション追加",
     "settings.shortcut_delete": "アノテーション削除",
     "settings.shortcut_rect": "矩形 (Rect)",
     "settings.shortcut_obb": "OBB",
     "settings.shortcut_polygon": "多角形 (Seg)",
+    "settings.shortcut_freehand": "フリーハンド多角形 (Seg)",
     "settings.shortcut_finish": "多角形を閉じる",
     "settings.shortcut_cancel": "描画をキャンセル",
     "settings.shortcut_prev_image": "前の画像",
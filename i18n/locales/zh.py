@@ -3,9 +3,13 @@ STRINGS = {
     "menu.file": "文件",
     "menu.open_image": "打开单张图片",
     "menu.open_folder": "打开文件夹",
+    "menu.dataset_stats": "数据集统计…",
     "menu.theme": "主题色",
     "menu.settings": "设置",
     "menu.preferences": "偏好设置…",
+    "menu.debug": "调试",
+    "menu.trace_enabled": "记录性能追踪",
+    "menu.trace_export": "导出性能追踪…",
     "theme.light_blue": "淡蓝",
     "theme.light_pink": "淡粉",
     "theme.deep_blue": "深蓝",
@@ -21,8 +25,10 @@ STRINGS = {
     "mode.rect": "标准矩形(Rect)",
     "mode.obb": "平行四边形(OBB)",
     "mode.polygon": "多边形(Seg)",
+    "mode.freehand": "手绘多边形(Seg)",
     "btn.add": "新添",
     "btn.delete": "删除",
+    "btn.simplify_polygon": "简化多边形",
     "label.class_id": "Class ID:",
     "btn.save_yolo": "保存 YOLO txt",
     "dialog.select_save_path": "选择保存路径",
@@ -40,9 +46,18 @@ STRINGS = {
     "msg.open_folder_first": "请先打开文件夹",
     "msg.open_image_first": "请先打开图片",
     "msg.save_txt_failed": "保存txt文件失败: {error}",
+    "msg.dataset_stats": "数据集统计",
+    "msg.index_failed": "读取标注索引失败: {error}",
+    "stats.summary": "标注文件: {files}\n有标注: {labeled}\n空文件: {empty}\n标注总数: {boxes}",
+    "stats.types": "矩形 {rect} / 旋转框 {obb} / 多边形 {polygon}",
+    "stats.class_row": "类别 {class_id}: {count}",
+    "view.loading": "加载中… {name}",
     "toast.save_success": "✓ 保存成功",
+    "toast.stats_running": "正在统计…",
     "toast.auto_save_skipped": "未保存：请先设置保存路径",
     "toast.periodic_save_done": "✓ 已自动保存全部",
+    "toast.simplified": "✓ 多边形顶点 {before} → {after}",
+    "toast.trace_exported": "✓ 已导出 {count} 个追踪事件",
     "list.modified": "● {name}",
     "list.labeled": "✓ {name}",
     "list.unlabeled": "○ {name}",
@@ -52,15 +67,27 @@ STRINGS = {
     "settings.nav_save_hint": "关闭后，切换图片不会保存当前编辑，请手动保存或开启此项。",
     "settings.periodic_auto_save": "启用定时自动保存（保存整个文件夹）",
     "settings.periodic_interval": "间隔（分钟）:",
+    "settings.simplify_tolerance": "多边形简化容差（像素）:",
+    "settings.simplify_on_load": "加载时自动简化多边形（不会自动保存）",
+    "settings.performance": "性能",
+    "settings.image_cache_mb": "图片缓存（MB）:",
+    "settings.prefetch_ahead": "向后预读张数:",
+    "settings.prefetch_behind": "向前预读张数:",
+    "settings.tiled_threshold_mp": "分块显示阈值（百万像素，0 关闭）:",
+    "settings.layer_threshold": "合并绘制阈值（标注数，0 关闭）:",
+    "settings.lazy_handles": "仅为选中的标注创建控制点（标注密集时更流畅）",
+    "settings.progressive_load": "大图先显示低分辨率预览，原图在后台解码完成后替换",
     "settings.language": "语言",
     "settings.shortcuts": "快捷键",
     "settings.shortcut_save": "保存",
     "settings.shortcut_undo": "撤回",
+    "settings.shortcut_redo": "重做",
     "settings.shortcut_add": "新增标注",
     "settings.shortcut_delete": "删除标注",
     "settings.shortcut_rect": "标准矩形 (Rect)",
     "settings.shortcut_obb": "平行四边形 (OBB)",
     "settings.shortcut_polygon": "多边形 (Seg)",
+    "settings.shortcut_freehand": "手绘多边形 (Seg)",
     "settings.shortcut_finish": "闭合多边形",
     "settings.shortcut_cancel": "取消绘制",
     "settings.shortcut_prev_image": "上一张图片",
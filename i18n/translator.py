@@ -1,10 +1,16 @@
-from i18n.locales import zh, en, ja
-
-_LOCALES = {
-    "zh": zh.STRINGS,
-    "en": en.STRINGS,
-    "ja": ja.STRINGS,
+from importlib import import_module
+
+# 语言包按需导入：启动时只加载当前语言，缺失的键再回退到中文。
+# 模块名写成字面量，PyInstaller 才能识别（main.spec 中同样列在 hiddenimports）
+_LOCALE_LOADERS = {
+    "zh": lambda: import_module("i18n.locales.zh"),
+    "en": lambda: import_module("i18n.locales.en"),
+    "ja": lambda: import_module("i18n.locales.ja"),
 }
+LANGUAGES = tuple(_LOCALE_LOADERS)
+FALLBACK_LANGUAGE = "zh"
+
+_LOCALES = {}
 
 _current_language = "zh"
 _callbacks = []
@@ -18,10 +24,18 @@ def get_language() -> str:
     return _current_language
 
 
+def _strings(lang: str) -> dict:
+    strings = _LOCALES.get(lang)
+    if strings is None:
+        strings = _LOCALE_LOADERS[lang]().STRINGS
+        _LOCALES[lang] = strings
+    return strings
+
+
 def set_language(lang: str):
     global _current_language
-    if lang not in _LOCALES:
-        lang = "zh"
+    if lang not in LANGUAGES:
+        lang = FALLBACK_LANGUAGE
     if lang == _current_language:
         return
     _current_language = lang
@@ -34,8 +48,9 @@ def on_language_changed(callback):
 
 
 def tr(key: str, **kwargs) -> str:
-    strings = _LOCALES.get(_current_language, _LOCALES["zh"])
-    text = strings.get(key, _LOCALES["zh"].get(key, key))
+    text = _strings(_current_language).get(key)
+    if text is None:
+        text = _strings(FALLBACK_LANGUAGE).get(key, key)
     if kwargs:
         try:
             return text.format(**kwargs)
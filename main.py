@@ -1,19 +1,38 @@
+import time
+
+_STARTED = time.perf_counter()
+
 import sys
+from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import QApplication, QStyleFactory
 from ui.main_window import MainWindow
 from ui.theme_manager import apply_theme, init_saved_theme
-from core.settings_manager import load_language
+from core.settings_manager import load_language, open_settings
 from i18n.translator import init_language, tr
+from utils.startup import StartupTimer, preload_deferred
+
+# 测量启动耗时：显示并绘制第一帧后输出各阶段耗时（JSON）并退出
+STARTUP_TIME_FLAG = "--startup-time"
+
 
 def main():
-    app = QApplication(sys.argv)
+    measure = STARTUP_TIME_FLAG in sys.argv
+    timer = StartupTimer(_STARTED)
+    timer.mark("imports")
+
+    app = QApplication([a for a in sys.argv if a != STARTUP_TIME_FLAG])
     app.setStyle(QStyleFactory.create("Fusion"))
+    timer.mark("qapplication")
 
-    init_language(load_language())
-    saved_theme = init_saved_theme()
-    window = MainWindow()
+    # 启动时的设置读取共用同一个 QSettings
+    settings = open_settings()
+    init_language(load_language(settings))
+    saved_theme = init_saved_theme(settings)
+    window = MainWindow(settings)
     window.setWindowTitle(tr("app.title"))
-    apply_theme(app, window, saved_theme)
+    timer.mark("window")
+    apply_theme(app, window, saved_theme, save=False)
+    timer.mark("theme")
     
     # 获取屏幕大小，设置合理的初始窗口大小
     screen = app.primaryScreen()
@@ -33,8 +52,14 @@ def main():
     )
     
     window.show()
+    if measure:
+        app.processEvents()
+        timer.mark("first_frame")
+        print(timer.to_json())
+        window.close()
+        return 0
+    QTimer.singleShot(0, preload_deferred)
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
     main()
-
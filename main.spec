@@ -10,7 +10,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('resources/style.qss', 'resources')],
-    hiddenimports=[],
+    hiddenimports=['i18n.locales.zh', 'i18n.locales.en', 'i18n.locales.ja'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
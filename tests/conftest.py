@@ -0,0 +1,77 @@
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+from PyQt5.QtCore import QEventLoop, QElapsedTimer, QSettings
+from PyQt5.QtGui import QColor, QImage
+from PyQt5.QtWidgets import QApplication, QFileDialog
+
+
+@pytest.fixture(scope="session")
+def qapp(tmp_path_factory):
+    # 设置写到临时目录，不碰用户配置
+    QSettings.setPath(QSettings.IniFormat, QSettings.UserScope,
+                      str(tmp_path_factory.mktemp("settings")))
+    QSettings.setDefaultFormat(QSettings.IniFormat)
+    # 标注索引写到临时的缓存目录
+    cache = str(tmp_path_factory.mktemp("cache"))
+    os.environ["XDG_CACHE_HOME"] = cache
+    os.environ["LOCALAPPDATA"] = cache
+    return QApplication.instance() or QApplication(sys.argv)
+
+
+def pump(ms=50):
+    app = QApplication.instance()
+    timer = QElapsedTimer()
+    timer.start()
+    while timer.elapsed() < ms:
+        app.processEvents(QEventLoop.AllEvents, 10)
+
+
+def wait_until(cond, timeout_ms=5000):
+    app = QApplication.instance()
+    timer = QElapsedTimer()
+    timer.start()
+    while not cond():
+        assert timer.elapsed() < timeout_ms, "timed out"
+        app.processEvents(QEventLoop.AllEvents, 10)
+
+
+def write_image(path, width=320, height=240, fmt=None):
+    image = QImage(width, height, QImage.Format_RGB32)
+    image.fill(QColor(90, 120, 150))
+    assert image.save(str(path), fmt)
+    return path
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    """images/ 下三张图片，labels/im0.txt 有一个框"""
+    images = tmp_path / "images"
+    labels = tmp_path / "labels"
+    images.mkdir()
+    labels.mkdir()
+    for i in range(3):
+        write_image(images / f"im{i}.jpg")
+    (labels / "im0.txt").write_text("0 0.5 0.5 0.2 0.2\n")
+    return images, labels
+
+
+@pytest.fixture
+def window(qapp, dataset, monkeypatch):
+    from ui.main_window import MainWindow
+    images, labels = dataset
+    monkeypatch.setattr(QFileDialog, "getExistingDirectory",
+                        staticmethod(lambda *a, **k: str(images)))
+    w = MainWindow()
+    w._trace_output = None
+    w.save_folder_path = labels
+    w.show()
+    yield w
+    w._dirty_images.clear()
+    w.close()
+    pump()
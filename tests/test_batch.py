@@ -0,0 +1,19 @@
+from core.batch import stats_chunk
+
+
+def test_stats_chunk_counts_good_files_next_to_a_bad_one(tmp_path):
+    paths = []
+    for name in ("a1", "a2", "a3", "a4"):
+        path = tmp_path / f"{name}.txt"
+        path.write_text("0 0.5 0.5 0.2 0.2\n1 0.1 0.1 0.3 0.1 0.3 0.3 0.1 0.3\n")
+        paths.append(path)
+    bad = tmp_path / "b_bad.txt"
+    bad.write_text("0 0.5 abc 0.2 0.2\n")
+    paths.insert(2, bad)
+
+    summary = stats_chunk(paths, {})
+    assert summary.files == 5
+    assert summary.boxes == 8
+    assert summary.class_counts == {0: 4, 1: 4}
+    assert summary.type_counts == {"rect": 4, "obb": 4}
+    assert [name for name, _ in summary.errors] == ["b_bad.txt"]
@@ -0,0 +1,46 @@
+from core.bbox import BBox
+from core.dataset_index import DatasetIndex, default_index_path
+from core.yolo_io import save_yolo_txt
+
+from conftest import wait_until
+
+
+def test_index_lives_outside_the_save_folder(qapp, tmp_path):
+    a, b = tmp_path / "a", tmp_path / "b"
+    a.mkdir()
+    b.mkdir()
+    path = default_index_path(a)
+    assert a not in path.parents
+    assert path == default_index_path(a)
+    assert path != default_index_path(b)
+    with DatasetIndex(a) as index:
+        assert index.db_path == path
+    assert not any(a.iterdir())
+
+
+def test_update_file_indexes_the_written_rows(qapp, tmp_path):
+    txt = tmp_path / "im0.txt"
+    # 超出范围的值与未知类型：写盘时被截断 / 跳过
+    bboxes = [
+        BBox(0, 3, 'rect', 1.2, 0.5, 0.3, 0.2),
+        BBox(1, 4, 'unknown', points=[(0.1, 0.1)]),
+        BBox(2, 5, 'polygon', points=[(0.1, 0.1), (0.5, -0.2), (0.4, 0.6)]),
+    ]
+    save_yolo_txt(txt, bboxes, skip_unchanged=False)
+    with DatasetIndex(tmp_path, db_path=tmp_path / "index.sqlite3") as index:
+        index.update_file(txt)
+        rows = index.file_boxes(txt.name)
+    assert [(class_id, kind) for _, class_id, kind, _ in rows] == [(3, "rect"), (5, "polygon")]
+    assert rows[0][3].tolist() == [1.0, 0.5, 0.3, 0.2]
+    assert rows[1][3].tolist() == [0.1, 0.1, 0.5, 0.0, 0.4, 0.6]
+
+
+def test_dataset_stats_run_off_the_gui_thread(window, monkeypatch):
+    from PyQt5.QtWidgets import QMessageBox
+    shown = []
+    monkeypatch.setattr(QMessageBox, "information",
+                        staticmethod(lambda parent, title, text: shown.append(text)))
+    window.show_dataset_stats()
+    wait_until(lambda: shown)
+    from i18n.translator import tr
+    assert shown[0].startswith(tr("stats.summary", files=1, labeled=1, empty=0, boxes=1))
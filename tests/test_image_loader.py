@@ -0,0 +1,22 @@
+from PyQt5.QtCore import QSize
+
+from conftest import write_image
+from utils.image_loader import decode_for_display
+
+MIN_PIXELS = 1000 * 1000
+
+
+def test_jpeg_above_threshold_is_tiled(qapp, tmp_path):
+    path = write_image(tmp_path / "big.jpg", 1600, 1000)
+    _, size, tiled = decode_for_display(path, tiled_min_pixels=MIN_PIXELS)
+    assert tiled
+    assert size == QSize(1600, 1000)
+
+
+def test_format_without_clip_rect_is_not_tiled(qapp, tmp_path):
+    # PNG / BMP 不支持 ClipRect，分块读取会为每个分块解码整图
+    for name in ("big.png", "big.bmp"):
+        path = write_image(tmp_path / name, 1600, 1000)
+        image, size, tiled = decode_for_display(path, tiled_min_pixels=MIN_PIXELS)
+        assert not tiled
+        assert image.size() == size == QSize(1600, 1000)
@@ -0,0 +1,53 @@
+from core.bbox import BBox
+from core.label_manager import LabelManager
+
+
+class _Recorder:
+    def __init__(self, manager):
+        self.manager = manager
+        self.events = []
+
+    def labels_about_to_change(self, kind, row):
+        pass
+
+    def labels_changed(self, kind, row):
+        self.events.append((kind, row, len(self.manager)))
+
+
+def _boxes(n):
+    return [BBox(i, 0, x_center=0.5, y_center=0.5, width=0.1, height=0.1) for i in range(n)]
+
+
+def test_remove_many_reindexes_once(monkeypatch):
+    manager = LabelManager()
+    manager.set_bboxes(_boxes(1000))
+    recorder = _Recorder(manager)
+    manager.add_listener(recorder)
+
+    reindexed = []
+    original = manager._reindex_from
+    monkeypatch.setattr(manager, "_reindex_from", lambda row: (reindexed.append(row), original(row)))
+
+    removed = manager.remove_many(range(0, 1000, 2))
+
+    assert removed == list(range(0, 1000, 2))
+    assert reindexed == [0]
+    assert len(manager) == 500
+    assert [kind for kind, _, _ in recorder.events] == ["remove"] * 500
+    # 监听者按行号从大到小收到通知，每次通知时行数与删除进度一致
+    assert recorder.events[0] == ("remove", 998, 999)
+    assert recorder.events[-1] == ("remove", 0, 500)
+    for row, bbox in enumerate(manager.bboxes):
+        assert bbox.id == 2 * row + 1
+        assert manager.row_of(bbox.id) == row
+        assert manager.get(bbox.id) is bbox
+    assert manager.get(0) is None
+
+
+def test_remove_many_ignores_unknown_ids():
+    manager = LabelManager()
+    manager.set_bboxes(_boxes(3))
+    assert manager.remove_many([5, 1, 1]) == [1]
+    assert [b.id for b in manager.bboxes] == [0, 2]
+    assert manager.row_of(2) == 1
+    assert manager.remove_many([]) == []
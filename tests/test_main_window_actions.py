@@ -0,0 +1,77 @@
+from core.settings_manager import ShortcutKey
+
+from conftest import wait_until
+
+
+def _open(window):
+    window.action_open_folder.trigger()
+    wait_until(lambda: window.current_image_path is not None and not window._is_loading())
+
+
+def test_open_folder_action(window):
+    _open(window)
+    assert len(window.image_list) == 3
+    assert window.current_image_path == window.image_list[0]
+    assert len(window.label_manager.bboxes) == 1
+
+
+def test_undo_redo_actions(window):
+    _open(window)
+    window.radio_rect.setChecked(True)
+    window.add_bbox()
+    assert len(window.label_manager.bboxes) == 2
+
+    window._shortcut_actions[ShortcutKey.UNDO].trigger()
+    assert len(window.label_manager.bboxes) == 1
+    window._shortcut_actions[ShortcutKey.REDO].trigger()
+    assert len(window.label_manager.bboxes) == 2
+
+
+def test_new_rect_keeps_requested_size(window):
+    _open(window)
+    window.radio_rect.setChecked(True)
+    window.add_bbox()
+    bbox = window.label_manager.bboxes[-1]
+    assert (bbox.width, bbox.height) == (0.2, 0.2)
+    window._undo()
+    window._redo()
+    bbox = window.label_manager.bboxes[-1]
+    assert (bbox.width, bbox.height) == (0.2, 0.2)
+
+
+def test_undo_add_removes_through_remove_many(window, monkeypatch):
+    _open(window)
+    window.radio_rect.setChecked(True)
+    window.add_bbox()
+    bbox_id = window.label_manager.bboxes[-1].id
+
+    calls = []
+    original = window.label_manager.remove_many
+    monkeypatch.setattr(window.label_manager, "remove_many", lambda ids: (calls.append(list(ids)), original(ids))[1])
+
+    window._shortcut_actions[ShortcutKey.UNDO].trigger()
+    assert calls == [[bbox_id]]
+    assert window.label_manager.get(bbox_id) is None
+    assert bbox_id not in window.bbox_items
+
+    window._shortcut_actions[ShortcutKey.REDO].trigger()
+    assert window.label_manager.bboxes[-1].id == bbox_id
+
+
+def test_click_then_class_change_is_one_undo_step(window):
+    _open(window)
+    bbox = window.label_manager.bboxes[0]
+    window._select_bbox_by_id(bbox.id)
+    old_class = bbox.class_id
+    new_class = old_class + 1
+    # 鼠标按下图元即开始一条编辑记录
+    window.bbox_items[bbox.id]._notify_edit_start()
+    window.class_id_spinbox.setValue(new_class)
+    assert window.label_manager.get(bbox.id).class_id == new_class
+
+    window._undo()
+    assert window.label_manager.get(bbox.id).class_id == old_class
+    assert not window._undo_stack.can_undo()
+    window._redo()
+    assert window.label_manager.get(bbox.id).class_id == new_class
+    assert not window._undo_stack.can_redo()
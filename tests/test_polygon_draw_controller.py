@@ -0,0 +1,33 @@
+from PyQt5.QtCore import QPointF, QRectF
+from PyQt5.QtWidgets import QGraphicsScene
+
+from ui.polygon_draw_controller import PolygonDrawController
+
+
+def _square_stroke(size=100.0, per_edge=20):
+    """沿三条边描到第四个角点结束"""
+    corners = [(0, 0), (size, 0), (size, size), (0, size)]
+    points = []
+    for (x0, y0), (x1, y1) in zip(corners, corners[1:]):
+        for k in range(per_edge):
+            t = k / per_edge
+            points.append(QPointF(10 + x0 + (x1 - x0) * t, 10 + y0 + (y1 - y0) * t))
+    points.append(QPointF(10 + corners[-1][0], 10 + corners[-1][1]))
+    return points
+
+
+def test_freehand_never_finishes_with_four_vertices(qapp):
+    # 直边描出的正方形会被 Douglas-Peucker 简化成 4 个角点，保存后会被读成 OBB
+    scene = QGraphicsScene()
+    controller = PolygonDrawController()
+    results = []
+    controller.finished.connect(results.append)
+    controller.start(scene, QRectF(0, 0, 200, 200), freehand=True)
+    stroke = _square_stroke()
+    controller.begin_stroke(stroke[0])
+    for point in stroke[1:-1]:
+        controller.extend_stroke(point)
+    controller.end_stroke(stroke[-1])
+
+    assert len(results) == 1
+    assert len(results[0]) == 5
@@ -0,0 +1,25 @@
+import pytest
+
+from core.bbox import BBox
+from core.polygon_simplify import METHODS, simplify_normalized, simplify_rdp
+from core.yolo_io import format_yolo_txt, parse_yolo_bytes
+
+# 最远点恰为最后一个顶点的细长多边形，RDP 只剩两个锚点
+SLIVER = [(0.1, 0.1), (0.3, 0.1005), (0.6, 0.1003), (0.9, 0.1)]
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_sliver_keeps_three_vertices(method):
+    simplified = simplify_normalized(SLIVER, 1.0, 640, 640, method)
+    assert len(simplified) >= 3
+    assert set(simplified) <= set(SLIVER)
+
+    bbox = BBox(0, 0, type="polygon", points=simplified)
+    loaded = parse_yolo_bytes(format_yolo_txt([bbox]).encode()).to_bboxes()
+    # 不能退化为 5 字段的矩形行
+    assert [b.type for b in loaded] != ["rect"]
+    assert loaded[0].points == pytest.approx(simplified, abs=1e-6)
+
+
+def test_rdp_closed_keeps_three_vertices():
+    assert len(simplify_rdp(SLIVER, 1.0 / 640)) == 3
@@ -0,0 +1,84 @@
+import pytest
+from PyQt5.QtCore import QRectF
+from PyQt5.QtWidgets import QGraphicsScene
+
+from core.bbox import BBox
+from core.bbox_clone import clone_bboxes
+from ui.drag_coalescer import drag_coalescer
+from ui.scene_reconciler import SceneReconciler
+
+IMG = QRectF(0, 0, 640, 480)
+
+
+def _bboxes():
+    return [
+        BBox(1, 0, 'rect', 0.3, 0.4, 0.02, 0.1),
+        # 不是严格矩形的四边形
+        BBox(2, 1, 'obb', points=[(0.1, 0.1), (0.3, 0.12), (0.31, 0.3), (0.09, 0.28)]),
+        BBox(3, 2, 'polygon', points=[(0.5, 0.5), (0.6, 0.52), (0.58, 0.61), (0.49, 0.6), (0.45, 0.55)]),
+    ]
+
+
+def _state(bboxes):
+    return [(b.type, b.x_center, b.y_center, b.width, b.height, b.points) for b in bboxes]
+
+
+def _assert_same(bboxes, expected):
+    for b, e in zip(bboxes, expected):
+        assert (b.x_center, b.y_center, b.width, b.height) == pytest.approx(e[1:5], abs=1e-12)
+        if e[5] is not None:
+            flat = [v for point in b.points for v in point]
+            assert flat == pytest.approx([v for point in e[5] for v in point], abs=1e-12)
+
+
+def test_promote_demote_keeps_geometry(qapp):
+    scene = QGraphicsScene()
+    rec = SceneReconciler(scene)
+    rec.layer_threshold = 1
+    bboxes = _bboxes()
+    expected = _state(bboxes)
+    rec.reconcile(bboxes, IMG)
+    assert rec.layered
+    for _ in range(5):
+        for b in bboxes:
+            assert rec.promote_only(b.id, IMG) is not None
+            rec.promote_only(None, IMG)
+    _assert_same(bboxes, expected)
+
+
+def test_reconcile_reuse_keeps_geometry(qapp):
+    scene = QGraphicsScene()
+    rec = SceneReconciler(scene)
+    bboxes = _bboxes()
+    expected = _state(bboxes)
+    rec.reconcile(bboxes, IMG)
+    for _ in range(5):
+        # 撤回/重做时同 id 的标注换成新的对象，图元被复用
+        bboxes = clone_bboxes(bboxes)
+        rec.reconcile(bboxes, IMG)
+    _assert_same(bboxes, expected)
+    assert len(rec.items) == 3
+
+
+def test_rect_item_scene_rect_excludes_pen(qapp):
+    scene = QGraphicsScene()
+    rec = SceneReconciler(scene)
+    bbox = BBox(1, 0, 'rect', 0.5, 0.5, 0.1, 0.1)
+    rec.reconcile([bbox], IMG)
+    item = rec.items[1]
+    item._sync_to_yolo()
+    assert bbox.width == pytest.approx(0.1, abs=1e-12)
+    assert item.scene_rect().width() == pytest.approx(64)
+
+
+def test_reuse_does_not_write_back_to_model(qapp):
+    scene = QGraphicsScene()
+    rec = SceneReconciler(scene)
+    rec.reconcile(_bboxes(), IMG)
+    bboxes = clone_bboxes(_bboxes())
+    points = [b.points for b in bboxes]
+    rec.reconcile(bboxes, IMG)
+    drag_coalescer().commit()
+    # 复用图元只刷新显示，撤回快照里的顶点列表保持原对象
+    assert [b.points for b in bboxes] == points
+    assert all(b.points is p for b, p in zip(bboxes, points))
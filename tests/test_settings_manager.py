@@ -0,0 +1,20 @@
+from core.settings_manager import DEFAULT_SHORTCUTS, ShortcutKey, shortcuts_conflict
+
+
+def _shortcuts(**overrides):
+    shortcuts = {key.value: DEFAULT_SHORTCUTS[key] for key in ShortcutKey}
+    shortcuts.update({ShortcutKey[name].value: value for name, value in overrides.items()})
+    return shortcuts
+
+
+def test_defaults_do_not_conflict():
+    assert not shortcuts_conflict(_shortcuts())
+
+
+def test_identical_multi_chord_shortcuts_conflict():
+    assert shortcuts_conflict(_shortcuts(UNDO="Ctrl+K, Ctrl+S", REDO="ctrl+k,ctrl+s"))
+    assert not shortcuts_conflict(_shortcuts(UNDO="Ctrl+K, Ctrl+S", REDO="Ctrl+K, Ctrl+D"))
+
+
+def test_enter_and_return_conflict():
+    assert shortcuts_conflict(_shortcuts(UNDO="Return", REDO="Enter"))
@@ -0,0 +1,23 @@
+import ast
+from pathlib import Path
+
+from i18n import translator
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_every_language_loads():
+    for lang in translator.LANGUAGES:
+        assert translator._strings(lang)["app.title"]
+
+
+def test_locales_listed_for_pyinstaller():
+    # 语言包只在函数内导入，打包时需要在 main.spec 的 hiddenimports 中列出
+    spec = (ROOT / "main.spec").read_text(encoding="utf-8")
+    call = next(
+        node for node in ast.walk(ast.parse(spec))
+        if isinstance(node, ast.Call) and getattr(node.func, "id", None) == "Analysis"
+    )
+    hidden = next(kw.value for kw in call.keywords if kw.arg == "hiddenimports")
+    names = {elt.value for elt in hidden.elts}
+    assert {f"i18n.locales.{lang}" for lang in translator.LANGUAGES} <= names
@@ -0,0 +1,19 @@
+import warnings
+
+import pytest
+
+from core.yolo_io import parse_yolo_bytes
+
+
+def test_integer_class_ids_parse():
+    columns = parse_yolo_bytes(b"0 0.5 0.5 0.2 0.2\n+12 0.1 0.1 0.3 0.1 0.3 0.3 0.1 0.3\n")
+    assert columns.class_ids.tolist() == [0, 12]
+
+
+@pytest.mark.parametrize("class_field", [b"1.0", b"nan", b"inf", b"1e3"])
+def test_non_integer_class_ids_are_rejected_like_int(class_field):
+    # 旧实现用 int() 解析类别字段，这些输入都会报 ValueError
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        with pytest.raises(ValueError):
+            parse_yolo_bytes(b"0 0.5 0.5 0.2 0.2\n" + class_field + b" 0.5 0.5 0.2 0.2\n")
@@ -0,0 +1,196 @@
+from PyQt5.QtCore import QPointF, QRectF, Qt
+from PyQt5.QtGui import QBrush, QColor, QPen, QPolygonF
+from PyQt5.QtWidgets import QGraphicsItem
+
+from core.spatial_index import GridIndex, bbox_bounds
+from ui.theme_manager import get_annotation_colors
+
+# 位于图片（-1）之上、完整标注图元（0）之下
+LAYER_Z = -0.5
+# 与标注图元的描边宽度一致；查询/重绘范围按此外扩
+PEN_WIDTH = 2
+
+
+class AnnotationLayer(QGraphicsItem):
+    """
+    用一个图元绘制所有未选中的标注
+
+    标注按归一化外接矩形登记在 GridIndex 中，paint() 只查询并绘制 exposedRect 内的标注，
+    画笔按状态缓存共用；点击命中也走同一索引（hit_test）。被提升为完整可编辑图元的标注
+    （set_hidden）不在此绘制与命中。场景坐标下的形状按需计算并缓存，put() 时失效。
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._rect = QRectF()
+        self._bboxes = {}  # id -> BBox
+        self._order = {}  # id -> 加入顺序，越后越靠上（与逐个图元时的叠放一致）
+        self._next_order = 0
+        self._shapes = {}  # id -> QRectF / QPolygonF
+        self._hidden = set()
+        self._index = GridIndex()
+        self.setZValue(LAYER_Z)
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption, True)
+        self.setAcceptedMouseButtons(Qt.NoButton)
+        self.refresh_theme_colors()
+
+    def boundingRect(self):
+        return self._rect
+
+    def __len__(self):
+        return len(self._bboxes)
+
+    def refresh_theme_colors(self):
+        color = QColor(get_annotation_colors()["unselected"])
+        self._pen = QPen(color, PEN_WIDTH)
+        fill = QColor(color)
+        fill.setAlpha(38)
+        self._polygon_brush = QBrush(fill)
+        self.update()
+
+    # ======================= 数据 =======================
+
+    def set_bboxes(self, bboxes, img_rect):
+        self.prepareGeometryChange()
+        self._rect = QRectF(img_rect) if img_rect is not None else QRectF()
+        self._bboxes.clear()
+        self._order.clear()
+        self._next_order = 0
+        self._shapes.clear()
+        self._hidden.clear()
+        self._index.clear()
+        for bbox in bboxes:
+            self._put(bbox)
+        self.update()
+
+    def clear(self):
+        self.set_bboxes([], None)
+
+    def bbox(self, bbox_id):
+        return self._bboxes.get(bbox_id)
+
+    def put(self, bbox):
+        """加入或更新一个标注（bbox 可以是新的对象）"""
+        self._update_bounds(self._index.bounds(bbox.id))
+        self._put(bbox)
+        self._update_bounds(self._index.bounds(bbox.id))
+
+    def _put(self, bbox):
+        if bbox.id not in self._order:
+            self._order[bbox.id] = self._next_order
+            self._next_order += 1
+        self._bboxes[bbox.id] = bbox
+        self._shapes.pop(bbox.id, None)
+        self._index.insert(bbox.id, bbox_bounds(bbox))
+
+    def remove(self, bbox_id):
+        if self._bboxes.pop(bbox_id, None) is None:
+            return
+        self._update_bounds(self._index.bounds(bbox_id))
+        self._order.pop(bbox_id, None)
+        self._shapes.pop(bbox_id, None)
+        self._hidden.discard(bbox_id)
+        self._index.remove(bbox_id)
+
+    def set_hidden(self, bbox_id, hidden: bool):
+        if hidden:
+            self._hidden.add(bbox_id)
+        else:
+            self._hidden.discard(bbox_id)
+        self._update_bounds(self._index.bounds(bbox_id))
+
+    # ======================= 几何 =======================
+
+    def _update_bounds(self, bounds):
+        if bounds is None or self._rect.isEmpty():
+            return
+        r = self._rect
+        x0, y0, x1, y1 = bounds
+        m = PEN_WIDTH
+        self.update(QRectF(
+            r.left() + x0 * r.width() - m, r.top() + y0 * r.height() - m,
+            (x1 - x0) * r.width() + 2 * m, (y1 - y0) * r.height() + 2 * m,
+        ))
+
+    def _shape(self, bbox_id):
+        shape = self._shapes.get(bbox_id)
+        if shape is not None:
+            return shape
+        bbox = self._bboxes[bbox_id]
+        r = self._rect
+        iw, ih = r.width(), r.height()
+        if bbox.type == 'rect':
+            w = bbox.width * iw
+            h = bbox.height * ih
+            shape = QRectF(
+                r.left() + bbox.x_center * iw - w / 2, r.top() + bbox.y_center * ih - h / 2, w, h
+            )
+        else:
+            shape = QPolygonF([
+                QPointF(r.left() + px * iw, r.top() + py * ih) for px, py in (bbox.points or ())
+            ])
+        self._shapes[bbox_id] = shape
+        return shape
+
+    def _normalized_rect(self, scene_rect: QRectF):
+        r = self._rect
+        return (
+            (scene_rect.left() - r.left()) / r.width(),
+            (scene_rect.top() - r.top()) / r.height(),
+            (scene_rect.right() - r.left()) / r.width(),
+            (scene_rect.bottom() - r.top()) / r.height(),
+        )
+
+    def hit_test(self, scene_pos: QPointF):
+        """scene_pos 处最上层的（未提升的）标注 id，没有则返回 None"""
+        if self._rect.isEmpty() or not self._bboxes:
+            return None
+        nx, ny, _, _ = self._normalized_rect(QRectF(scene_pos, scene_pos))
+        best = None
+        for bbox_id in self._index.query_point(nx, ny):
+            if bbox_id in self._hidden:
+                continue
+            shape = self._shape(bbox_id)
+            if isinstance(shape, QRectF):
+                inside = shape.contains(scene_pos)
+            else:
+                inside = shape.containsPoint(scene_pos, Qt.OddEvenFill)
+            if inside and (best is None or self._order[bbox_id] > self._order[best]):
+                best = bbox_id
+        return best
+
+    # ======================= 绘制 =======================
+
+    def paint(self, painter, option, widget=None):
+        if not self._bboxes or self._rect.isEmpty():
+            return
+        m = PEN_WIDTH
+        exposed = option.exposedRect.adjusted(-m, -m, m, m).intersected(self._rect)
+        if exposed.isEmpty():
+            return
+
+        rects = []
+        outlines = []
+        filled = []
+        hidden = self._hidden
+        for bbox_id in self._index.query(*self._normalized_rect(exposed)):
+            if bbox_id in hidden:
+                continue
+            shape = self._shape(bbox_id)
+            if isinstance(shape, QRectF):
+                rects.append(shape)
+            elif self._bboxes[bbox_id].type == 'polygon':
+                filled.append(shape)
+            else:
+                outlines.append(shape)
+
+        painter.setPen(self._pen)
+        painter.setBrush(Qt.NoBrush)
+        if rects:
+            painter.drawRects(rects)
+        for shape in outlines:
+            painter.drawPolygon(shape)
+        if filled:
+            painter.setBrush(self._polygon_brush)
+            for shape in filled:
+                painter.drawPolygon(shape)
@@ -7,7 +7,10 @@ from PyQt5.QtWidgets import QGraphicsItem
 from PyQt5.QtGui import QPen, QColor
 
 from ui.theme_manager import get_annotation_colors
-from ui.graphics_utils import select_only, select_only_parent
+from ui.drag_coalescer import drag_coalescer
+from ui.graphics_utils import (
+    select_only, select_only_parent, wants_handles, release_child_items,
+)
 
 
 HANDLE_SIZE = 8
@@ -71,17 +74,18 @@ class ResizeHandle(QGraphicsEllipseItem):
         self.parent_bbox._notify_edit_start()
         select_only_parent(self.parent_bbox)
         self._drag_start_pos = self.mapToScene(event.pos())
-        self._original_rect = self.parent_bbox.sceneBoundingRect()
+        self._original_rect = self.parent_bbox.scene_rect()
         event.accept()
     
     def mouseMoveEvent(self, event):
-        """拖拽时实时计算新矩形并约束"""
+        """拖拽时计算新矩形并约束（每帧最多应用一次）"""
         current_pos = self.mapToScene(event.pos())
-        self._apply_resize(current_pos)
+        drag_coalescer().schedule(self.parent_bbox, lambda: self._apply_resize(current_pos))
         event.accept()
     
     def mouseReleaseEvent(self, event):
         """释放鼠标"""
+        drag_coalescer().commit()
         event.accept()
     
     def _apply_resize(self, target_pos: QPointF):
@@ -186,7 +190,7 @@ class ResizeHandle(QGraphicsEllipseItem):
         self.parent_bbox.setPos(new_scene_rect.left(), new_scene_rect.top())
         self.parent_bbox.setRect(0, 0, new_scene_rect.width(), new_scene_rect.height())
         self.parent_bbox._update_handles()
-        self.parent_bbox._sync_to_yolo()
+        drag_coalescer().defer_sync(self.parent_bbox)
 
 
 class BBoxItem(QGraphicsRectItem):
@@ -216,10 +220,9 @@ class BBoxItem(QGraphicsRectItem):
         # 颜色
         self._update_color(selected=False)
         
-        # 创建8个控制点
+        # 8个控制点（按需模式下选中时才创建）
         self.handles = {}
-        self._create_handles()
-        self._update_handles()
+        self.refresh_handles()
         
         # 整体拖拽状态
         self._is_dragging = False
@@ -244,8 +247,23 @@ class BBoxItem(QGraphicsRectItem):
         super().setSelected(selected)
         self._update_color(selected)
 
+    def itemChange(self, change, value):
+        if change == QGraphicsItem.ItemSelectedHasChanged:
+            self.refresh_handles()
+        return super().itemChange(change, value)
+
     # ======================= 控制点 =======================
 
+    def refresh_handles(self):
+        """按选中状态创建或释放控制点"""
+        if wants_handles(self):
+            if not self.handles:
+                self._create_handles()
+                self._update_handles()
+        elif self.handles:
+            release_child_items(self.handles.values())
+            self.handles = {}
+
     def _create_handles(self):
         """创建8个控制点"""
         for pos in ("tl", "t", "tr", "r", "br", "b", "bl", "l"):
@@ -253,6 +271,8 @@ class BBoxItem(QGraphicsRectItem):
 
     def _update_handles(self):
         """更新控制点位置"""
+        if not self.handles:
+            return
         r = self.rect()
         cx, cy = r.center().x(), r.center().y()
         
@@ -283,61 +303,69 @@ class BBoxItem(QGraphicsRectItem):
             select_only(self)
             self._is_dragging = True
             self._drag_start_pos = self.mapToScene(event.pos())
-            self._drag_start_rect = self.sceneBoundingRect()
+            self._drag_start_rect = self.scene_rect()
             event.accept()
         else:
             super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event):
-        """拖拽时移动整体bbox"""
+        """拖拽时移动整体bbox（每帧最多应用一次）"""
         if self._is_dragging:
             current_pos = self.mapToScene(event.pos())
-            dx = current_pos.x() - self._drag_start_pos.x()
-            dy = current_pos.y() - self._drag_start_pos.y()
-            
-            # 计算新位置
-            new_x = self._drag_start_rect.left() + dx
-            new_y = self._drag_start_rect.top() + dy
-            
-            # 约束到图像范围
-            if self.image_rect is not None:
-                img = self.image_rect
-                w = self._drag_start_rect.width()
-                h = self._drag_start_rect.height()
-                
-                # 左边界
-                new_x = max(new_x, img.left())
-                # 右边界
-                new_x = min(new_x, img.right() - w)
-                # 上边界
-                new_y = max(new_y, img.top())
-                # 下边界
-                new_y = min(new_y, img.bottom() - h)
-            
-            # 更新位置
-            self.setPos(new_x, new_y)
-            self._update_handles()
-            self._sync_to_yolo()
+            drag_coalescer().schedule(self, lambda: self._drag_to(current_pos))
             event.accept()
         else:
             super().mouseMoveEvent(event)
 
+    def _drag_to(self, current_pos: QPointF):
+        dx = current_pos.x() - self._drag_start_pos.x()
+        dy = current_pos.y() - self._drag_start_pos.y()
+        
+        # 计算新位置
+        new_x = self._drag_start_rect.left() + dx
+        new_y = self._drag_start_rect.top() + dy
+        
+        # 约束到图像范围
+        if self.image_rect is not None:
+            img = self.image_rect
+            w = self._drag_start_rect.width()
+            h = self._drag_start_rect.height()
+            
+            # 左边界
+            new_x = max(new_x, img.left())
+            # 右边界
+            new_x = min(new_x, img.right() - w)
+            # 上边界
+            new_y = max(new_y, img.top())
+            # 下边界
+            new_y = min(new_y, img.bottom() - h)
+        
+        # 更新位置
+        self.setPos(new_x, new_y)
+        self._update_handles()
+        drag_coalescer().defer_sync(self)
+
     def mouseReleaseEvent(self, event):
         """释放鼠标"""
         if self._is_dragging:
             self._is_dragging = False
+            drag_coalescer().commit()
             event.accept()
         else:
             super().mouseReleaseEvent(event)
 
     # ======================= YOLO同步 =======================
 
+    def scene_rect(self) -> QRectF:
+        """框在场景中的范围（不含画笔宽度，sceneBoundingRect 会多出半个笔宽）"""
+        return self.mapRectToScene(self.rect())
+
     def _sync_to_yolo(self):
         """同步到YOLO归一化坐标"""
         if self.image_rect is None:
             return
         
-        scene_rect = self.sceneBoundingRect()
+        scene_rect = self.scene_rect()
         img = self.image_rect
         iw, ih = img.width(), img.height()
         
@@ -353,3 +381,30 @@ class BBoxItem(QGraphicsRectItem):
         """设置图像范围"""
         self.image_rect = image_rect
         self._sync_to_yolo()
+
+    @staticmethod
+    def _scene_geometry(bbox_data, img_rect):
+        """YOLO 归一化坐标 -> 场景中的左上角与宽高"""
+        w = bbox_data.width * img_rect.width()
+        h = bbox_data.height * img_rect.height()
+        x = img_rect.left() + bbox_data.x_center * img_rect.width() - w / 2
+        y = img_rect.top() + bbox_data.y_center * img_rect.height() - h / 2
+        return x, y, w, h
+
+    @staticmethod
+    def from_bbox(bbox_data, img_rect) -> "BBoxItem":
+        x, y, w, h = BBoxItem._scene_geometry(bbox_data, img_rect)
+        item = BBoxItem(QRectF(0, 0, w, h), bbox_data)
+        item.setPos(x, y)
+        # 几何由 bbox_data 算出，不再反向同步，避免往返误差改动标注
+        item.image_rect = img_rect
+        return item
+
+    def update_from_bbox(self, bbox_data, img_rect):
+        """复用当前图元显示另一个（同类型的）标注"""
+        self.bbox_data = bbox_data
+        x, y, w, h = self._scene_geometry(bbox_data, img_rect)
+        self.setRect(QRectF(0, 0, w, h))
+        self.setPos(x, y)
+        self._update_handles()
+        self.image_rect = img_rect
@@ -0,0 +1,63 @@
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, Qt
+
+
+def format_bbox_row(bbox) -> str:
+    if bbox.type == 'rect':
+        prefix = "[Rect]"
+        extra = ""
+    elif bbox.type == 'obb':
+        prefix = "[OBB]"
+        extra = ""
+    else:
+        prefix = "[Poly]"
+        extra = f" | {len(bbox.points or [])}pts"
+    return f"{prefix} ID{bbox.id} | Class: {bbox.class_id}{extra}"
+
+
+class BBoxListModel(QAbstractListModel):
+    """
+    右侧标注列表模型，直接绑定 LabelManager
+
+    作为 LabelManager 的监听者，把新增/删除/修改转换成单行的
+    rowsInserted / rowsRemoved / dataChanged，行文本在 data() 中按需生成。
+    """
+
+    def __init__(self, label_manager, parent=None):
+        super().__init__(parent)
+        self._labels = label_manager
+        label_manager.add_listener(self)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._labels)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        bboxes = self._labels.bboxes
+        row = index.row()
+        if row >= len(bboxes):
+            return None
+        return format_bbox_row(bboxes[row])
+
+    # ======================= LabelManager 监听 =======================
+
+    def labels_about_to_change(self, kind, row):
+        if kind == "insert":
+            self.beginInsertRows(QModelIndex(), row, row)
+        elif kind == "remove":
+            self.beginRemoveRows(QModelIndex(), row, row)
+        elif kind == "reset":
+            self.beginResetModel()
+
+    def labels_changed(self, kind, row):
+        if kind == "insert":
+            self.endInsertRows()
+        elif kind == "remove":
+            self.endRemoveRows()
+        elif kind == "reset":
+            self.endResetModel()
+        elif kind == "update":
+            idx = self.index(row)
+            self.dataChanged.emit(idx, idx, [Qt.DisplayRole])
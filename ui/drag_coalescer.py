@@ -0,0 +1,64 @@
+from PyQt5.QtCore import QElapsedTimer, QTimer
+
+# 一帧的时长（约 60 Hz）；同一图元一帧内的多次拖拽移动只应用最后一次
+FRAME_MS = 16
+
+
+class DragCoalescer:
+    """
+    拖拽时按帧合并几何更新，并把归一化坐标的同步推迟到拖拽结束
+
+    图元在 mouseMoveEvent 中调用 schedule(item, fn)：fn 应用最新的鼠标位置（重算几何、
+    移动控制点），距上次应用不足一帧时只记下最后一个 fn，到帧末再执行。
+    执行中改动了几何但未写回 bbox_data 的图元用 defer_sync() 登记，
+    commit()（拖拽结束或外部读取标注前）先执行挂起的更新再统一 _sync_to_yolo()。
+    """
+
+    def __init__(self):
+        self._pending = {}
+        self._unsynced = {}
+        self._clock = QElapsedTimer()
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+
+    def schedule(self, item, fn):
+        self._pending[id(item)] = fn
+        if self._timer.isActive():
+            return
+        elapsed = self._clock.elapsed() if self._clock.isValid() else FRAME_MS
+        if elapsed >= FRAME_MS:
+            self.flush()
+        else:
+            self._timer.start(FRAME_MS - elapsed)
+
+    def defer_sync(self, item):
+        self._unsynced[id(item)] = item
+
+    def flush(self):
+        """执行挂起的几何更新"""
+        self._timer.stop()
+        self._clock.start()
+        pending = self._pending
+        self._pending = {}
+        for fn in pending.values():
+            fn()
+
+    def commit(self):
+        """执行挂起的更新并把几何写回 bbox_data"""
+        if self._pending:
+            self.flush()
+        unsynced = self._unsynced
+        self._unsynced = {}
+        for item in unsynced.values():
+            item._sync_to_yolo()
+
+
+_coalescer = None
+
+
+def drag_coalescer() -> DragCoalescer:
+    global _coalescer
+    if _coalescer is None:
+        _coalescer = DragCoalescer()
+    return _coalescer
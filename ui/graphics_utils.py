@@ -2,6 +2,28 @@
 
 BBOX_ROOT_TYPES = None
 
+# 为 True 时只有选中的标注才持有控制点子图元，取消选中即释放
+_lazy_handles = True
+
+
+def set_lazy_handles(enabled: bool):
+    global _lazy_handles
+    _lazy_handles = bool(enabled)
+
+
+def wants_handles(item) -> bool:
+    """item 当前是否应该带有控制点"""
+    return not _lazy_handles or item.isSelected()
+
+
+def release_child_items(items):
+    """从父图元和场景中移除子图元（控制点等）"""
+    for child in list(items):
+        child.setParentItem(None)
+        scene = child.scene()
+        if scene is not None:
+            scene.removeItem(child)
+
 
 def _bbox_root_types():
     global BBOX_ROOT_TYPES
@@ -45,17 +67,24 @@ def pick_preferred_bbox_root(selected_items):
     )
 
 
-def select_only(item):
-    """Clear scene selection then select this item (or its parent for handles)."""
+def _deselect_others(item):
+    # 不经过 clearSelection：已选中的 item 若被短暂取消选中，按需创建的控制点
+    # （可能正是被按下的那个）会被释放
     scene = item.scene()
-    if scene is not None:
-        scene.clearSelection()
+    if scene is None:
+        return
+    for other in scene.selectedItems():
+        if other is not item:
+            other.setSelected(False)
+
+
+def select_only(item):
+    """Deselect everything else then select this item (or its parent for handles)."""
+    _deselect_others(item)
     item.setSelected(True)
 
 
 def select_only_parent(parent_item):
-    """Clear scene selection then select the parent bbox item."""
-    scene = parent_item.scene()
-    if scene is not None:
-        scene.clearSelection()
+    """Deselect everything else then select the parent bbox item."""
+    _deselect_others(parent_item)
     parent_item.setSelected(True)
@@ -0,0 +1,48 @@
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, Qt
+
+
+class ImageListModel(QAbstractListModel):
+    """
+    左侧图片列表的虚拟化模型
+
+    不为每张图片创建列表项：行文本在 data() 中通过 format_row(path, row) 按需生成，
+    只有视图实际绘制的行才会被计算；状态变化时用 refresh_row() 更新单行。
+    """
+
+    def __init__(self, format_row, parent=None):
+        super().__init__(parent)
+        self._format_row = format_row
+        self._paths = []
+
+    def set_images(self, paths):
+        self.beginResetModel()
+        self._paths = paths
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._paths)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if row >= len(self._paths):
+            return None
+        if role == Qt.DisplayRole:
+            return self._format_row(self._paths[row], row)
+        if role == Qt.ToolTipRole:
+            return str(self._paths[row])
+        return None
+
+    def refresh_row(self, row: int):
+        if 0 <= row < len(self._paths):
+            idx = self.index(row)
+            self.dataChanged.emit(idx, idx, [Qt.DisplayRole])
+
+    def refresh_all(self):
+        if self._paths:
+            self.dataChanged.emit(
+                self.index(0), self.index(len(self._paths) - 1), [Qt.DisplayRole]
+            )
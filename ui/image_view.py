@@ -1,8 +1,11 @@
-from PyQt5.QtWidgets import QGraphicsView, QGraphicsScene
+from PyQt5.QtWidgets import (
+    QGraphicsView, QGraphicsScene, QGraphicsSimpleTextItem, QGraphicsPixmapItem,
+)
 from PyQt5.QtCore import QRectF, pyqtSignal, Qt
-from PyQt5.QtGui import QWheelEvent, QColor, QBrush
+from PyQt5.QtGui import QWheelEvent, QColor, QBrush, QTransform
 
-from ui.graphics_utils import pick_preferred_bbox_root
+from ui.graphics_utils import pick_preferred_bbox_root, resolve_bbox_root
+from ui.tiled_image_item import TiledImageItem, TileLoader
 
 
 class ImageView(QGraphicsView):
@@ -18,15 +21,26 @@ class ImageView(QGraphicsView):
         self.scene.selectionChanged.connect(self.on_selection_changed)
 
         self.zoom_level = 1.0
+        self._fit_zoom = 1.0
+        self.image_item = None
+        self._placeholder_item = None
+        self._image_rect = None
+        self._tile_loader = None
+        self._tile_cache = None
         self.setDragMode(QGraphicsView.ScrollHandDrag)
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
 
         self.drawing_mode = False
         self._draw_controller = None
+        self._annotation_picker = None
 
     def set_draw_controller(self, controller):
         self._draw_controller = controller
 
+    def set_annotation_picker(self, picker):
+        """左键按下处没有标注图元时先调用 picker(scene_pos)，供合并绘制图层提升被点中的标注"""
+        self._annotation_picker = picker
+
     def set_drawing_mode(self, enabled: bool):
         self.drawing_mode = enabled
         if enabled:
@@ -38,32 +52,108 @@ class ImageView(QGraphicsView):
     def set_canvas_color(self, color_hex: str):
         self.setBackgroundBrush(QBrush(QColor(color_hex)))
 
+    def set_tile_cache(self, cache):
+        self._tile_cache = cache
+
+    def image_rect(self):
+        """当前图片在场景中的范围（原图像素）；未加载图片时为 None"""
+        return self._image_rect
+
+    def clear_image(self):
+        """移除图片与占位文字；标注图元由 MainWindow 的 SceneReconciler 管理，不在此清除"""
+        if self._tile_loader is not None:
+            self._tile_loader.cancel_all()
+        for item in (self.image_item, self._placeholder_item):
+            if item is not None:
+                self.scene.removeItem(item)
+        self.image_item = None
+        self._placeholder_item = None
+        self._image_rect = None
+
+    def _set_image_item(self, item, rect: QRectF):
+        item.setZValue(-1)
+        self.image_item = item
+        self._image_rect = rect
+        self.setSceneRect(rect)
+        self.fit_to_view()
+
+    def show_placeholder(self, text: str):
+        """图片加载完成前显示的占位文字"""
+        self.clear_image()
+        item = QGraphicsSimpleTextItem(text)
+        item.setBrush(QBrush(QColor("#94a3b8")))
+        self.scene.addItem(item)
+        self._placeholder_item = item
+        self.resetTransform()
+        self.zoom_level = 1.0
+        self.setSceneRect(item.boundingRect())
+        self.centerOn(item)
+
     def load_pixmap(self, pixmap):
         """加载图片（可选择是否清除场景）"""
-        self.scene.clear()
+        self.clear_image()
         pixmap_item = self.scene.addPixmap(pixmap)
-        pixmap_item.setZValue(-1)
-        self.setSceneRect(QRectF(pixmap.rect()))
-        self.fit_to_view()
+        self._set_image_item(pixmap_item, QRectF(pixmap.rect()))
+
+    def load_preview(self, pixmap, full_size):
+        """显示缩小的预览并拉伸到原图尺寸，场景坐标仍为原图像素"""
+        self.clear_image()
+        item = self.scene.addPixmap(pixmap)
+        item.setTransformationMode(Qt.SmoothTransformation)
+        item.setTransform(QTransform.fromScale(
+            full_size.width() / pixmap.width(), full_size.height() / pixmap.height()
+        ))
+        self._set_image_item(item, QRectF(0, 0, full_size.width(), full_size.height()))
+
+    def replace_preview(self, pixmap) -> bool:
+        """
+        用原图替换 load_preview 显示的预览，缩放与滚动位置不变
+
+        原图尺寸与预览时给出的不一致时不替换并返回 False。
+        """
+        item = self.image_item
+        if not isinstance(item, QGraphicsPixmapItem) or self._image_rect != QRectF(pixmap.rect()):
+            return False
+        item.setPixmap(pixmap)
+        item.setTransform(QTransform())
+        item.setTransformationMode(Qt.FastTransformation)
+        return True
+
+    def load_tiled(self, path, full_size, overview):
+        """以分块金字塔方式显示大图，场景坐标仍为原图像素"""
+        self.clear_image()
+        if self._tile_loader is None:
+            self._tile_loader = TileLoader(self._tile_cache, self)
+            self._tile_loader.tile_loaded.connect(self._on_tile_loaded)
+        item = TiledImageItem(path, full_size, overview, self._tile_loader)
+        self.scene.addItem(item)
+        self._set_image_item(item, QRectF(0, 0, full_size.width(), full_size.height()))
+
+    def _on_tile_loaded(self, key):
+        if isinstance(self.image_item, TiledImageItem):
+            self.image_item.on_tile_loaded(key)
+
+    def shutdown(self):
+        if self._tile_loader is not None:
+            self._tile_loader.shutdown()
 
     def load_pixmap_only(self, pixmap):
         """只加载图片，不清除现有的BBox项"""
-        for item in self.scene.items():
-            if item.type() == 14:
-                self.scene.removeItem(item)
-                break
+        if self.image_item is not None:
+            self.scene.removeItem(self.image_item)
 
         pixmap_item = self.scene.addPixmap(pixmap)
-        pixmap_item.setZValue(-1)
-        self.setSceneRect(QRectF(pixmap.rect()))
-        self.fit_to_view()
+        self._set_image_item(pixmap_item, QRectF(pixmap.rect()))
 
     def fit_to_view(self):
         """缩放图片以适应视图"""
         self.zoom_level = 1.0
         self.resetTransform()
-        self.fitInView(self.scene.itemsBoundingRect(), Qt.KeepAspectRatio)
+        # 切换图片时上一张的标注图元可能仍在场景中（等待复用），以图片范围为准
+        rect = self._image_rect if self._image_rect is not None else self.scene.itemsBoundingRect()
+        self.fitInView(rect, Qt.KeepAspectRatio)
         self.zoom_level = self.transform().m11()
+        self._fit_zoom = self.zoom_level
 
     def wheelEvent(self, event: QWheelEvent):
         """鼠标滚轮缩放"""
@@ -74,7 +164,8 @@ class ImageView(QGraphicsView):
         zoom_factor = 1.1 if delta > 0 else 0.9
 
         new_zoom = self.zoom_level * zoom_factor
-        if new_zoom < 0.2 or new_zoom > 5.0:
+        # 大图适应视图后缩放比可能远小于 0.2，下限不低于适应视图时的比例
+        if new_zoom < min(0.2, self._fit_zoom) or new_zoom > 5.0:
             return
 
         self.zoom_level = new_zoom
@@ -88,21 +179,40 @@ class ImageView(QGraphicsView):
     def mousePressEvent(self, event):
         if self.drawing_mode and self._draw_controller and event.button() == Qt.LeftButton:
             scene_pos = self.mapToScene(event.pos())
-            self._draw_controller.add_point(scene_pos)
+            if self._draw_controller.freehand:
+                self._draw_controller.begin_stroke(scene_pos)
+            else:
+                self._draw_controller.add_point(scene_pos)
             event.accept()
             return
+        if self._annotation_picker is not None and event.button() == Qt.LeftButton:
+            if not any(resolve_bbox_root(item) is not None for item in self.items(event.pos())):
+                # 被提升的图元此时已在场景中，随后的默认处理会把按下事件交给它
+                self._annotation_picker(self.mapToScene(event.pos()))
         super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event):
         if self.drawing_mode and self._draw_controller:
             scene_pos = self.mapToScene(event.pos())
-            self._draw_controller.update_cursor(scene_pos)
+            if self._draw_controller.stroking:
+                self._draw_controller.extend_stroke(scene_pos)
+            else:
+                self._draw_controller.update_cursor(scene_pos)
             event.accept()
             return
         super().mouseMoveEvent(event)
 
+    def mouseReleaseEvent(self, event):
+        if (self.drawing_mode and self._draw_controller and event.button() == Qt.LeftButton
+                and self._draw_controller.stroking):
+            self._draw_controller.end_stroke(self.mapToScene(event.pos()))
+            event.accept()
+            return
+        super().mouseReleaseEvent(event)
+
     def mouseDoubleClickEvent(self, event):
-        if self.drawing_mode and self._draw_controller and event.button() == Qt.LeftButton:
+        if (self.drawing_mode and self._draw_controller and event.button() == Qt.LeftButton
+                and not self._draw_controller.freehand):
             scene_pos = self.mapToScene(event.pos())
             if self._draw_controller.try_close_at(scene_pos):
                 event.accept()
@@ -1,43 +1,58 @@
 from PyQt5.QtWidgets import (
-    QMainWindow, QFileDialog, QListWidget, QMessageBox,
+    QMainWindow, QFileDialog, QListView, QMessageBox,
     QAction, QDockWidget, QPushButton, QWidget, QActionGroup,
-    QVBoxLayout, QHBoxLayout, QListWidgetItem, QSpinBox, QLabel, QDialog, QRadioButton, QButtonGroup, QFrame
+    QVBoxLayout, QHBoxLayout, QSpinBox, QLabel, QDialog, QRadioButton, QButtonGroup, QFrame
 )
-from PyQt5.QtCore import QRectF, pyqtSignal, Qt, QTimer, QPointF
-from PyQt5.QtGui import QFont, QKeySequence
+from PyQt5.QtCore import QRectF, pyqtSignal, Qt, QTimer, QPointF, QItemSelectionModel
+from PyQt5.QtGui import QFont, QKeySequence, QPixmap
 from pathlib import Path
-import math
+import os
 
 from ui.image_view import ImageView
 from ui.bbox_item import BBoxItem
 from ui.obb_item import OBBItem
 from ui.polygon_item import PolygonItem
 from ui.polygon_draw_controller import PolygonDrawController
-from ui.settings_dialog import SettingsDialog
+from ui.image_list_model import ImageListModel
+from ui.bbox_list_model import BBoxListModel
+from ui.scene_reconciler import SceneReconciler
+from ui.drag_coalescer import drag_coalescer
 from core.label_manager import LabelManager
+from core.label_status import LabelStatusIndex
 from core.bbox import BBox
-from core.yolo_io import load_yolo_txt, save_yolo_txt
 from core.settings_manager import (
-    load_all, ShortcutKey, get_shortcut, key_event_matches,
+    load_all, ShortcutKey, get_shortcut, compile_shortcuts, event_combo,
     load_path_prefs, save_path_pref,
     KEY_SAVE_FOLDER, KEY_LAST_IMAGE_DIR, KEY_LAST_FOLDER,
 )
-from core.undo_stack import UndoStack
-from core.bbox_clone import clone_bboxes
-from ui.graphics_utils import pick_preferred_bbox_root, resolve_bbox_root
-from utils.image_loader import load_image
+from core.undo_stack import Change, UndoStack
+from core.bbox_clone import clone_bbox
+from core import tracing
+from ui.graphics_utils import pick_preferred_bbox_root, resolve_bbox_root, set_lazy_handles
+from utils.image_cache import LRUCache, ImagePrefetcher
+from utils.image_loader import is_display_cached
+from utils.async_loader import (
+    ImageLoadPipeline, IndexRefresher, LoadResult, load_image_and_labels,
+)
 from ui.theme_manager import apply_theme, get_theme_ids, get_theme_name, get_current_theme_id
 from i18n.translator import tr, set_language, on_language_changed
 from PyQt5.QtWidgets import QApplication
 
+# 依赖 numpy / sqlite3 的模块与设置对话框在首次使用时才导入（见 utils.startup.preload_deferred）
+
+# 两次翻页间隔小于此值（ms）视为连续翻页（如按住方向键），中间的图片不加载
+NAV_SETTLE_MS = 150
+
 
 class MainWindow(QMainWindow):
 
     item_selected = pyqtSignal(object)
 
-    def __init__(self):
+    def __init__(self, settings=None):
+        """settings：启动时已打开的 QSettings，与其它启动读取共用"""
         super().__init__()
-        self._app_settings = load_all()
+        self._app_settings = load_all(settings)
+        set_lazy_handles(self._app_settings.lazy_handles)
         self.setWindowTitle(tr("app.title"))
 
         self.image_view = ImageView()
@@ -49,9 +64,15 @@ class MainWindow(QMainWindow):
         self.image_list = []
         self.current_image_index = 0
         self.save_folder_path = None
-        self.bbox_items = {}
+        self._scene_reconciler = SceneReconciler(self.image_view.scene, self._register_bbox_item)
+        # id -> 图元，由 _scene_reconciler 维护，不要重新赋值
+        self.bbox_items = self._scene_reconciler.items
+        self._scene_reconciler.layer_threshold = self._app_settings.layer_threshold
+        self.image_view.set_annotation_picker(self._pick_layer_annotation)
         self.theme_actions = {}
         self._shortcut_actions = {}
+        # (key, modifiers) -> ShortcutKey，设置变化时由 _apply_shortcuts 重新生成
+        self._shortcut_table = compile_shortcuts(self._app_settings.shortcuts)
         self.polygon_draw_controller = PolygonDrawController()
         self._current_img_rect = QRectF(0, 0, 640, 480)
 
@@ -60,8 +81,33 @@ class MainWindow(QMainWindow):
 
         self._ui_refs = {}
         self._syncing_selection = False
+        self._syncing_image_list = False
         self._undo_stack = UndoStack()
-        self._image_dirty = False
+        self._dirty_images = set()
+        self._label_status = LabelStatusIndex()
+        self._image_cache = LRUCache(self._app_settings.image_cache_mb * 1024 * 1024)
+        self._prefetcher = ImagePrefetcher(
+            self._image_cache,
+            self._app_settings.prefetch_ahead,
+            self._app_settings.prefetch_behind,
+        )
+        self._load_pipeline = ImageLoadPipeline(self._image_cache, self)
+        self.image_view.set_tile_cache(self._image_cache)
+        self._apply_tiled_threshold()
+        self._apply_simplify_on_load()
+        self._load_pipeline.progressive = self._app_settings.progressive_load
+        self._load_pipeline.loaded.connect(self._on_image_loaded)
+        self._loading_path = None
+        self._load_started = 0
+        # 连续翻页：首次立即加载，之后只更新序号，停下 NAV_SETTLE_MS 后再加载停留的那张
+        self._nav_timer = QTimer(self)
+        self._nav_timer.setSingleShot(True)
+        self._nav_timer.setInterval(NAV_SETTLE_MS)
+        self._nav_timer.timeout.connect(self._on_nav_settled)
+        self._nav_pending = False
+        self._trace_output = tracing.configure_from_env()
+        self._index_refresher = IndexRefresher(self)
+        self._index_refresher.stats_ready.connect(self._on_dataset_stats)
 
         self._create_left_panel()
         self._create_right_panel()
@@ -73,14 +119,16 @@ class MainWindow(QMainWindow):
         self.polygon_draw_controller.finished.connect(self._on_polygon_draw_finished)
         self.polygon_draw_controller.cancelled.connect(self._on_polygon_draw_cancelled)
         self.image_view.bbox_selected.connect(self._on_scene_selection_changed)
-        self.bbox_list.currentRowChanged.connect(self._on_bbox_list_row_changed)
+        self.bbox_list.selectionModel().currentRowChanged.connect(
+            self._on_bbox_list_current_changed
+        )
 
         on_language_changed(self._on_language_changed)
 
-        self._restore_path_prefs()
+        self._restore_path_prefs(settings)
 
-    def _restore_path_prefs(self):
-        prefs = load_path_prefs()
+    def _restore_path_prefs(self, settings=None):
+        prefs = load_path_prefs(settings)
         save_folder = prefs.get("save_folder")
         if save_folder:
             self.save_folder_path = Path(save_folder)
@@ -111,8 +159,10 @@ class MainWindow(QMainWindow):
             (ShortcutKey.RECT, lambda: self.radio_rect.setChecked(True)),
             (ShortcutKey.OBB, lambda: self.radio_obb.setChecked(True)),
             (ShortcutKey.POLYGON, lambda: self.radio_polygon.setChecked(True)),
+            (ShortcutKey.FREEHAND, lambda: self.radio_freehand.setChecked(True)),
             (ShortcutKey.SAVE, lambda: self.save_txt(show_toast=True)),
             (ShortcutKey.UNDO, self._undo),
+            (ShortcutKey.REDO, self._redo),
             (ShortcutKey.ADD, self._shortcut_add_bbox),
             (ShortcutKey.DELETE, self._shortcut_delete),
             (ShortcutKey.PREV_IMAGE, self._shortcut_prev_image),
@@ -150,6 +200,7 @@ class MainWindow(QMainWindow):
             self.show_next_image()
 
     def _apply_shortcuts(self):
+        self._shortcut_table = compile_shortcuts(self._app_settings.shortcuts)
         for key, action in self._shortcut_actions.items():
             seq = get_shortcut(self._app_settings, key)
             action.setShortcut(QKeySequence(seq))
@@ -160,15 +211,12 @@ class MainWindow(QMainWindow):
                 if self.polygon_draw_controller.remove_last_point():
                     event.accept()
                     return
-            if key_event_matches(
-                event, get_shortcut(self._app_settings, ShortcutKey.POLYGON_FINISH)
-            ):
+            shortcut = self._shortcut_table.get(event_combo(event))
+            if shortcut is ShortcutKey.POLYGON_FINISH:
                 self.polygon_draw_controller.finish()
                 event.accept()
                 return
-            if key_event_matches(
-                event, get_shortcut(self._app_settings, ShortcutKey.POLYGON_CANCEL)
-            ):
+            if shortcut is ShortcutKey.POLYGON_CANCEL:
                 self.polygon_draw_controller.cancel()
                 event.accept()
                 return
@@ -182,9 +230,14 @@ class MainWindow(QMainWindow):
         layout.setContentsMargins(12, 12, 12, 12)
         layout.setSpacing(8)
 
-        self.image_list_widget = QListWidget()
-        self.image_list_widget.currentRowChanged.connect(self.on_image_list_row_changed)
-        layout.addWidget(self.image_list_widget)
+        self.image_list_model = ImageListModel(self._format_list_item_text, self)
+        self.image_list_view = QListView()
+        self.image_list_view.setUniformItemSizes(True)
+        self.image_list_view.setModel(self.image_list_model)
+        self.image_list_view.selectionModel().currentRowChanged.connect(
+            self._on_image_list_current_changed
+        )
+        layout.addWidget(self.image_list_view)
 
         dock.setWidget(panel)
         self.addDockWidget(0x1, dock)
@@ -229,7 +282,10 @@ class MainWindow(QMainWindow):
 
         layout.addWidget(self._make_separator())
 
-        self.bbox_list = QListWidget()
+        self.bbox_list_model = BBoxListModel(self.label_manager, self)
+        self.bbox_list = QListView()
+        self.bbox_list.setUniformItemSizes(True)
+        self.bbox_list.setModel(self.bbox_list_model)
         self.bbox_list_label = QLabel(tr("label.bbox_list"))
         layout.addWidget(self.bbox_list_label)
         layout.addWidget(self.bbox_list)
@@ -242,13 +298,16 @@ class MainWindow(QMainWindow):
         self.radio_rect = QRadioButton(tr("mode.rect"))
         self.radio_obb = QRadioButton(tr("mode.obb"))
         self.radio_polygon = QRadioButton(tr("mode.polygon"))
+        self.radio_freehand = QRadioButton(tr("mode.freehand"))
         self.radio_rect.setChecked(True)
         self.mode_group.addButton(self.radio_rect, 0)
         self.mode_group.addButton(self.radio_obb, 1)
         self.mode_group.addButton(self.radio_polygon, 2)
+        self.mode_group.addButton(self.radio_freehand, 3)
         mode_layout.addWidget(self.radio_rect)
         mode_layout.addWidget(self.radio_obb)
         mode_layout.addWidget(self.radio_polygon)
+        mode_layout.addWidget(self.radio_freehand)
         self.mode_group.buttonClicked.connect(self._on_mode_changed)
         layout.addLayout(mode_layout)
 
@@ -262,6 +321,10 @@ class MainWindow(QMainWindow):
         bbox_btn_layout.addWidget(btn_del)
         layout.addLayout(bbox_btn_layout)
 
+        btn_simplify = QPushButton(tr("btn.simplify_polygon"))
+        btn_simplify.clicked.connect(self.simplify_selected_polygon)
+        layout.addWidget(btn_simplify)
+
         class_layout = QHBoxLayout()
         self.class_id_label = QLabel(tr("label.class_id"))
         class_layout.addWidget(self.class_id_label)
@@ -292,6 +355,7 @@ class MainWindow(QMainWindow):
             "btn_fit_view": btn_fit_view,
             "btn_add": btn_add,
             "btn_del": btn_del,
+            "btn_simplify": btn_simplify,
             "btn_save": btn_save,
         }
 
@@ -315,6 +379,11 @@ class MainWindow(QMainWindow):
         self.action_open_folder.triggered.connect(self.open_folder)
         self.file_menu.addAction(self.action_open_folder)
 
+        self.file_menu.addSeparator()
+        self.action_dataset_stats = QAction(tr("menu.dataset_stats"), self)
+        self.action_dataset_stats.triggered.connect(self.show_dataset_stats)
+        self.file_menu.addAction(self.action_dataset_stats)
+
         self.theme_menu = menu.addMenu(tr("menu.theme"))
         theme_group = QActionGroup(self)
         theme_group.setExclusive(True)
@@ -333,7 +402,31 @@ class MainWindow(QMainWindow):
         self.action_settings.triggered.connect(self._open_settings_dialog)
         menu.addAction(self.action_settings)
 
+        self.debug_menu = menu.addMenu(tr("menu.debug"))
+        self.action_trace = QAction(tr("menu.trace_enabled"), self)
+        self.action_trace.setCheckable(True)
+        self.action_trace.setChecked(tracing.is_enabled())
+        self.action_trace.toggled.connect(tracing.set_enabled)
+        self.debug_menu.addAction(self.action_trace)
+        self.action_trace_export = QAction(tr("menu.trace_export"), self)
+        self.action_trace_export.triggered.connect(self._export_trace)
+        self.debug_menu.addAction(self.action_trace_export)
+
+    def _export_trace(self):
+        path, _ = QFileDialog.getSaveFileName(
+            self, tr("menu.trace_export"), "trace.json", "Chrome trace (*.json)"
+        )
+        if not path:
+            return
+        try:
+            count = tracing.export_chrome_trace(path)
+        except OSError as e:
+            QMessageBox.warning(self, tr("msg.error"), str(e))
+            return
+        self._show_toast(tr("toast.trace_exported", count=count))
+
     def _open_settings_dialog(self):
+        from ui.settings_dialog import SettingsDialog
         dlg = SettingsDialog(self)
         dlg.settings_changed.connect(self._apply_settings)
         dlg.exec_()
@@ -347,6 +440,30 @@ class MainWindow(QMainWindow):
             self.retranslate_ui()
         self._apply_shortcuts()
         self._update_periodic_timer()
+        self._image_cache.set_max_bytes(settings.image_cache_mb * 1024 * 1024)
+        self._prefetcher.set_window(settings.prefetch_ahead, settings.prefetch_behind)
+        self._apply_tiled_threshold()
+        self._apply_simplify_on_load()
+        self._load_pipeline.progressive = settings.progressive_load
+        self._apply_lazy_handles()
+        if settings.layer_threshold != self._scene_reconciler.layer_threshold:
+            self._scene_reconciler.layer_threshold = settings.layer_threshold
+            self._rebuild_scene_from_bboxes()
+            self._clear_bbox_selection()
+
+    def _apply_lazy_handles(self):
+        set_lazy_handles(self._app_settings.lazy_handles)
+        for item in self.bbox_items.values():
+            item.refresh_handles()
+
+    def _apply_tiled_threshold(self):
+        min_pixels = self._app_settings.tiled_threshold_mp * 1000 * 1000
+        self._load_pipeline.tiled_min_pixels = min_pixels
+        self._prefetcher.tiled_min_pixels = min_pixels
+
+    def _apply_simplify_on_load(self):
+        s = self._app_settings
+        self._load_pipeline.simplify_tolerance = s.simplify_tolerance_px if s.simplify_on_load else 0.0
 
     def _update_periodic_timer(self):
         if self._app_settings.periodic_auto_save:
@@ -366,24 +483,30 @@ class MainWindow(QMainWindow):
         self.file_menu.setTitle(tr("menu.file"))
         self.action_open_img.setText(tr("menu.open_image"))
         self.action_open_folder.setText(tr("menu.open_folder"))
+        self.action_dataset_stats.setText(tr("menu.dataset_stats"))
         self.theme_menu.setTitle(tr("menu.theme"))
         for theme_id, action in self.theme_actions.items():
             action.setText(get_theme_name(theme_id))
         self.action_settings.setText(tr("menu.settings"))
+        self.debug_menu.setTitle(tr("menu.debug"))
+        self.action_trace.setText(tr("menu.trace_enabled"))
+        self.action_trace_export.setText(tr("menu.trace_export"))
         self._ui_refs["btn_set_save_path"].setText(tr("btn.set_save_path"))
         self._ui_refs["btn_prev"].setText(tr("btn.prev_image"))
         self._ui_refs["btn_next"].setText(tr("btn.next_image"))
         self._ui_refs["btn_fit_view"].setText(tr("btn.fit_view"))
         self._ui_refs["btn_add"].setText(tr("btn.add"))
         self._ui_refs["btn_del"].setText(tr("btn.delete"))
+        self._ui_refs["btn_simplify"].setText(tr("btn.simplify_polygon"))
         self._ui_refs["btn_save"].setText(tr("btn.save_yolo"))
         self.bbox_list_label.setText(tr("label.bbox_list"))
         self.radio_rect.setText(tr("mode.rect"))
         self.radio_obb.setText(tr("mode.obb"))
         self.radio_polygon.setText(tr("mode.polygon"))
+        self.radio_freehand.setText(tr("mode.freehand"))
         self.class_id_label.setText(tr("label.class_id"))
         if self.image_list:
-            self._refresh_image_list()
+            self.image_list_model.refresh_all()
 
     def _update_save_path_label(self):
         if self.save_folder_path:
@@ -402,39 +525,96 @@ class MainWindow(QMainWindow):
             self.polygon_draw_controller.cancel()
 
     def _get_image_rect(self):
-        pixmap_items = [
-            item for item in self.image_view.scene.items()
-            if type(item).__name__ == 'QGraphicsPixmapItem'
-        ]
-        if pixmap_items:
-            pixmap = pixmap_items[0].pixmap()
-            return QRectF(0, 0, pixmap.width(), pixmap.height())
+        img_rect = self.image_view.image_rect()
+        if img_rect is not None:
+            return QRectF(img_rect)
         return self._current_img_rect
 
-    def _push_undo_snapshot(self):
+    def _push_undo(self, changes):
+        self._mark_dirty()
+        drag_coalescer().commit()
+        self._undo_stack.push(changes)
+
+    def _flush_pending_edit(self):
+        """写回延迟同步的拖拽结果并结束未完成的编辑记录，之后再读取或修改标注"""
+        drag_coalescer().commit()
+        self._undo_stack.commit_pending()
+
+    def _on_item_edit_start(self, item):
         self._mark_dirty()
-        self._undo_stack.push_snapshot(self.label_manager.bboxes)
+        drag_coalescer().commit()
+        bbox = item.bbox_data
+        self._undo_stack.begin_modify(bbox, self._row_for_bbox_id(bbox.id))
 
     def _undo(self):
-        snapshot = self._undo_stack.undo()
-        if snapshot is None:
+        with tracing.span("history.undo"):
+            if self._is_loading():
+                return
+            drag_coalescer().commit()
+            command = self._undo_stack.undo()
+            if command is None:
+                return
+            changes = list(reversed(command.changes))
+            self._apply_bbox_states(changes, [c.before for c in changes])
+            self._after_history_step(command)
+
+    def _redo(self):
+        with tracing.span("history.redo"):
+            if self._is_loading():
+                return
+            drag_coalescer().commit()
+            command = self._undo_stack.redo()
+            if command is None:
+                return
+            self._apply_bbox_states(command.changes, [c.after for c in command.changes])
+            self._after_history_step(command)
+
+    def _apply_bbox_states(self, changes, states):
+        """按顺序恢复一组标注；连续的删除合并为一次 remove_many，只重建一次行索引"""
+        pending = []
+        for change, state in zip(changes, states):
+            if state is None:
+                pending.append(change.bbox_id)
+                continue
+            self._remove_bbox_ids(pending)
+            pending = []
+            self._apply_bbox_state(change, state)
+        self._remove_bbox_ids(pending)
+
+    def _remove_bbox_ids(self, bbox_ids):
+        if not bbox_ids:
             return
-        self.label_manager.bboxes = clone_bboxes(snapshot)
-        self._rebuild_scene_from_bboxes()
-        self.refresh_bbox_list()
-        if self.label_manager.bboxes:
-            self._select_bbox_by_id(self.label_manager.bboxes[0].id)
-        else:
-            self._clear_bbox_selection()
+        self.label_manager.remove_many(bbox_ids)
+        for bbox_id in bbox_ids:
+            self._scene_reconciler.remove(bbox_id)
+
+    def _apply_bbox_state(self, change, state):
+        """把单个标注恢复为 state，只更新该标注的图元"""
+        # 历史记录中的对象保持不变，场景编辑的是副本
+        bbox = clone_bbox(state)
+        if self.label_manager.replace(bbox) < 0:
+            self.label_manager.insert(change.row, bbox)
+        self._scene_reconciler.sync(bbox.id, bbox, self._get_image_rect())
+
+    def _after_history_step(self, command):
+        self._mark_dirty()
+        for change in reversed(command.changes):
+            if self.label_manager.get(change.bbox_id) is not None:
+                self._select_bbox_by_id(change.bbox_id)
+                return
+        self._clear_bbox_selection()
 
     def _register_bbox_item(self, item):
-        item.on_edit_start = self._push_undo_snapshot
+        item.on_edit_start = lambda: self._on_item_edit_start(item)
 
     def _bbox_item_for_scene_item(self, item):
         if item is None:
             return None
         root = resolve_bbox_root(item)
-        if root is not None and root in self.bbox_items.values():
+        if root is None or root.bbox_data is None:
+            return None
+        # bbox_data.id 即图元到 id 的反向索引
+        if self.bbox_items.get(root.bbox_data.id) is root:
             return root
         return None
 
@@ -448,29 +628,24 @@ class MainWindow(QMainWindow):
         return None
 
     def _row_for_bbox_id(self, bbox_id):
-        for i, bbox in enumerate(self.label_manager.bboxes):
-            if bbox.id == bbox_id:
-                return i
-        return -1
+        return self.label_manager.row_of(bbox_id)
 
     def _select_bbox_by_id(self, bbox_id):
-        if bbox_id not in self.bbox_items:
-            return
         row = self._row_for_bbox_id(bbox_id)
         if row < 0:
             return
 
         self._syncing_selection = True
         try:
-            gfx = self.bbox_items[bbox_id]
+            gfx = self._scene_reconciler.promote_only(bbox_id, self._get_image_rect())
+            if gfx is None:
+                return
             self.image_view.scene.blockSignals(True)
             self.image_view.scene.clearSelection()
             gfx.setSelected(True)
             self.image_view.scene.blockSignals(False)
 
-            self.bbox_list.blockSignals(True)
-            self.bbox_list.setCurrentRow(row)
-            self.bbox_list.blockSignals(False)
+            self._set_bbox_list_row(row)
 
             bbox = self.label_manager.bboxes[row]
             self.class_id_spinbox.blockSignals(True)
@@ -485,31 +660,19 @@ class MainWindow(QMainWindow):
             self.image_view.scene.blockSignals(True)
             self.image_view.scene.clearSelection()
             self.image_view.scene.blockSignals(False)
-            self.bbox_list.blockSignals(True)
-            self.bbox_list.setCurrentRow(-1)
-            self.bbox_list.blockSignals(False)
+            self._scene_reconciler.promote_only(None, self._get_image_rect())
+            self._set_bbox_list_row(-1)
         finally:
             self._syncing_selection = False
 
-    def _sync_list_from_scene(self):
-        bbox_id = self._selected_bbox_id()
-        if bbox_id is None:
-            return
-        row = self._row_for_bbox_id(bbox_id)
-        if row >= 0 and self.bbox_list.currentRow() != row:
-            self.bbox_list.blockSignals(True)
-            self.bbox_list.setCurrentRow(row)
-            self.bbox_list.blockSignals(False)
-
     def _on_scene_selection_changed(self, bbox_item):
         if self._syncing_selection:
             return
         if bbox_item is None:
             self._syncing_selection = True
             try:
-                self.bbox_list.blockSignals(True)
-                self.bbox_list.setCurrentRow(-1)
-                self.bbox_list.blockSignals(False)
+                self._set_bbox_list_row(-1)
+                self._scene_reconciler.promote_only(None, self._get_image_rect())
             finally:
                 self._syncing_selection = False
             return
@@ -518,6 +681,32 @@ class MainWindow(QMainWindow):
             return
         self._select_bbox_by_id(gfx.bbox_data.id)
 
+    def _pick_layer_annotation(self, scene_pos):
+        """合并绘制模式下点中图层上的标注：先提升为图元，按下事件随后交给它"""
+        if self._is_loading() or self.image_view.drawing_mode:
+            return
+        bbox_id = self._scene_reconciler.hit_test(scene_pos)
+        if bbox_id is not None:
+            self._select_bbox_by_id(bbox_id)
+
+    def _set_bbox_list_row(self, row):
+        """只改列表的当前行，不触发 _on_bbox_list_row_changed"""
+        syncing = self._syncing_selection
+        self._syncing_selection = True
+        try:
+            selection = self.bbox_list.selectionModel()
+            if row < 0:
+                selection.clear()
+            else:
+                selection.setCurrentIndex(
+                    self.bbox_list_model.index(row), QItemSelectionModel.ClearAndSelect
+                )
+        finally:
+            self._syncing_selection = syncing
+
+    def _on_bbox_list_current_changed(self, current, _previous):
+        self._on_bbox_list_row_changed(current.row())
+
     def _on_bbox_list_row_changed(self, row):
         if self._syncing_selection:
             return
@@ -526,78 +715,28 @@ class MainWindow(QMainWindow):
         bbox_id = self.label_manager.bboxes[row].id
         self._select_bbox_by_id(bbox_id)
 
+    @tracing.traced("scene.rebuild")
     def _rebuild_scene_from_bboxes(self):
-        pixmap_items = [
-            item for item in self.image_view.scene.items()
-            if type(item).__name__ == 'QGraphicsPixmapItem'
-        ]
-        if not pixmap_items:
+        img_rect = self.image_view.image_rect()
+        if img_rect is None:
             return
 
-        pixmap = pixmap_items[0].pixmap()
-        img_rect = QRectF(0, 0, pixmap.width(), pixmap.height())
+        img_rect = QRectF(img_rect)
         self._current_img_rect = img_rect
-
-        for gfx in list(self.bbox_items.values()):
-            self.image_view.scene.removeItem(gfx)
-        self.bbox_items.clear()
-
-        for bbox in self.label_manager.bboxes:
-            item = self._create_gfx_for_bbox(bbox, img_rect)
-            if item is not None:
-                self.image_view.scene.addItem(item)
-                self.bbox_items[bbox.id] = item
-
-    def _create_gfx_for_bbox(self, bbox, img_rect):
-        if bbox.type == 'rect':
-            pixel_x_center = bbox.x_center * img_rect.width()
-            pixel_y_center = bbox.y_center * img_rect.height()
-            pixel_w = bbox.width * img_rect.width()
-            pixel_h = bbox.height * img_rect.height()
-            x = pixel_x_center - pixel_w / 2
-            y = pixel_y_center - pixel_h / 2
-            rect = QRectF(0, 0, pixel_w, pixel_h)
-            item = BBoxItem(rect, bbox)
-            item.setPos(x, y)
-            item.set_image_rect(img_rect)
-            self._register_bbox_item(item)
-            return item
-        if bbox.type == 'obb':
-            img_w = img_rect.width()
-            img_h = img_rect.height()
-            px = [p[0] * img_w for p in bbox.points]
-            py = [p[1] * img_h for p in bbox.points]
-            cx = sum(px) / 4
-            cy = sum(py) / 4
-            w = math.hypot(px[1] - px[0], py[1] - py[0])
-            h = math.hypot(px[2] - px[1], py[2] - py[1])
-            angle_rad = math.atan2(py[1] - py[0], px[1] - px[0])
-            angle = math.degrees(angle_rad)
-            item = OBBItem(QPointF(cx, cy), w, h, angle, bbox)
-            item.set_image_rect(img_rect)
-            self._register_bbox_item(item)
-            return item
-        if bbox.type == 'polygon':
-            item = PolygonItem.from_bbox(bbox, img_rect)
-            self._register_bbox_item(item)
-            return item
-        return None
+        self._scene_reconciler.reconcile(self.label_manager.bboxes, img_rect)
 
     def _on_polygon_draw_finished(self, scene_points):
         self.image_view.set_drawing_mode(False)
-        self._push_undo_snapshot()
-        bbox_id = len(self.label_manager.bboxes)
+        bbox_id = self.label_manager.next_id()
         class_id = self.class_id_spinbox.value()
         bbox = BBox(bbox_id, class_id, type='polygon', points=[])
         self.label_manager.add(bbox)
 
         item = PolygonItem(scene_points, bbox)
         item.set_image_rect(self._current_img_rect)
-        self._register_bbox_item(item)
-        self.image_view.scene.addItem(item)
-        self.bbox_items[bbox_id] = item
+        self._scene_reconciler.add_item(bbox_id, item)
+        self._push_undo([Change(bbox_id, len(self.label_manager.bboxes) - 1, None, clone_bbox(bbox))])
 
-        self.refresh_bbox_list()
         self._select_bbox_by_id(bbox_id)
 
     def _on_polygon_draw_cancelled(self):
@@ -605,6 +744,7 @@ class MainWindow(QMainWindow):
 
     def _apply_theme(self, theme_id):
         apply_theme(QApplication.instance(), self, theme_id)
+        self._scene_reconciler.layer.refresh_theme_colors()
         for tid, action in self.theme_actions.items():
             action.setChecked(tid == theme_id)
         for tid, action in self.theme_actions.items():
@@ -619,6 +759,10 @@ class MainWindow(QMainWindow):
             self.save_folder_path = Path(folder)
             save_path_pref(KEY_SAVE_FOLDER, folder)
             self._update_save_path_label()
+            self._index_refresher.refresh(self.save_folder_path)
+            if self.image_list:
+                self._label_status.scan(self.save_folder_path)
+                self._refresh_image_list()
 
     def open_image(self):
         if not self.save_folder_path:
@@ -647,60 +791,68 @@ class MainWindow(QMainWindow):
         self._update_nav_label()
 
     def open_folder(self):
-        if not self.save_folder_path:
-            QMessageBox.warning(
-                self, tr("msg.warning"), tr("msg.set_save_path_first")
-            )
-            return
+        with tracing.span("folder.open"):
+            if not self.save_folder_path:
+                QMessageBox.warning(
+                    self, tr("msg.warning"), tr("msg.set_save_path_first")
+                )
+                return
 
-        start_dir = self._dialog_start_dir(KEY_LAST_FOLDER)
-        folder = QFileDialog.getExistingDirectory(
-            self, tr("dialog.select_folder"), start_dir
-        )
-        if not folder:
-            return
+            start_dir = self._dialog_start_dir(KEY_LAST_FOLDER)
+            folder = QFileDialog.getExistingDirectory(
+                self, tr("dialog.select_folder"), start_dir
+            )
+            if not folder:
+                return
 
-        folder_path = Path(folder)
-        save_path_pref(KEY_LAST_FOLDER, folder)
-        image_exts = {".jpg", ".jpeg", ".png", ".bmp"}
-        self.image_list = sorted([
-            f for f in folder_path.iterdir()
-            if f.suffix.lower() in image_exts
-        ])
+            folder_path = Path(folder)
+            save_path_pref(KEY_LAST_FOLDER, folder)
+            image_exts = {".jpg", ".jpeg", ".png", ".bmp"}
+            with tracing.span("folder.scan"), os.scandir(folder_path) as it:
+                self.image_list = sorted([
+                    folder_path / entry.name for entry in it
+                    if os.path.splitext(entry.name)[1].lower() in image_exts
+                ])
+
+            if not self.image_list:
+                QMessageBox.warning(self, tr("msg.warning"), tr("msg.no_images_in_folder"))
+                return
 
-        if not self.image_list:
-            QMessageBox.warning(self, tr("msg.warning"), tr("msg.no_images_in_folder"))
-            return
+            if self.current_image_path:
+                self._maybe_save_before_nav()
 
-        if self.current_image_path:
-            self._maybe_save_before_nav()
+            self.current_folder_path = folder_path
+            self.current_image_index = 0
+            with tracing.span("folder.label_status"):
+                self._label_status.scan(self.save_folder_path)
+            self._index_refresher.refresh(self.save_folder_path)
+            self._load_image(self.image_list[0])
+            self._update_nav_label()
+            with tracing.span("folder.image_list"):
+                self._refresh_image_list()
 
-        self.current_folder_path = folder_path
-        self.current_image_index = 0
-        self._load_image(self.image_list[0])
-        self._update_nav_label()
-        self._refresh_image_list()
+    def _is_image_dirty(self, img_path) -> bool:
+        return img_path is not None and img_path in self._dirty_images
 
     def _mark_dirty(self):
-        if not self._image_dirty:
-            self._image_dirty = True
+        if self.current_image_path is not None:
+            self._dirty_images.add(self.current_image_path)
         if self.image_list:
             self._refresh_image_list_item(self.current_image_index)
 
     def _clear_dirty(self):
-        self._image_dirty = False
+        self._dirty_images.discard(self.current_image_path)
         if self.image_list:
             self._refresh_image_list_item(self.current_image_index)
 
     def _has_labeled_txt(self, img_path: Path) -> bool:
         if not self.save_folder_path:
             return False
-        txt_path = self.save_folder_path / img_path.with_suffix(".txt").name
-        return txt_path.is_file() and txt_path.stat().st_size > 0
+        return self._label_status.is_labeled(img_path.with_suffix(".txt").name)
 
     def _format_list_item_text(self, img_path: Path, index: int) -> str:
         name = img_path.name
-        if index == self.current_image_index and self._image_dirty:
+        if index == self.current_image_index and self._is_image_dirty(img_path):
             return tr("list.modified", name=name)
         if self._has_labeled_txt(img_path):
             return tr("list.labeled", name=name)
@@ -709,109 +861,231 @@ class MainWindow(QMainWindow):
     def _refresh_image_list_item(self, index: int):
         if index < 0 or index >= len(self.image_list):
             return
-        item = self.image_list_widget.item(index)
-        if item is None:
-            return
-        item.setText(self._format_list_item_text(self.image_list[index], index))
+        self.image_list_model.refresh_row(index)
 
     def _refresh_image_list(self):
-        self.image_list_widget.clear()
-        for i, img_path in enumerate(self.image_list):
-            self.image_list_widget.addItem(self._format_list_item_text(img_path, i))
+        self.image_list_model.set_images(self.image_list)
+        self._set_image_list_row(self.current_image_index if self.image_list else -1)
+
+    def _set_image_list_row(self, row: int):
+        self._syncing_image_list = True
+        try:
+            if row < 0:
+                self.image_list_view.clearSelection()
+                return
+            self.image_list_view.setCurrentIndex(self.image_list_model.index(row))
+        finally:
+            self._syncing_image_list = False
 
-    def _load_image(self, image_path: Path):
+    def _on_image_list_current_changed(self, current, _previous):
+        if self._syncing_image_list:
+            return
+        self.on_image_list_row_changed(current.row())
+
+    def _txt_path_for(self, image_path: Path) -> Path:
+        return self.save_folder_path / image_path.with_suffix(".txt").name
+
+    def _is_loading(self) -> bool:
+        return self._loading_path is not None
+
+    @tracing.traced("nav.load_image")
+    def _load_image(self, image_path: Path, defer=False):
+        """
+        切换到 image_path：解码与解析在线程池中完成，期间显示占位
+
+        已在缓存中的图片直接在当前线程完成加载。
+        defer=True 时只取消进行中的加载并显示占位，由 _on_nav_settled 稍后真正加载。
+        """
+        self._load_started = tracing.now()
+        self._nav_pending = defer
         self._cancel_polygon_drawing()
         self.image_view.set_drawing_mode(False)
+        drag_coalescer().commit()
 
         if not self.save_folder_path:
             QMessageBox.critical(self, tr("msg.error"), tr("msg.save_path_not_set"))
             return
 
-        if not image_path.exists():
+        # 只有当前图的标注在内存中；切走时未保存的修改随之丢弃
+        self._dirty_images.discard(self.current_image_path)
+        self.current_image_path = image_path
+        self.label_manager.clear()
+        self._undo_stack.clear()
+        txt_path = self._txt_path_for(image_path)
+
+        if defer:
+            # 占位期间 _is_loading() 为真，保存与编辑都会跳过
+            self._load_pipeline.cancel()
+            self._prefetcher.cancel()
+            self._loading_path = image_path
+            self._scene_reconciler.clear()
+            self.image_view.show_placeholder(tr("view.loading", name=image_path.name))
+            return
+
+        if is_display_cached(image_path, self._image_cache):
+            self._load_pipeline.cancel()
+            self._loading_path = None
+            try:
+                result = load_image_and_labels(
+                    image_path, txt_path, cache=self._image_cache,
+                    tiled_min_pixels=self._load_pipeline.tiled_min_pixels,
+                    simplify_tolerance=self._load_pipeline.simplify_tolerance,
+                )
+            except Exception as e:
+                result = LoadResult(None, image_path, error=str(e))
+            self._apply_load_result(result)
+        else:
+            self._loading_path = image_path
+            self._scene_reconciler.clear()
+            self.image_view.show_placeholder(tr("view.loading", name=image_path.name))
+            self._load_pipeline.request(image_path, txt_path)
+
+        if self.image_list:
+            self._prefetcher.request(self.image_list, self.current_image_index)
+
+    def _on_image_loaded(self, result):
+        if not self._load_pipeline.is_current(result.token):
+            return
+        if result.replaces_preview:
+            if result.image_path == self.current_image_path and self._loading_path is None:
+                self._apply_full_resolution(result)
+            return
+        if result.image_path != self._loading_path:
+            return
+        self._loading_path = None
+        self._apply_load_result(result)
+
+    def _apply_load_result(self, result):
+        image_path = result.image_path
+        if result.error == "not_found":
+            self.current_image_path = None
+            self._scene_reconciler.clear()
+            self.image_view.clear_image()
             QMessageBox.warning(
                 self, tr("msg.error"), tr("msg.image_not_found", path=image_path)
             )
             return
+        if result.error is not None:
+            self.current_image_path = None
+            self._scene_reconciler.clear()
+            self.image_view.clear_image()
+            QMessageBox.critical(
+                self, tr("msg.error"), tr("msg.load_image_failed", error=result.error)
+            )
+            return
 
         try:
-            self.current_image_path = image_path
-            pixmap = load_image(self.current_image_path)
-            self.image_view.load_pixmap(pixmap)
+            with tracing.span("load.show_image", tiled=result.tiled):
+                if result.tiled:
+                    self.image_view.load_tiled(image_path, result.image_size, result.image)
+                elif result.preview:
+                    self.image_view.load_preview(QPixmap.fromImage(result.image), result.image_size)
+                else:
+                    self.image_view.load_pixmap(QPixmap.fromImage(result.image))
 
-            txt_path = self.save_folder_path / image_path.with_suffix(".txt").name
-            self.label_manager.bboxes = load_yolo_txt(txt_path)
+            with tracing.span("list.set_bboxes", count=len(result.bboxes)):
+                self.label_manager.set_bboxes(result.bboxes)
             self._undo_stack.clear()
 
-            self.image_view.scene.clear()
-            pixmap_item = self.image_view.scene.addPixmap(pixmap)
-            pixmap_item.setZValue(-1)
-            self.bbox_items = {}
-
-            img_rect = QRectF(0, 0, pixmap.width(), pixmap.height())
-            self._current_img_rect = img_rect
             self._rebuild_scene_from_bboxes()
-            self.refresh_bbox_list()
             self._clear_bbox_selection()
             self._clear_dirty()
+            if result.simplified is not None:
+                # 简化结果尚未写盘，按未保存的修改处理
+                self._mark_dirty()
+                self._show_toast(tr("toast.simplified", before=result.simplified[0],
+                                    after=result.simplified[1]))
+            # 从切图到标注显示完成（含线程池中的解码与解析）
+            tracing.add_span("nav.image_ready", self._load_started, image=image_path.name)
         except Exception as e:
             QMessageBox.critical(
                 self, tr("msg.error"), tr("msg.load_image_failed", error=str(e))
             )
 
+    def _apply_full_resolution(self, result):
+        """预览显示后原图解码完成：只替换图片，标注、选中与撤回栈不变"""
+        if result.image is None or result.image.isNull():
+            return
+        pixmap = QPixmap.fromImage(result.image)
+        with tracing.span("load.swap_full"):
+            if not self.image_view.replace_preview(pixmap):
+                # 原图尺寸与读取器预先报告的不同：按新的图片范围重建标注图元
+                self._cancel_polygon_drawing()
+                drag_coalescer().commit()
+                self.image_view.load_pixmap(pixmap)
+                self._rebuild_scene_from_bboxes()
+                self._clear_bbox_selection()
+        tracing.add_span("nav.full_resolution", self._load_started, image=result.image_path.name)
+
     def _update_nav_label(self):
         if self.image_list:
             total = len(self.image_list)
             current = self.current_image_index + 1
             self.img_counter_label.setText(f"{current}/{total}")
-            self.image_list_widget.blockSignals(True)
-            self.image_list_widget.setCurrentRow(self.current_image_index)
-            self.image_list_widget.blockSignals(False)
+            self._set_image_list_row(self.current_image_index)
             self._refresh_image_list_item(self.current_image_index)
         else:
             self.img_counter_label.setText("0/0")
 
+    @tracing.traced("save.before_nav")
     def _maybe_save_before_nav(self):
         if not self._app_settings.auto_save_on_nav:
             return
+        if self._is_loading():
+            return
         if not self.save_txt(show_toast=False):
             self._show_toast(tr("toast.auto_save_skipped"))
 
     def on_image_list_row_changed(self, row):
         if row >= 0 and row < len(self.image_list) and row != self.current_image_index:
-            self._maybe_save_before_nav()
-            self.current_image_index = row
-            self._load_image(self.image_list[self.current_image_index])
-            self._update_nav_label()
+            self._navigate_to(row)
 
     def show_prev_image(self):
         if not self.image_list:
             QMessageBox.information(self, tr("msg.info"), tr("msg.open_folder_first"))
             return
-
-        self._maybe_save_before_nav()
-
-        self.current_image_index = (self.current_image_index - 1) % len(self.image_list)
-        self._load_image(self.image_list[self.current_image_index])
-        self._update_nav_label()
+        self._navigate_to((self.current_image_index - 1) % len(self.image_list))
 
     def show_next_image(self):
         if not self.image_list:
             QMessageBox.information(self, tr("msg.info"), tr("msg.open_folder_first"))
             return
+        self._navigate_to((self.current_image_index + 1) % len(self.image_list))
 
+    def _navigate_to(self, index):
+        """
+        翻到 image_list[index]
+
+        距上次翻页不足 NAV_SETTLE_MS 时只更新序号与计数并取消进行中的加载，
+        停下后由 _on_nav_settled 加载停留的那张；切走前的自动保存只对已加载的图片做一次。
+        """
         self._maybe_save_before_nav()
+        self.current_image_index = index
+        burst = self._nav_timer.isActive()
+        with tracing.span("nav.step", index=index, deferred=burst):
+            self._load_image(self.image_list[index], defer=burst)
+            self._update_nav_label()
+        self._nav_timer.start()
 
-        self.current_image_index = (self.current_image_index + 1) % len(self.image_list)
+    def _on_nav_settled(self):
+        if not self._nav_pending or not self.image_list:
+            return
         self._load_image(self.image_list[self.current_image_index])
-        self._update_nav_label()
 
+    @tracing.traced("save.save_txt")
     def save_txt(self, show_toast=True):
         if not self.current_image_path or not self.save_folder_path:
             return False
+        if self._is_loading():
+            return False
+        drag_coalescer().commit()
+        from core.yolo_io import save_yolo_txt
 
         try:
             txt_path = self.save_folder_path / self.current_image_path.with_suffix(".txt").name
-            save_yolo_txt(txt_path, self.label_manager.bboxes)
+            if save_yolo_txt(txt_path, self.label_manager.bboxes):
+                self._label_status.update(txt_path)
+                self._update_dataset_index(txt_path)
             self._clear_dirty()
             if show_toast:
                 self._show_toast(tr("toast.save_success"))
@@ -822,18 +1096,25 @@ class MainWindow(QMainWindow):
             )
             return False
 
+    @tracing.traced("save.save_all")
     def save_all_in_folder(self, show_toast=False):
+        """只写有未保存修改的图片；内容未变化的 txt 由 save_yolo_txt 跳过"""
         if not self.save_folder_path or not self.image_list:
             return
+        if not self._dirty_images:
+            return
+        drag_coalescer().commit()
+        from core.yolo_io import save_yolo_txt
 
         try:
-            for i, img_path in enumerate(self.image_list):
+            for img_path in list(self._dirty_images):
+                if img_path != self.current_image_path:
+                    self._dirty_images.discard(img_path)
+                    continue
                 txt_path = self.save_folder_path / img_path.with_suffix(".txt").name
-                if i == self.current_image_index:
-                    bboxes = self.label_manager.bboxes
-                else:
-                    bboxes = load_yolo_txt(txt_path)
-                save_yolo_txt(txt_path, bboxes)
+                if save_yolo_txt(txt_path, self.label_manager.bboxes):
+                    self._label_status.update(txt_path)
+                    self._update_dataset_index(txt_path)
             self._clear_dirty()
             if show_toast:
                 self._show_toast(tr("toast.periodic_save_done"))
@@ -842,6 +1123,46 @@ class MainWindow(QMainWindow):
                 self, tr("msg.save_failed"), tr("msg.save_txt_failed", error=str(e))
             )
 
+    def _update_dataset_index(self, txt_path: Path):
+        # 索引只是缓存，在后台线程中按写入的内容更新；失败时下次 refresh 会按 mtime 补齐
+        self._index_refresher.update_file(self.save_folder_path, txt_path)
+
+    def show_dataset_stats(self):
+        if not self.save_folder_path:
+            QMessageBox.warning(self, tr("msg.warning"), tr("msg.save_path_not_set"))
+            return
+        self._index_refresher.request_stats(self.save_folder_path)
+        self._show_toast(tr("toast.stats_running"))
+
+    def _on_dataset_stats(self, folder, result):
+        if folder != self.save_folder_path:
+            return
+        if isinstance(result, Exception):
+            QMessageBox.warning(self, tr("msg.error"), tr("msg.index_failed", error=str(result)))
+            return
+        from core.yolo_io import TYPE_NAMES
+        files, labeled, types = result["files"], result["labeled"], result["types"]
+        lines = [
+            tr("stats.summary", files=files, labeled=labeled, empty=files - labeled,
+               boxes=result["boxes"]),
+            tr("stats.types", **{name: types.get(name, 0) for name in TYPE_NAMES}),
+            "",
+        ]
+        lines.extend(
+            tr("stats.class_row", class_id=class_id, count=count)
+            for class_id, count in result["classes"].items()
+        )
+        QMessageBox.information(self, tr("msg.dataset_stats"), "\n".join(lines))
+
+    def closeEvent(self, event):
+        if self._trace_output:
+            tracing.export_chrome_trace(self._trace_output)
+        self._load_pipeline.shutdown()
+        self.image_view.shutdown()
+        self._prefetcher.shutdown()
+        self._index_refresher.shutdown()
+        super().closeEvent(event)
+
     def _show_toast(self, message):
         toast = QLabel(message)
         toast.setObjectName("toastLabel")
@@ -861,23 +1182,9 @@ class MainWindow(QMainWindow):
     def fit_image_to_view(self):
         self.image_view.fit_to_view()
 
-    def refresh_bbox_list(self):
-        self.bbox_list.clear()
-        for bbox in self.label_manager.bboxes:
-            if bbox.type == 'rect':
-                prefix = "[Rect]"
-                extra = ""
-            elif bbox.type == 'obb':
-                prefix = "[OBB]"
-                extra = ""
-            else:
-                prefix = "[Poly]"
-                extra = f" | {len(bbox.points or [])}pts"
-            text = f"{prefix} ID{bbox.id} | Class: {bbox.class_id}{extra}"
-            self.bbox_list.addItem(text)
-        self._sync_list_from_scene()
-
     def add_bbox(self):
+        if self._is_loading():
+            return
         if not self.current_image_path:
             QMessageBox.warning(self, tr("msg.info"), tr("msg.open_image_first"))
             return
@@ -885,8 +1192,12 @@ class MainWindow(QMainWindow):
         img_rect = self._get_image_rect()
         self._current_img_rect = img_rect
 
-        if self.radio_polygon.isChecked():
-            self.polygon_draw_controller.start(self.image_view.scene, img_rect)
+        freehand = self.radio_freehand.isChecked()
+        if self.radio_polygon.isChecked() or freehand:
+            self.polygon_draw_controller.start(
+                self.image_view.scene, img_rect,
+                freehand=freehand, scale=self.image_view.transform().m11(),
+            )
             self.image_view.set_drawing_mode(True)
             return
 
@@ -897,8 +1208,7 @@ class MainWindow(QMainWindow):
         x = (img_w - box_w) / 2
         y = (img_h - box_h) / 2
 
-        self._push_undo_snapshot()
-        bbox_id = len(self.label_manager.bboxes)
+        bbox_id = self.label_manager.next_id()
         is_obb = self.radio_obb.isChecked()
 
         if is_obb:
@@ -911,9 +1221,7 @@ class MainWindow(QMainWindow):
 
             item = OBBItem(QPointF(cx, cy), box_w, box_h, angle, bbox)
             item.set_image_rect(img_rect)
-            self._register_bbox_item(item)
-            self.image_view.scene.addItem(item)
-            self.bbox_items[bbox_id] = item
+            self._scene_reconciler.add_item(bbox_id, item)
         else:
             bbox = BBox(bbox_id, 0, type='rect', x_center=0.5, y_center=0.5, width=0.2, height=0.2)
             self.label_manager.add(bbox)
@@ -922,18 +1230,16 @@ class MainWindow(QMainWindow):
             item = BBoxItem(rect, bbox)
             item.setPos(x, y)
             item.set_image_rect(img_rect)
-            self._register_bbox_item(item)
-            self.image_view.scene.addItem(item)
-            self.bbox_items[bbox_id] = item
+            self._scene_reconciler.add_item(bbox_id, item)
 
-        self.refresh_bbox_list()
+        self._push_undo([Change(bbox_id, len(self.label_manager.bboxes) - 1, None, clone_bbox(bbox))])
         self._select_bbox_by_id(bbox_id)
 
     def _resolve_delete_row(self):
         bbox_id = self._selected_bbox_id()
         if bbox_id is not None:
             return self._row_for_bbox_id(bbox_id)
-        row = self.bbox_list.currentRow()
+        row = self.bbox_list.currentIndex().row()
         if 0 <= row < len(self.label_manager.bboxes):
             return row
         return None
@@ -943,17 +1249,14 @@ class MainWindow(QMainWindow):
         if row is None:
             return
 
-        self._push_undo_snapshot()
+        self._flush_pending_edit()
         bbox = self.label_manager.bboxes[row]
         bbox_id = bbox.id
+        self._push_undo([Change(bbox_id, row, clone_bbox(bbox), None)])
 
-        if bbox_id in self.bbox_items:
-            gfx_item = self.bbox_items[bbox_id]
-            self.image_view.scene.removeItem(gfx_item)
-            del self.bbox_items[bbox_id]
+        self._scene_reconciler.remove(bbox_id)
 
         self.label_manager.remove(bbox_id)
-        self.refresh_bbox_list()
 
         if self.label_manager.bboxes:
             new_row = min(row, len(self.label_manager.bboxes) - 1)
@@ -961,6 +1264,32 @@ class MainWindow(QMainWindow):
         else:
             self._clear_bbox_selection()
 
+    def simplify_selected_polygon(self):
+        bbox_id = self._selected_bbox_id()
+        if bbox_id is None:
+            return
+        drag_coalescer().commit()
+        row = self._row_for_bbox_id(bbox_id)
+        bbox = self.label_manager.get(bbox_id)
+        if bbox is None or bbox.type != 'polygon':
+            return
+        from core.polygon_simplify import simplify_normalized
+        img_rect = self._get_image_rect()
+        points = simplify_normalized(
+            bbox.points, self._app_settings.simplify_tolerance_px, img_rect.width(), img_rect.height()
+        )
+        before = len(bbox.points)
+        if len(points) >= before:
+            self._show_toast(tr("toast.simplified", before=before, after=before))
+            return
+        new_bbox = clone_bbox(bbox)
+        new_bbox.points = points
+        self._push_undo([Change(bbox_id, row, clone_bbox(bbox), clone_bbox(new_bbox))])
+        self.label_manager.replace(new_bbox)
+        self._scene_reconciler.sync(bbox_id, new_bbox, img_rect)
+        self._select_bbox_by_id(bbox_id)
+        self._show_toast(tr("toast.simplified", before=before, after=len(points)))
+
     def on_class_id_changed(self, value):
         bbox_id = self._selected_bbox_id()
         if bbox_id is None:
@@ -969,7 +1298,12 @@ class MainWindow(QMainWindow):
         if row < 0:
             return
 
-        self._push_undo_snapshot()
-        self.label_manager.bboxes[row].class_id = value
-        self.refresh_bbox_list()
+        self._flush_pending_edit()
+        bbox = self.label_manager.bboxes[row]
+        if bbox.class_id == value:
+            return
+        before = clone_bbox(bbox)
+        bbox.class_id = value
+        self.label_manager.notify_changed(bbox_id)
+        self._push_undo([Change(bbox_id, row, before, clone_bbox(bbox))])
         self._select_bbox_by_id(bbox_id)
@@ -4,7 +4,10 @@ from PyQt5.QtCore import Qt, QPointF, QLineF
 from PyQt5.QtGui import QPen, QPolygonF, QBrush, QColor
 
 from ui.theme_manager import get_annotation_colors
-from ui.graphics_utils import select_only, select_only_parent
+from ui.drag_coalescer import drag_coalescer
+from ui.graphics_utils import (
+    select_only, select_only_parent, wants_handles, release_child_items,
+)
 
 HANDLE_SIZE = 8
 
@@ -46,7 +49,9 @@ class OBBHandle(QGraphicsEllipseItem):
 
     def mouseMoveEvent(self, event):
         current_pos = self.mapToScene(event.pos())
-        self.parent_obb.do_drag(self.handle_type, current_pos)
+        handle_type = self.handle_type
+        parent = self.parent_obb
+        drag_coalescer().schedule(parent, lambda: parent.do_drag(handle_type, current_pos))
         event.accept()
 
     def mouseReleaseEvent(self, event):
@@ -71,17 +76,13 @@ class OBBItem(QGraphicsPolygonItem):
         
         self._update_color(selected=False)
         
+        # 控制点与旋转引导线（按需模式下选中时才创建）
         self.handles = {}
-        for ht in ['tl', 'tr', 'br', 'bl', 'rotate']:
-            self.handles[ht] = OBBHandle(ht, self)
-            
-        self.rotate_line = QGraphicsLineItem(self)
-        colors = get_annotation_colors()
-        self.rotate_line.setPen(QPen(QColor(colors["rotate"]), 1, Qt.DashLine))
-        self.rotate_line.setFlag(QGraphicsItem.ItemIsSelectable, False)
+        self.rotate_line = None
         
         self._is_dragging = False
         self._update_geometry()
+        self.refresh_handles()
 
     def _update_color(self, selected: bool):
         colors = get_annotation_colors()
@@ -93,7 +94,8 @@ class OBBItem(QGraphicsPolygonItem):
         selected = self.isSelected()
         self._update_color(selected)
         colors = get_annotation_colors()
-        self.rotate_line.setPen(QPen(QColor(colors["rotate"]), 1, Qt.DashLine))
+        if self.rotate_line is not None:
+            self.rotate_line.setPen(QPen(QColor(colors["rotate"]), 1, Qt.DashLine))
         for handle in self.handles.values():
             handle.setBrush(QColor(colors["rotate"] if handle.handle_type == 'rotate' else colors["handle"]))
             handle.setPen(QPen(QColor(colors["handle_border"]), 1))
@@ -102,7 +104,39 @@ class OBBItem(QGraphicsPolygonItem):
         super().setSelected(selected)
         self._update_color(selected)
 
-    def _update_geometry(self):
+    def itemChange(self, change, value):
+        if change == QGraphicsItem.ItemSelectedHasChanged:
+            self.refresh_handles()
+        return super().itemChange(change, value)
+
+    def refresh_handles(self):
+        """按选中状态创建或释放控制点和旋转引导线"""
+        if wants_handles(self):
+            if not self.handles:
+                self._create_handles()
+                self._update_handles()
+        elif self.handles:
+            release_child_items(list(self.handles.values()) + [self.rotate_line])
+            self.handles = {}
+            self.rotate_line = None
+
+    def _create_handles(self):
+        for ht in ['tl', 'tr', 'br', 'bl', 'rotate']:
+            self.handles[ht] = OBBHandle(ht, self)
+        self.rotate_line = QGraphicsLineItem(self)
+        colors = get_annotation_colors()
+        self.rotate_line.setPen(QPen(QColor(colors["rotate"]), 1, Qt.DashLine))
+        self.rotate_line.setFlag(QGraphicsItem.ItemIsSelectable, False)
+
+    def _update_geometry(self, sync: bool = True):
+        self._build_polygon()
+        if sync:
+            self._sync_to_yolo()
+        else:
+            drag_coalescer().defer_sync(self)
+
+    def _build_polygon(self):
+        """由中心、宽高与角度重算角点、多边形与控制点（不写回 bbox_data）"""
         rad = math.radians(self.angle)
         cos_a = math.cos(rad)
         sin_a = math.sin(rad)
@@ -127,25 +161,28 @@ class OBBItem(QGraphicsPolygonItem):
         poly = QPolygonF(self.corners)
         self.setPolygon(poly)
         
-        # Update handles
+        self._update_handles()
+
+    def _update_handles(self):
+        if not self.handles:
+            return
         self.handles['tl'].setPos(self.corners[0])
         self.handles['tr'].setPos(self.corners[1])
         self.handles['br'].setPos(self.corners[2])
         self.handles['bl'].setPos(self.corners[3])
         
         # Rotate handle (above top edge)
+        rad = math.radians(self.angle)
         top_center_x = (self.corners[0].x() + self.corners[1].x()) / 2
         top_center_y = (self.corners[0].y() + self.corners[1].y()) / 2
         
         rot_dist = 30
-        rot_x = top_center_x + sin_a * rot_dist
-        rot_y = top_center_y - cos_a * rot_dist
+        rot_x = top_center_x + math.sin(rad) * rot_dist
+        rot_y = top_center_y - math.cos(rad) * rot_dist
         rot_pos = QPointF(rot_x, rot_y)
         
         self.handles['rotate'].setPos(rot_pos)
         self.rotate_line.setLine(QLineF(QPointF(top_center_x, top_center_y), rot_pos))
-        
-        self._sync_to_yolo()
 
     def start_drag(self, handle_type, pos):
         self._drag_start_cx = self.cx
@@ -220,10 +257,10 @@ class OBBItem(QGraphicsPolygonItem):
             self.cx = self._drag_start_cx + shift_x
             self.cy = self._drag_start_cy + shift_y
             
-        self._update_geometry()
+        self._update_geometry(sync=False)
 
     def end_drag(self):
-        pass
+        drag_coalescer().commit()
 
     def _notify_edit_start(self):
         if self.on_edit_start:
@@ -244,24 +281,28 @@ class OBBItem(QGraphicsPolygonItem):
     def mouseMoveEvent(self, event):
         if self._is_dragging:
             current_pos = self.mapToScene(event.pos())
-            dx = current_pos.x() - self._drag_start_pos.x()
-            dy = current_pos.y() - self._drag_start_pos.y()
-            
-            self.cx = self._drag_start_cx + dx
-            self.cy = self._drag_start_cy + dy
-            
-            if self.image_rect is not None:
-                self.cx = max(self.image_rect.left(), min(self.image_rect.right(), self.cx))
-                self.cy = max(self.image_rect.top(), min(self.image_rect.bottom(), self.cy))
-                
-            self._update_geometry()
+            drag_coalescer().schedule(self, lambda: self._drag_to(current_pos))
             event.accept()
         else:
             super().mouseMoveEvent(event)
 
+    def _drag_to(self, current_pos):
+        dx = current_pos.x() - self._drag_start_pos.x()
+        dy = current_pos.y() - self._drag_start_pos.y()
+        
+        self.cx = self._drag_start_cx + dx
+        self.cy = self._drag_start_cy + dy
+        
+        if self.image_rect is not None:
+            self.cx = max(self.image_rect.left(), min(self.image_rect.right(), self.cx))
+            self.cy = max(self.image_rect.top(), min(self.image_rect.bottom(), self.cy))
+            
+        self._update_geometry(sync=False)
+
     def mouseReleaseEvent(self, event):
         if self._is_dragging:
             self._is_dragging = False
+            drag_coalescer().commit()
             event.accept()
         else:
             super().mouseReleaseEvent(event)
@@ -282,3 +323,36 @@ class OBBItem(QGraphicsPolygonItem):
     def set_image_rect(self, image_rect):
         self.image_rect = image_rect
         self._sync_to_yolo()
+
+    @staticmethod
+    def _scene_params(bbox_data, img_rect):
+        """四个归一化角点 -> 场景中的中心、宽高与角度"""
+        img_w = img_rect.width()
+        img_h = img_rect.height()
+        px = [img_rect.left() + p[0] * img_w for p in bbox_data.points]
+        py = [img_rect.top() + p[1] * img_h for p in bbox_data.points]
+        center = QPointF(sum(px) / 4, sum(py) / 4)
+        w = math.hypot(px[1] - px[0], py[1] - py[0])
+        h = math.hypot(px[2] - px[1], py[2] - py[1])
+        angle = math.degrees(math.atan2(py[1] - py[0], px[1] - px[0]))
+        return center, w, h, angle
+
+    @staticmethod
+    def from_bbox(bbox_data, img_rect) -> "OBBItem":
+        center, w, h, angle = OBBItem._scene_params(bbox_data, img_rect)
+        item = OBBItem(center, w, h, angle, bbox_data)
+        # 不反向同步：txt 中的四边形不一定是严格的矩形，重算角点会改动标注
+        item.image_rect = img_rect
+        return item
+
+    def update_from_bbox(self, bbox_data, img_rect):
+        """复用当前图元显示另一个（同类型的）标注"""
+        center, w, h, angle = self._scene_params(bbox_data, img_rect)
+        self.bbox_data = bbox_data
+        self.image_rect = img_rect
+        self.cx = center.x()
+        self.cy = center.y()
+        self.w = w
+        self.h = h
+        self.angle = angle
+        self._build_polygon()
@@ -1,12 +1,26 @@
-from PyQt5.QtCore import QObject, pyqtSignal, QPointF, Qt
+from PyQt5.QtCore import QObject, pyqtSignal, QPointF, QLineF, Qt
 from PyQt5.QtGui import QPen, QColor, QPainterPath
-from PyQt5.QtWidgets import QGraphicsPathItem
+from PyQt5.QtWidgets import QGraphicsPathItem, QGraphicsLineItem
 
 CLOSE_THRESHOLD = 12.0
 MIN_VERTICES = 3
+# 手绘时相邻采样点的最小间距（场景坐标，start() 时按缩放换算）
+FREEHAND_STEP = 3.0
+# 手绘结束时 Douglas-Peucker 的容差（场景坐标）
+FREEHAND_TOLERANCE = 1.5
+# 预览折线每段图元的最多点数；追加点时只修改最后一段
+PREVIEW_CHUNK = 256
 
 
 class PolygonDrawController(QObject):
+    """
+    多边形绘制
+
+    点击模式：每次点击添加一个顶点，光标到最后一个顶点之间显示引导线。
+    手绘模式（freehand）：按住左键描边，与上一个采样点距离小于 step 的点直接丢弃，
+    松开时用 Douglas-Peucker 简化后结束。预览折线按段增量追加，不随点数增多而整体重建。
+    """
+
     finished = pyqtSignal(list)
     cancelled = pyqtSignal()
 
@@ -15,22 +29,36 @@ class PolygonDrawController(QObject):
         self.scene = None
         self.image_rect = None
         self.points = []
-        self.preview_item = None
         self.active = False
+        self.freehand = False
+        self.stroking = False
+        self._step = FREEHAND_STEP
+        self._tolerance = FREEHAND_TOLERANCE
+        self._pen = QPen(QColor("#0ea5e9"), 2, Qt.DashLine)
+        self._path_items = []
+        self._chunk_path = None
+        self._chunk_len = 0
+        self._cursor_item = None
         self._cursor_pos = None
 
-    def start(self, scene, image_rect):
+    def start(self, scene, image_rect, freehand=False, scale=1.0):
+        """scale 为视图缩放比，用于把采样间距/容差换算为屏幕上的固定像素"""
         self.cancel()
         self.scene = scene
         self.image_rect = image_rect
         self.points = []
         self.active = True
+        self.freehand = freehand
+        self.stroking = False
+        scale = scale if scale > 0 else 1.0
+        self._step = FREEHAND_STEP / scale
+        self._tolerance = FREEHAND_TOLERANCE / scale
         self._cursor_pos = None
-        self.preview_item = QGraphicsPathItem()
-        self.preview_item.setZValue(20)
-        pen = QPen(QColor("#0ea5e9"), 2, Qt.DashLine)
-        self.preview_item.setPen(pen)
-        self.scene.addItem(self.preview_item)
+        self._cursor_item = QGraphicsLineItem()
+        self._cursor_item.setZValue(20)
+        self._cursor_item.setPen(self._pen)
+        self._cursor_item.hide()
+        self.scene.addItem(self._cursor_item)
 
     def is_active(self):
         return self.active
@@ -46,20 +74,22 @@ class PolygonDrawController(QObject):
         if not self.active:
             return
         self.points.append(self._clamp(scene_pos))
-        self._update_preview()
+        self._append_preview()
+        self._update_cursor_line()
 
     def remove_last_point(self) -> bool:
-        if not self.active or not self.points:
+        if not self.active or not self.points or self.stroking:
             return False
         self.points.pop()
-        self._update_preview()
+        self._rebuild_preview()
+        self._update_cursor_line()
         return True
 
     def update_cursor(self, scene_pos: QPointF):
         if not self.active:
             return
         self._cursor_pos = self._clamp(scene_pos)
-        self._update_preview()
+        self._update_cursor_line()
 
     def try_close_at(self, scene_pos: QPointF) -> bool:
         if not self.active or len(self.points) < MIN_VERTICES:
@@ -72,10 +102,51 @@ class PolygonDrawController(QObject):
             return True
         return False
 
+    # ======================= 手绘 =======================
+
+    def begin_stroke(self, scene_pos: QPointF):
+        if not self.active:
+            return
+        self._clear_preview()
+        self.points = []
+        self.stroking = True
+        self._cursor_item.hide()
+        self.add_point(scene_pos)
+
+    def extend_stroke(self, scene_pos: QPointF):
+        if not self.stroking:
+            return
+        pt = self._clamp(scene_pos)
+        last = self.points[-1]
+        dx = pt.x() - last.x()
+        dy = pt.y() - last.y()
+        if dx * dx + dy * dy < self._step * self._step:
+            return
+        self.points.append(pt)
+        self._append_preview()
+
+    def end_stroke(self, scene_pos: QPointF):
+        if not self.stroking:
+            return
+        self.extend_stroke(scene_pos)
+        self.stroking = False
+        if len(self.points) < MIN_VERTICES:
+            self.cancel()
+            return
+        self.finish()
+
+    # ======================= 结束 =======================
+
     def finish(self):
         if not self.active or len(self.points) < MIN_VERTICES:
             return
         result = list(self.points)
+        if self.freehand:
+            # 宽高取 1 即按场景坐标简化；结果不会恰好是 4 个顶点（4 点的行会被读成 OBB）
+            from core.polygon_simplify import simplify_normalized
+            simplified = simplify_normalized([(p.x(), p.y()) for p in result], self._tolerance, 1.0, 1.0)
+            if len(simplified) >= MIN_VERTICES:
+                result = [QPointF(x, y) for x, y in simplified]
         self._cleanup()
         self.finished.emit(result)
 
@@ -86,23 +157,57 @@ class PolygonDrawController(QObject):
             self.cancelled.emit()
 
     def _cleanup(self):
-        if self.preview_item is not None and self.scene is not None:
-            self.scene.removeItem(self.preview_item)
-        self.preview_item = None
+        self._clear_preview()
+        if self._cursor_item is not None and self.scene is not None:
+            self.scene.removeItem(self._cursor_item)
+        self._cursor_item = None
         self.points = []
         self._cursor_pos = None
         self.active = False
+        self.stroking = False
+
+    # ======================= 预览 =======================
+
+    def _clear_preview(self):
+        if self.scene is not None:
+            for item in self._path_items:
+                self.scene.removeItem(item)
+        self._path_items = []
+        self._chunk_path = None
+        self._chunk_len = 0
+
+    def _append_preview(self):
+        """把 points 的最后一个点接到预览折线上"""
+        if self.scene is None:
+            return
+        pt = self.points[-1]
+        if self._chunk_path is None or self._chunk_len >= PREVIEW_CHUNK:
+            start = self.points[-2] if len(self.points) > 1 else pt
+            self._chunk_path = QPainterPath(start)
+            self._chunk_len = 0
+            item = QGraphicsPathItem()
+            item.setZValue(20)
+            item.setPen(self._pen)
+            self.scene.addItem(item)
+            self._path_items.append(item)
+        if len(self.points) > 1:
+            self._chunk_path.lineTo(pt)
+        self._chunk_len += 1
+        self._path_items[-1].setPath(self._chunk_path)
+
+    def _rebuild_preview(self):
+        points = self.points
+        self._clear_preview()
+        self.points = []
+        for pt in points:
+            self.points.append(pt)
+            self._append_preview()
 
-    def _update_preview(self):
-        if self.preview_item is None:
+    def _update_cursor_line(self):
+        if self._cursor_item is None:
             return
-        path = QPainterPath()
-        if not self.points:
-            self.preview_item.setPath(path)
+        if self.stroking or not self.points or self._cursor_pos is None:
+            self._cursor_item.hide()
             return
-        path.moveTo(self.points[0])
-        for pt in self.points[1:]:
-            path.lineTo(pt)
-        if self._cursor_pos is not None:
-            path.lineTo(self._cursor_pos)
-        self.preview_item.setPath(path)
+        self._cursor_item.setLine(QLineF(self.points[-1], self._cursor_pos))
+        self._cursor_item.show()
@@ -5,7 +5,10 @@ from PyQt5.QtCore import Qt, QPointF
 from PyQt5.QtGui import QPen, QPolygonF, QBrush, QColor
 
 from ui.theme_manager import get_annotation_colors
-from ui.graphics_utils import select_only, select_only_parent
+from ui.drag_coalescer import drag_coalescer
+from ui.graphics_utils import (
+    select_only, select_only_parent, wants_handles, release_child_items,
+)
 
 HANDLE_SIZE = 8
 
@@ -39,11 +42,14 @@ class PolygonVertexHandle(QGraphicsEllipseItem):
         event.accept()
 
     def mouseMoveEvent(self, event):
-        current_pos = self.parent_polygon._clamp_point(self.mapToScene(event.pos()))
-        self.parent_polygon._set_vertex(self.vertex_index, current_pos)
+        parent = self.parent_polygon
+        index = self.vertex_index
+        current_pos = self.mapToScene(event.pos())
+        drag_coalescer().schedule(parent, lambda: parent._set_vertex(index, current_pos))
         event.accept()
 
     def mouseReleaseEvent(self, event):
+        drag_coalescer().commit()
         event.accept()
 
 
@@ -54,14 +60,17 @@ class PolygonItem(QGraphicsPolygonItem):
         self.image_rect = None
         self.on_edit_start = None
         self.vertices = [QPointF(p) for p in scene_points]
+        self._polygon = QPolygonF()
+        # 待写回 bbox_data 的顶点下标；None 表示需要整体同步（或没有待同步的修改）
+        self._dirty_vertices = None
         self.handles = []
 
         self.setFlags(QGraphicsPolygonItem.ItemIsSelectable)
         self.setAcceptHoverEvents(True)
         self._is_dragging = False
         self._update_color(selected=False)
-        self._rebuild_geometry()
-        self._create_handles()
+        self._build_polygon()
+        self.refresh_handles()
 
     def _update_color(self, selected: bool):
         colors = get_annotation_colors()
@@ -84,6 +93,20 @@ class PolygonItem(QGraphicsPolygonItem):
         super().setSelected(selected)
         self._update_color(selected)
 
+    def itemChange(self, change, value):
+        if change == QGraphicsItem.ItemSelectedHasChanged:
+            self.refresh_handles()
+        return super().itemChange(change, value)
+
+    def refresh_handles(self):
+        """按选中状态创建或释放顶点控制点"""
+        if wants_handles(self):
+            if len(self.handles) != len(self.vertices):
+                self._create_handles()
+        elif self.handles:
+            release_child_items(self.handles)
+            self.handles = []
+
     def set_image_rect(self, image_rect):
         self.image_rect = image_rect
         self._sync_to_yolo()
@@ -96,42 +119,74 @@ class PolygonItem(QGraphicsPolygonItem):
         return QPointF(x, y)
 
     def _set_vertex(self, index: int, point: QPointF):
-        self.vertices[index] = self._clamp_point(point)
-        self._rebuild_geometry()
-        self._update_handles()
+        """只更新一个顶点：多边形中的该点、对应控制点，以及待写回的下标"""
+        point = self._clamp_point(point)
+        self.vertices[index] = point
+        self._polygon.replace(index, point)
+        self.setPolygon(self._polygon)
+        if index < len(self.handles):
+            self.handles[index].setPos(point)
+        if self._dirty_vertices is None:
+            self._dirty_vertices = set()
+        self._dirty_vertices.add(index)
+        drag_coalescer().defer_sync(self)
 
-    def _rebuild_geometry(self):
-        self.setPolygon(QPolygonF(self.vertices))
-        self._sync_to_yolo()
+    def _rebuild_geometry(self, sync: bool = True):
+        self._build_polygon()
+        if sync:
+            self._sync_to_yolo()
+        else:
+            drag_coalescer().defer_sync(self)
+
+    def _build_polygon(self):
+        """由 vertices 重建显示用的多边形（不写回 bbox_data）"""
+        self._polygon = QPolygonF(self.vertices)
+        self.setPolygon(self._polygon)
+        self._dirty_vertices = None
 
     def _update_handles(self):
         for i, handle in enumerate(self.handles):
             handle.setPos(self.vertices[i])
 
     def _create_handles(self):
-        for handle in self.handles:
-            handle.setParentItem(None)
-            if handle.scene():
-                handle.scene().removeItem(handle)
+        release_child_items(self.handles)
         self.handles = []
         for i in range(len(self.vertices)):
             handle = PolygonVertexHandle(i, self)
             self.handles.append(handle)
         self._update_handles()
 
+    def _commit_offset(self):
+        """把整体拖拽期间的位移（pos）合并进顶点"""
+        offset = self.pos()
+        if offset.isNull():
+            return
+        self.setPos(0, 0)
+        self.vertices = [v + offset for v in self.vertices]
+        self._polygon = QPolygonF(self.vertices)
+        self.setPolygon(self._polygon)
+        self._dirty_vertices = None
+        self._update_handles()
+
     def _sync_to_yolo(self):
+        """把顶点写回 bbox_data.points；只改过个别顶点时只更新这些顶点"""
+        self._commit_offset()
+        dirty = self._dirty_vertices
+        self._dirty_vertices = None
         if self.image_rect is None:
             return
         img = self.image_rect
         iw, ih = img.width(), img.height()
         if iw <= 0 or ih <= 0:
             return
-        pts = []
-        for p in self.vertices:
-            nx = (p.x() - img.left()) / iw
-            ny = (p.y() - img.top()) / ih
-            pts.append((nx, ny))
-        self.bbox_data.points = pts
+        left, top = img.left(), img.top()
+        points = self.bbox_data.points
+        if dirty is not None and points is not None and len(points) == len(self.vertices):
+            for i in dirty:
+                p = self.vertices[i]
+                points[i] = ((p.x() - left) / iw, (p.y() - top) / ih)
+            return
+        self.bbox_data.points = [((p.x() - left) / iw, (p.y() - top) / ih) for p in self.vertices]
 
     def _notify_edit_start(self):
         if self.on_edit_start:
@@ -143,7 +198,8 @@ class PolygonItem(QGraphicsPolygonItem):
             select_only(self)
             self._is_dragging = True
             self._drag_start_pos = self.mapToScene(event.pos())
-            self._drag_start_vertices = [QPointF(v) for v in self.vertices]
+            self._drag_start_offset = self.pos()
+            self._drag_bounds = self._polygon.boundingRect()
             event.accept()
         else:
             super().mousePressEvent(event)
@@ -151,33 +207,56 @@ class PolygonItem(QGraphicsPolygonItem):
     def mouseMoveEvent(self, event):
         if self._is_dragging:
             current_pos = self.mapToScene(event.pos())
-            dx = current_pos.x() - self._drag_start_pos.x()
-            dy = current_pos.y() - self._drag_start_pos.y()
-            new_vertices = []
-            for v in self._drag_start_vertices:
-                new_vertices.append(self._clamp_point(QPointF(v.x() + dx, v.y() + dy)))
-            self.vertices = new_vertices
-            self._rebuild_geometry()
-            self._update_handles()
+            drag_coalescer().schedule(self, lambda: self._drag_to(current_pos))
             event.accept()
         else:
             super().mouseMoveEvent(event)
 
+    def _drag_to(self, current_pos: QPointF):
+        """整体拖拽只移动图元（pos），顶点在同步时（_commit_offset）才平移"""
+        dx = self._drag_start_offset.x() + current_pos.x() - self._drag_start_pos.x()
+        dy = self._drag_start_offset.y() + current_pos.y() - self._drag_start_pos.y()
+        if self.image_rect is not None:
+            # 整体约束在图片内，不再逐点截断（那样会把贴边的多边形压扁）
+            b = self._drag_bounds
+            img = self.image_rect
+            dx = max(img.left() - b.left(), min(img.right() - b.right(), dx))
+            dy = max(img.top() - b.top(), min(img.bottom() - b.bottom(), dy))
+        self.setPos(dx, dy)
+        drag_coalescer().defer_sync(self)
+
     def mouseReleaseEvent(self, event):
         if self._is_dragging:
             self._is_dragging = False
+            drag_coalescer().commit()
             event.accept()
         else:
             super().mouseReleaseEvent(event)
 
     @staticmethod
-    def from_bbox(bbox_data, img_rect) -> "PolygonItem":
+    def _scene_points(bbox_data, img_rect) -> List[QPointF]:
         img_w = img_rect.width()
         img_h = img_rect.height()
-        scene_points = [
+        return [
             QPointF(p[0] * img_w + img_rect.left(), p[1] * img_h + img_rect.top())
             for p in bbox_data.points
         ]
-        item = PolygonItem(scene_points, bbox_data)
-        item.set_image_rect(img_rect)
+
+    @staticmethod
+    def from_bbox(bbox_data, img_rect) -> "PolygonItem":
+        item = PolygonItem(PolygonItem._scene_points(bbox_data, img_rect), bbox_data)
+        # 顶点由 bbox_data 算出，不再反向同步
+        item.image_rect = img_rect
         return item
+
+    def update_from_bbox(self, bbox_data, img_rect):
+        """复用当前图元显示另一个多边形，顶点数不同时才重建控制点"""
+        self.bbox_data = bbox_data
+        self.image_rect = img_rect
+        self.setPos(0, 0)
+        self.vertices = self._scene_points(bbox_data, img_rect)
+        if self.handles and len(self.handles) == len(self.vertices):
+            self._update_handles()
+        else:
+            self.refresh_handles()
+        self._build_polygon()
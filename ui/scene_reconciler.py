@@ -0,0 +1,141 @@
+from ui.annotation_layer import AnnotationLayer
+from ui.bbox_item import BBoxItem
+from ui.drag_coalescer import drag_coalescer
+from ui.obb_item import OBBItem
+from ui.polygon_item import PolygonItem
+
+ITEM_TYPES = {
+    'rect': BBoxItem,
+    'obb': OBBItem,
+    'polygon': PolygonItem,
+}
+
+
+class SceneReconciler:
+    """
+    让场景中的标注图元与标注列表保持一致
+
+    items 为 id -> 图元（MainWindow.bbox_items 即此字典）。reconcile() 按 id 对比：
+    已有同类型图元的只更新几何（update_from_bbox），类型变化或新增的才创建，多余的移除；
+    图元仍指向同一个 BBox 对象且图片范围未变时不做任何事。
+
+    标注数达到 layer_threshold（> 0）时进入合并绘制模式（layered）：所有标注由一个
+    AnnotationLayer 绘制，items 中只有被 promote_only() 提升的（选中的）标注。
+    """
+
+    def __init__(self, scene, on_created=None):
+        self.scene = scene
+        self.items = {}
+        self.layer = AnnotationLayer()
+        self.layered = False
+        self.layer_threshold = 0
+        self._on_created = on_created
+
+    def reconcile(self, bboxes, img_rect):
+        layered = 0 < self.layer_threshold <= len(bboxes)
+        if layered:
+            self.clear()
+            self.layer.set_bboxes(bboxes, img_rect)
+            if self.layer.scene() is not self.scene:
+                self.scene.addItem(self.layer)
+            self.layered = True
+            return
+        if self.layered:
+            self._drop_layer()
+        seen = set()
+        for bbox in bboxes:
+            seen.add(bbox.id)
+            self.sync(bbox.id, bbox, img_rect)
+        for bbox_id in [i for i in self.items if i not in seen]:
+            self.remove(bbox_id)
+
+    def _drop_layer(self):
+        self.layered = False
+        self.layer.clear()
+        if self.layer.scene() is self.scene:
+            self.scene.removeItem(self.layer)
+
+    def sync(self, bbox_id, bbox, img_rect):
+        """使 bbox_id 对应的图元显示 bbox（None 表示删除），返回图元"""
+        if bbox is None:
+            self.remove(bbox_id)
+            return None
+        if self.layered and bbox_id not in self.items:
+            self.layer.put(bbox)
+            return None
+        item_type = ITEM_TYPES.get(bbox.type)
+        item = self.items.get(bbox_id)
+        if item is not None and type(item) is item_type:
+            if item.bbox_data is not bbox or item.image_rect != img_rect:
+                item.update_from_bbox(bbox, img_rect)
+            if self.layered:
+                self.layer.put(bbox)
+            return item
+        if item is not None:
+            self.remove(bbox_id)
+        if item_type is None:
+            return None
+        item = item_type.from_bbox(bbox, img_rect)
+        self.add_item(bbox_id, item)
+        return item
+
+    def add_item(self, bbox_id, item):
+        """登记一个在外部创建的图元（如新建标注）"""
+        if self._on_created is not None:
+            self._on_created(item)
+        self.scene.addItem(item)
+        self.items[bbox_id] = item
+        if self.layered:
+            self.layer.put(item.bbox_data)
+            self.layer.set_hidden(bbox_id, True)
+
+    def remove(self, bbox_id):
+        item = self.items.pop(bbox_id, None)
+        if item is not None and item.scene() is self.scene:
+            self.scene.removeItem(item)
+        if self.layered:
+            self.layer.remove(bbox_id)
+
+    def clear(self):
+        for bbox_id in list(self.items):
+            self.remove(bbox_id)
+        if self.layered:
+            self._drop_layer()
+
+    def promote_only(self, bbox_id, img_rect):
+        """
+        返回 bbox_id 的完整图元（None 表示不需要）
+
+        合并绘制模式下按需创建该图元，其余已提升的图元交还图层绘制。
+        """
+        if not self.layered:
+            return self.items.get(bbox_id)
+        for other in [i for i in self.items if i != bbox_id]:
+            self._demote(other)
+        if bbox_id is None:
+            return None
+        item = self.items.get(bbox_id)
+        if item is not None:
+            return item
+        bbox = self.layer.bbox(bbox_id)
+        item_type = ITEM_TYPES.get(bbox.type) if bbox is not None else None
+        if item_type is None:
+            return None
+        item = item_type.from_bbox(bbox, img_rect)
+        self.add_item(bbox_id, item)
+        return item
+
+    def _demote(self, bbox_id):
+        drag_coalescer().commit()
+        item = self.items.pop(bbox_id)
+        if item.scene() is self.scene:
+            self.scene.removeItem(item)
+        # 图元期间对 bbox 的编辑是原地修改，交还时重新登记外接矩形
+        self.layer.put(item.bbox_data)
+        self.layer.set_hidden(bbox_id, False)
+
+    def hit_test(self, scene_pos):
+        """合并绘制模式下 scene_pos 处未提升的标注 id"""
+        if not self.layered:
+            return None
+        return self.layer.hit_test(scene_pos)
@@ -1,6 +1,6 @@
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGroupBox, QCheckBox, QLabel,
-    QComboBox, QSpinBox, QKeySequenceEdit, QPushButton, QMessageBox,
+    QComboBox, QSpinBox, QDoubleSpinBox, QKeySequenceEdit, QPushButton, QMessageBox,
     QDialogButtonBox,
 )
 from PyQt5.QtCore import pyqtSignal
@@ -55,8 +55,63 @@ class SettingsDialog(QDialog):
         behavior_layout.addLayout(interval_row)
 
         self.chk_periodic.toggled.connect(self.spin_interval.setEnabled)
+
+        tolerance_row = QHBoxLayout()
+        self.lbl_simplify_tolerance = QLabel()
+        self.spin_simplify_tolerance = QDoubleSpinBox()
+        self.spin_simplify_tolerance.setRange(0.1, 50.0)
+        self.spin_simplify_tolerance.setSingleStep(0.5)
+        self.spin_simplify_tolerance.setDecimals(1)
+        tolerance_row.addWidget(self.lbl_simplify_tolerance)
+        tolerance_row.addWidget(self.spin_simplify_tolerance)
+        tolerance_row.addStretch()
+        behavior_layout.addLayout(tolerance_row)
+
+        self.chk_simplify_on_load = QCheckBox()
+        behavior_layout.addWidget(self.chk_simplify_on_load)
         layout.addWidget(behavior_group)
 
+        perf_group = QGroupBox()
+        perf_group.setObjectName("performanceGroup")
+        perf_layout = QVBoxLayout(perf_group)
+
+        self.lbl_cache_mb = QLabel()
+        self.spin_cache_mb = QSpinBox()
+        self.spin_cache_mb.setRange(0, 65536)
+        self.spin_cache_mb.setSingleStep(64)
+        self.lbl_prefetch_ahead = QLabel()
+        self.spin_prefetch_ahead = QSpinBox()
+        self.spin_prefetch_ahead.setRange(0, 16)
+        self.lbl_prefetch_behind = QLabel()
+        self.spin_prefetch_behind = QSpinBox()
+        self.spin_prefetch_behind.setRange(0, 16)
+        self.lbl_tiled_threshold = QLabel()
+        self.spin_tiled_threshold = QSpinBox()
+        self.spin_tiled_threshold.setRange(0, 100000)
+        self.spin_tiled_threshold.setSingleStep(10)
+        self.lbl_layer_threshold = QLabel()
+        self.spin_layer_threshold = QSpinBox()
+        self.spin_layer_threshold.setRange(0, 1000000)
+        self.spin_layer_threshold.setSingleStep(500)
+        for lbl, spin in (
+            (self.lbl_cache_mb, self.spin_cache_mb),
+            (self.lbl_prefetch_ahead, self.spin_prefetch_ahead),
+            (self.lbl_prefetch_behind, self.spin_prefetch_behind),
+            (self.lbl_tiled_threshold, self.spin_tiled_threshold),
+            (self.lbl_layer_threshold, self.spin_layer_threshold),
+        ):
+            row = QHBoxLayout()
+            lbl.setMinimumWidth(160)
+            row.addWidget(lbl)
+            row.addWidget(spin)
+            row.addStretch()
+            perf_layout.addLayout(row)
+        self.chk_lazy_handles = QCheckBox()
+        perf_layout.addWidget(self.chk_lazy_handles)
+        self.chk_progressive_load = QCheckBox()
+        perf_layout.addWidget(self.chk_progressive_load)
+        layout.addWidget(perf_group)
+
         lang_group = QGroupBox()
         lang_group.setObjectName("langGroup")
         lang_layout = QHBoxLayout(lang_group)
@@ -77,11 +132,13 @@ class SettingsDialog(QDialog):
         shortcut_defs = [
             (ShortcutKey.SAVE, "settings.shortcut_save"),
             (ShortcutKey.UNDO, "settings.shortcut_undo"),
+            (ShortcutKey.REDO, "settings.shortcut_redo"),
             (ShortcutKey.ADD, "settings.shortcut_add"),
             (ShortcutKey.DELETE, "settings.shortcut_delete"),
             (ShortcutKey.RECT, "settings.shortcut_rect"),
             (ShortcutKey.OBB, "settings.shortcut_obb"),
             (ShortcutKey.POLYGON, "settings.shortcut_polygon"),
+            (ShortcutKey.FREEHAND, "settings.shortcut_freehand"),
             (ShortcutKey.POLYGON_FINISH, "settings.shortcut_finish"),
             (ShortcutKey.POLYGON_CANCEL, "settings.shortcut_cancel"),
             (ShortcutKey.PREV_IMAGE, "settings.shortcut_prev_image"),
@@ -113,6 +170,7 @@ class SettingsDialog(QDialog):
         layout.addWidget(buttons)
 
         self._behavior_group = behavior_group
+        self._perf_group = perf_group
         self._lang_group = lang_group
         self._shortcut_group = shortcut_group
 
@@ -122,6 +180,15 @@ class SettingsDialog(QDialog):
         self.chk_periodic.setChecked(s.periodic_auto_save)
         self.spin_interval.setValue(s.periodic_interval_min)
         self.spin_interval.setEnabled(s.periodic_auto_save)
+        self.spin_simplify_tolerance.setValue(s.simplify_tolerance_px)
+        self.chk_simplify_on_load.setChecked(s.simplify_on_load)
+        self.spin_cache_mb.setValue(s.image_cache_mb)
+        self.spin_prefetch_ahead.setValue(s.prefetch_ahead)
+        self.spin_prefetch_behind.setValue(s.prefetch_behind)
+        self.spin_tiled_threshold.setValue(s.tiled_threshold_mp)
+        self.spin_layer_threshold.setValue(s.layer_threshold)
+        self.chk_lazy_handles.setChecked(s.lazy_handles)
+        self.chk_progressive_load.setChecked(s.progressive_load)
 
         idx = self.combo_language.findData(s.language)
         if idx >= 0:
@@ -149,6 +216,15 @@ class SettingsDialog(QDialog):
             language=language,
             periodic_auto_save=self.chk_periodic.isChecked(),
             periodic_interval_min=self.spin_interval.value(),
+            image_cache_mb=self.spin_cache_mb.value(),
+            prefetch_ahead=self.spin_prefetch_ahead.value(),
+            prefetch_behind=self.spin_prefetch_behind.value(),
+            tiled_threshold_mp=self.spin_tiled_threshold.value(),
+            layer_threshold=self.spin_layer_threshold.value(),
+            lazy_handles=self.chk_lazy_handles.isChecked(),
+            progressive_load=self.chk_progressive_load.isChecked(),
+            simplify_tolerance_px=self.spin_simplify_tolerance.value(),
+            simplify_on_load=self.chk_simplify_on_load.isChecked(),
             shortcuts=shortcuts,
         )
 
@@ -170,6 +246,16 @@ class SettingsDialog(QDialog):
         self.lbl_nav_hint.setText(tr("settings.nav_save_hint"))
         self.chk_periodic.setText(tr("settings.periodic_auto_save"))
         self.lbl_interval.setText(tr("settings.periodic_interval"))
+        self.lbl_simplify_tolerance.setText(tr("settings.simplify_tolerance"))
+        self.chk_simplify_on_load.setText(tr("settings.simplify_on_load"))
+        self._perf_group.setTitle(tr("settings.performance"))
+        self.lbl_cache_mb.setText(tr("settings.image_cache_mb"))
+        self.lbl_prefetch_ahead.setText(tr("settings.prefetch_ahead"))
+        self.lbl_prefetch_behind.setText(tr("settings.prefetch_behind"))
+        self.lbl_tiled_threshold.setText(tr("settings.tiled_threshold_mp"))
+        self.lbl_layer_threshold.setText(tr("settings.layer_threshold"))
+        self.chk_lazy_handles.setText(tr("settings.lazy_handles"))
+        self.chk_progressive_load.setText(tr("settings.progressive_load"))
         self._lang_group.setTitle(tr("settings.language"))
         self.lbl_language.setText(tr("settings.language"))
         self._shortcut_group.setTitle(tr("settings.shortcuts"))
@@ -185,6 +271,7 @@ class SettingsDialog(QDialog):
             "settings.shortcut_rect": "settings.shortcut_rect",
             "settings.shortcut_obb": "settings.shortcut_obb",
             "settings.shortcut_polygon": "settings.shortcut_polygon",
+            "settings.shortcut_freehand": "settings.shortcut_freehand",
             "settings.shortcut_finish": "settings.shortcut_finish",
             "settings.shortcut_cancel": "settings.shortcut_cancel",
             "settings.shortcut_prev_image": "settings.shortcut_prev_image",
@@ -80,6 +80,7 @@ THEMES = {
 
 _current_theme_id = DEFAULT_THEME
 _template_cache = None
+_stylesheet_cache = {}  # theme_id -> 格式化后的样式表
 
 
 def _resources_dir():
@@ -118,17 +119,17 @@ def get_palette(theme_id=None):
     return THEMES[theme_id]
 
 
-def load_saved_theme_id():
-    settings = QSettings("YOLOTxtMaker", "YOLOTxtMaker")
+def load_saved_theme_id(settings=None):
+    settings = settings or QSettings("YOLOTxtMaker", "YOLOTxtMaker")
     theme_id = str(settings.value(SETTINGS_KEY, DEFAULT_THEME))
     if theme_id not in THEMES:
         theme_id = DEFAULT_THEME
     return theme_id
 
 
-def init_saved_theme():
+def init_saved_theme(settings=None):
     global _current_theme_id
-    _current_theme_id = load_saved_theme_id()
+    _current_theme_id = load_saved_theme_id(settings)
     return _current_theme_id
 
 
@@ -138,8 +139,13 @@ def save_theme_id(theme_id):
 
 
 def build_stylesheet(theme_id=None):
-    palette = get_palette(theme_id)
-    return _load_template().format(**palette)
+    if theme_id is None:
+        theme_id = _current_theme_id
+    stylesheet = _stylesheet_cache.get(theme_id)
+    if stylesheet is None:
+        stylesheet = _load_template().format(**get_palette(theme_id))
+        _stylesheet_cache[theme_id] = stylesheet
+    return stylesheet
 
 
 def get_annotation_colors(theme_id=None):
@@ -154,13 +160,15 @@ def get_annotation_colors(theme_id=None):
     }
 
 
-def apply_theme(app, window, theme_id):
+def apply_theme(app, window, theme_id, save=True):
+    """save=False 用于启动时应用已保存的主题，不必再写回"""
     global _current_theme_id
     if theme_id not in THEMES:
         theme_id = DEFAULT_THEME
 
     _current_theme_id = theme_id
-    save_theme_id(theme_id)
+    if save:
+        save_theme_id(theme_id)
 
     app.setStyleSheet(build_stylesheet(theme_id))
 
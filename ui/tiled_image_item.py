@@ -0,0 +1,172 @@
+import math
+from collections import OrderedDict
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QRect, QRectF, QSize, Qt, pyqtSignal
+from PyQt5.QtGui import QPainter
+from PyQt5.QtWidgets import QGraphicsItem
+
+from utils.image_loader import decode_tile
+
+TILE_SIZE = 512
+# 排队等待解码的分块上限，平移/缩放时最早的请求先被丢弃
+MAX_QUEUED_TILES = 64
+
+
+class _TileJob(QRunnable):
+    def __init__(self, loader, generation, key, path, clip, scaled):
+        super().__init__()
+        self._loader = loader
+        self._generation = generation
+        self._key = key
+        self._path = path
+        self._clip = clip
+        self._scaled = scaled
+
+    def run(self):
+        ok = False
+        try:
+            if self._generation == self._loader.generation:
+                image = decode_tile(self._path, self._clip, self._scaled)
+                if not image.isNull():
+                    self._loader.cache.put(self._key, image, image.sizeInBytes())
+                    ok = True
+        finally:
+            self._loader._job_done.emit(self._key, self._generation, ok)
+
+
+class TileLoader(QObject):
+    """
+    后台分块解码队列
+
+    最新请求的分块最先解码（LIFO），队列超过 MAX_QUEUED_TILES 时丢弃最旧的请求；
+    cancel_all() 在切换图片时作废全部排队与进行中的任务。
+    """
+
+    tile_loaded = pyqtSignal(object)
+    _job_done = pyqtSignal(object, int, bool)
+
+    def __init__(self, cache, parent=None):
+        super().__init__(parent)
+        self.cache = cache
+        self.generation = 0
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(3)
+        self._queue = OrderedDict()
+        self._running = set()
+        self._job_done.connect(self._on_job_done)
+
+    def request(self, key, path, clip: QRect, scaled: QSize):
+        if key in self._running:
+            return
+        self._queue.pop(key, None)
+        self._queue[key] = (path, clip, scaled)
+        while len(self._queue) > MAX_QUEUED_TILES:
+            self._queue.popitem(last=False)
+        self._pump()
+
+    def cancel_all(self):
+        self.generation += 1
+        self._queue.clear()
+
+    def shutdown(self):
+        self.cancel_all()
+        self._pool.waitForDone()
+
+    def _pump(self):
+        while self._queue and len(self._running) < self._pool.maxThreadCount():
+            key, (path, clip, scaled) = self._queue.popitem(last=True)
+            self._running.add(key)
+            self._pool.start(_TileJob(self, self.generation, key, path, clip, scaled))
+
+    def _on_job_done(self, key, generation, ok):
+        self._running.discard(key)
+        if ok and generation == self.generation:
+            self.tile_loaded.emit(key)
+        self._pump()
+
+
+class TiledImageItem(QGraphicsItem):
+    """
+    金字塔分块显示的大图
+
+    场景坐标始终为原图像素（boundingRect 即原图大小），标注坐标不受影响。
+    绘制时按当前缩放选择层级：第 L 层为原图的 1/2^L，每块 TILE_SIZE 像素；
+    缺失的分块先用概览图代替并交给 TileLoader 后台读取。
+    """
+
+    def __init__(self, path, full_size: QSize, overview, loader: TileLoader):
+        super().__init__()
+        self.path = str(path)
+        self._size = full_size
+        self._rect = QRectF(0, 0, full_size.width(), full_size.height())
+        self._overview = overview
+        self._overview_scale = overview.width() / full_size.width()
+        self._loader = loader
+        longest = max(full_size.width(), full_size.height())
+        self._max_level = max(0, math.ceil(math.log2(max(1.0, longest / TILE_SIZE))))
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption, True)
+        self.setAcceptedMouseButtons(Qt.NoButton)
+
+    def boundingRect(self):
+        return self._rect
+
+    def image_size(self) -> QSize:
+        return self._size
+
+    def _tile_rect(self, level: int, tx: int, ty: int) -> QRectF:
+        span = TILE_SIZE << level
+        x = tx * span
+        y = ty * span
+        return QRectF(
+            x, y,
+            min(span, self._size.width() - x),
+            min(span, self._size.height() - y),
+        )
+
+    def _draw_overview(self, painter, target: QRectF):
+        s = self._overview_scale
+        source = QRectF(target.x() * s, target.y() * s, target.width() * s, target.height() * s)
+        painter.drawImage(target, self._overview, source)
+
+    def paint(self, painter, option, widget=None):
+        exposed = option.exposedRect.intersected(self._rect)
+        if exposed.isEmpty():
+            return
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
+        if lod <= self._overview_scale:
+            self._draw_overview(painter, exposed)
+            return
+
+        level = int(math.floor(math.log2(1.0 / lod))) if lod < 1.0 else 0
+        level = max(0, min(self._max_level, level))
+        span = TILE_SIZE << level
+        tx0 = int(exposed.left() // span)
+        ty0 = int(exposed.top() // span)
+        tx1 = int(math.ceil(exposed.right() / span))
+        ty1 = int(math.ceil(exposed.bottom() / span))
+
+        cache = self._loader.cache
+        for ty in range(ty0, ty1):
+            for tx in range(tx0, tx1):
+                target = self._tile_rect(level, tx, ty)
+                if target.isEmpty():
+                    continue
+                key = (self.path, level, tx, ty)
+                tile = cache.get(key)
+                if tile is not None:
+                    painter.drawImage(target, tile)
+                    continue
+                self._draw_overview(painter, target)
+                clip = target.toAlignedRect()
+                scaled = QSize(
+                    max(1, math.ceil(clip.width() / (1 << level))),
+                    max(1, math.ceil(clip.height() / (1 << level))),
+                )
+                self._loader.request(key, self.path, clip, scaled)
+
+    def on_tile_loaded(self, key):
+        if key[0] != self.path:
+            return
+        _, level, tx, ty = key
+        self.update(self._tile_rect(level, tx, ty))
@@ -0,0 +1,231 @@
+import threading
+from pathlib import Path
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from core import tracing
+from utils.image_loader import decode_for_display, decode_preview
+
+
+class LoadResult:
+    __slots__ = ("token", "image_path", "image", "image_size", "tiled", "bboxes", "error",
+                 "simplified", "preview", "replaces_preview")
+
+    def __init__(self, token, image_path, image=None, bboxes=None, error=None,
+                 image_size=None, tiled=False, simplified=None, preview=False,
+                 replaces_preview=False):
+        self.token = token
+        self.image_path = image_path
+        self.image = image
+        self.image_size = image_size
+        self.tiled = tiled
+        self.bboxes = bboxes
+        self.error = error
+        # 加载时简化了多边形则为 (简化前顶点数, 简化后顶点数)
+        self.simplified = simplified
+        # preview：image 为缩小的预览，image_size 为原图尺寸，场景仍按原图像素布置
+        # replaces_preview：随后送达的原图，只含 image，用来替换已显示的预览
+        self.preview = preview
+        self.replaces_preview = replaces_preview
+
+
+def simplify_polygons(bboxes, tolerance_px: float, width: int, height: int):
+    """原地简化 bboxes 中的多边形，有顶点被删除时返回 (简化前, 简化后) 顶点数，否则 None"""
+    from core.polygon_simplify import simplify_normalized
+    before = after = 0
+    for bbox in bboxes:
+        if bbox.type != 'polygon':
+            continue
+        points = simplify_normalized(bbox.points, tolerance_px, width, height)
+        before += len(bbox.points)
+        after += len(points)
+        bbox.points = points
+    return (before, after) if after < before else None
+
+
+def load_image_and_labels(image_path: Path, txt_path: Path, cache=None, is_current=None,
+                          tiled_min_pixels: int = 0, simplify_tolerance: float = 0.0,
+                          on_preview=None):
+    """
+    解码图片并解析标注（工作线程与 GUI 线程共用）
+
+    is_current 返回 False 时提前放弃，返回 None。
+    simplify_tolerance > 0 时按原图像素容差简化多边形。
+    给出 on_preview 时大图先快速解码预览，连同标注以 preview 结果传给 on_preview，
+    再解码原图，返回只含原图的 replaces_preview 结果。
+    """
+    if is_current is not None and not is_current():
+        return None
+    if not image_path.exists():
+        return LoadResult(None, image_path, error="not_found")
+
+    image = None
+    if on_preview is not None:
+        with tracing.span("load.preview", image=image_path.name):
+            image, size = decode_preview(image_path, cache, tiled_min_pixels)
+    preview = image is not None
+    tiled = False
+    if not preview:
+        with tracing.span("load.decode", image=image_path.name):
+            image, size, tiled = decode_for_display(image_path, cache, tiled_min_pixels)
+
+    if is_current is not None and not is_current():
+        return None
+    # numpy 相关模块延迟到首次加载时导入，不拖慢启动
+    from core.yolo_io import load_yolo_txt
+    with tracing.span("load.parse_labels"):
+        bboxes = load_yolo_txt(txt_path)
+    simplified = None
+    if simplify_tolerance > 0 and size.isValid():
+        with tracing.span("load.simplify"):
+            simplified = simplify_polygons(bboxes, simplify_tolerance, size.width(), size.height())
+    result = LoadResult(
+        None, image_path, image=image, bboxes=bboxes, image_size=size, tiled=tiled,
+        simplified=simplified, preview=preview,
+    )
+    if not preview:
+        return result
+    on_preview(result)
+
+    if is_current is not None and not is_current():
+        return None
+    with tracing.span("load.decode", image=image_path.name):
+        image, size, tiled = decode_for_display(image_path, cache, tiled_min_pixels)
+    return LoadResult(
+        None, image_path, image=image, image_size=size, tiled=tiled, replaces_preview=True,
+    )
+
+
+class _LoadJob(QRunnable):
+    def __init__(self, pipeline, token, image_path, txt_path):
+        super().__init__()
+        self._pipeline = pipeline
+        self._token = token
+        self._image_path = image_path
+        self._txt_path = txt_path
+
+    def run(self):
+        def emit_preview(preview):
+            preview.token = self._token
+            self._pipeline.loaded.emit(preview)
+
+        try:
+            result = load_image_and_labels(
+                self._image_path,
+                self._txt_path,
+                cache=self._pipeline.cache,
+                is_current=lambda: self._pipeline.is_current(self._token),
+                tiled_min_pixels=self._pipeline.tiled_min_pixels,
+                simplify_tolerance=self._pipeline.simplify_tolerance,
+                on_preview=emit_preview if self._pipeline.progressive else None,
+            )
+        except Exception as e:
+            result = LoadResult(None, self._image_path, error=str(e))
+        if result is None:
+            return
+        result.token = self._token
+        self._pipeline.loaded.emit(result)
+
+
+class ImageLoadPipeline(QObject):
+    """
+    在线程池中加载图片与标注，结果通过 loaded 信号回到 GUI 线程
+
+    每次 request() 都会使之前的请求失效：排队中的任务被移除，进行中的任务在下一个检查点放弃，
+    已发出的过期结果由 is_current() 过滤。
+    progressive 为真时大图的一次请求会先后发出 preview 与 replaces_preview 两个结果。
+    """
+
+    loaded = pyqtSignal(object)  # LoadResult
+
+    def __init__(self, cache=None, parent=None):
+        super().__init__(parent)
+        self.cache = cache
+        self.tiled_min_pixels = 0
+        # > 0 时加载后简化多边形（像素）
+        self.simplify_tolerance = 0.0
+        # 大图先显示缩小的预览，原图在后台解码完成后替换
+        self.progressive = True
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(2)
+        self._token = 0
+        self._lock = threading.Lock()
+
+    def request(self, image_path: Path, txt_path: Path) -> int:
+        token = self.cancel()
+        self._pool.start(_LoadJob(self, token, image_path, txt_path))
+        return token
+
+    def cancel(self) -> int:
+        with self._lock:
+            self._token += 1
+            token = self._token
+        self._pool.clear()
+        return token
+
+    def is_current(self, token) -> bool:
+        with self._lock:
+            return token == self._token
+
+    def shutdown(self):
+        self.cancel()
+        self._pool.waitForDone()
+
+
+class _IndexJob(QRunnable):
+    """打开 folder 的索引执行 work(index)，结果（或异常）交给 done(folder, result)"""
+
+    def __init__(self, folder, work, done=None):
+        super().__init__()
+        self._folder = folder
+        self._work = work
+        self._done = done
+
+    def run(self):
+        import sqlite3
+        from core.dataset_index import DatasetIndex
+        try:
+            with DatasetIndex(self._folder) as index:
+                result = self._work(index)
+        except (sqlite3.Error, OSError) as e:
+            result = e
+        if self._done is not None:
+            self._done(self._folder, result)
+
+
+def _refresh_and_stats(index):
+    index.refresh()
+    return index.stats()
+
+
+class IndexRefresher(QObject):
+    """
+    在单个工作线程中依次执行保存目录 DatasetIndex 的所有读写，GUI 线程不直接访问数据库
+
+    finished(folder, result)：refresh() 的结果，(更新数, 删除数) 或异常对象。
+    stats_ready(folder, result)：request_stats() 的结果，DatasetIndex.stats() 或异常对象。
+    """
+
+    finished = pyqtSignal(object, object)
+    stats_ready = pyqtSignal(object, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+
+    def refresh(self, folder: Path):
+        self._pool.start(_IndexJob(Path(folder), lambda index: index.refresh(), self.finished.emit))
+
+    def update_file(self, folder: Path, txt_path: Path):
+        """保存后同步单个 txt（按写入磁盘的内容重新解析）"""
+        txt_path = Path(txt_path)
+        self._pool.start(_IndexJob(Path(folder), lambda index: index.update_file(txt_path)))
+
+    def request_stats(self, folder: Path):
+        """增量刷新后统计，结果由 stats_ready 发出"""
+        self._pool.start(_IndexJob(Path(folder), _refresh_and_stats, self.stats_ready.emit))
+
+    def shutdown(self):
+        self._pool.clear()
+        self._pool.waitForDone()
@@ -0,0 +1,155 @@
+import threading
+from collections import OrderedDict
+
+from PyQt5.QtCore import QRunnable, QThreadPool, QThread
+
+from core.settings_manager import DEFAULT_PREFETCH_AHEAD, DEFAULT_PREFETCH_BEHIND
+from utils.image_loader import decode_for_display, is_display_cached
+
+
+class LRUCache:
+    """
+    按字节预算淘汰的 LRU 缓存（线程安全）
+
+    put() 时记录每个条目的开销，总量超过 max_bytes 时从最久未使用的条目开始淘汰。
+    """
+
+    def __init__(self, max_bytes: int):
+        self._max_bytes = max(0, int(max_bytes))
+        self._entries = OrderedDict()
+        self._total = 0
+        self._lock = threading.Lock()
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value, cost: int):
+        cost = int(cost)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._total -= old[1]
+            if cost > self._max_bytes:
+                return
+            self._entries[key] = (value, cost)
+            self._total += cost
+            self._evict()
+
+    def discard(self, key):
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._total -= old[1]
+
+    def set_max_bytes(self, max_bytes: int):
+        with self._lock:
+            self._max_bytes = max(0, int(max_bytes))
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._total = 0
+
+    def _evict(self):
+        while self._total > self._max_bytes and self._entries:
+            _, (_, cost) = self._entries.popitem(last=False)
+            self._total -= cost
+
+
+class _DecodeJob(QRunnable):
+    def __init__(self, prefetcher, key):
+        super().__init__()
+        self._prefetcher = prefetcher
+        self._key = key
+
+    def run(self):
+        try:
+            decode_for_display(
+                self._key, self._prefetcher.cache, self._prefetcher.tiled_min_pixels
+            )
+        finally:
+            self._prefetcher._job_done(self._key)
+
+
+class ImagePrefetcher:
+    """
+    在后台线程池中预解码相邻图片到 LRUCache
+
+    request() 传入当前序号后，会按 ahead / behind 排队解码前后若干张（与翻页一致按首尾循环）。
+    """
+
+    def __init__(self, cache: LRUCache, ahead: int = DEFAULT_PREFETCH_AHEAD,
+                 behind: int = DEFAULT_PREFETCH_BEHIND):
+        self.cache = cache
+        self.ahead = ahead
+        self.behind = behind
+        self.tiled_min_pixels = 0
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(max(1, min(4, QThread.idealThreadCount() - 1)))
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    def set_window(self, ahead: int, behind: int):
+        self.ahead = max(0, int(ahead))
+        self.behind = max(0, int(behind))
+
+    def request(self, paths, index: int):
+        total = len(paths)
+        if total <= 1:
+            return
+        # 先排近处的：+1, -1, +2, -2 ...
+        order = []
+        for step in range(1, max(self.ahead, self.behind) + 1):
+            if step <= self.ahead:
+                order.append((index + step) % total)
+            if step <= self.behind:
+                order.append((index - step) % total)
+        self.cancel()
+        for i in order:
+            if i == index:
+                continue
+            self._submit(str(paths[i]))
+
+    def cancel(self):
+        """丢弃排队中的预解码（进行中的任务会做完）"""
+        self._pool.clear()
+        with self._lock:
+            self._pending.clear()
+
+    def _submit(self, key):
+        if is_display_cached(key, self.cache):
+            return
+        with self._lock:
+            if key in self._pending:
+                return
+            self._pending.add(key)
+        self._pool.start(_DecodeJob(self, key))
+
+    def _job_done(self, key):
+        with self._lock:
+            self._pending.discard(key)
+
+    def shutdown(self):
+        self._pool.clear()
+        self._pool.waitForDone()
@@ -1,6 +1,124 @@
-from PyQt5.QtGui import QPixmap
+from PyQt5.QtCore import QSize
+from PyQt5.QtGui import QImage, QImageIOHandler, QImageReader, QPixmap
 
-def load_image(path):
+# 分块模式下整图概览的最长边
+OVERVIEW_MAX_SIDE = 2048
+# 渐进加载时预览的最长边；原图最长边不到其 2 倍时直接解码原图
+PREVIEW_MAX_SIDE = 1024
+
+
+def decode_image(path) -> QImage:
+    """解码为 QImage（可在工作线程调用，QPixmap 只能在 GUI 线程创建）"""
+    reader = QImageReader(str(path))
+    image = reader.read()
+    return image
+
+
+def decode_image_cached(path, cache) -> QImage:
+    key = str(path)
+    image = cache.get(key)
+    if image is None:
+        image = decode_image(path)
+        if not image.isNull():
+            cache.put(key, image, image.sizeInBytes())
+    return image
+
+
+def overview_key(path):
+    return ("overview", str(path))
+
+
+def is_display_cached(path, cache) -> bool:
+    return str(path) in cache or overview_key(path) in cache
+
+
+def _fit_size(size: QSize, max_side: int) -> QSize:
+    scale = max_side / max(size.width(), size.height())
+    return QSize(max(1, round(size.width() * scale)), max(1, round(size.height() * scale)))
+
+
+def _overview_size(size: QSize) -> QSize:
+    return _fit_size(size, OVERVIEW_MAX_SIDE)
+
+
+def _wants_tiles(reader: QImageReader, size: QSize, tiled_min_pixels: int) -> bool:
+    """
+    是否按分块显示
+
+    分块读取依赖 ClipRect；不支持的格式（PNG、BMP 等）每个分块都要解码整图，
+    比一次解码整图还慢，这类图片不分块。
+    """
+    return (
+        tiled_min_pixels > 0
+        and size.isValid()
+        and size.width() * size.height() >= tiled_min_pixels
+        and reader.supportsOption(QImageIOHandler.ClipRect)
+    )
+
+
+def decode_for_display(path, cache=None, tiled_min_pixels: int = 0):
+    """
+    解码用于显示的图片，返回 (image, full_size, tiled)
+
+    像素数不低于 tiled_min_pixels（>0 时）且支持区域读取的大图只解码缩小的概览
+    （JPEG 可在 DCT 阶段缩放），其余区域由 TiledImageItem 按需分块读取；
+    此时 full_size 为原图尺寸。
+    """
+    key = str(path)
+    if cache is not None:
+        image = cache.get(key)
+        if image is not None:
+            return image, image.size(), False
+        entry = cache.get(overview_key(path))
+        if entry is not None:
+            return entry[0], entry[1], True
+
+    reader = QImageReader(key)
+    size = reader.size()
+    if _wants_tiles(reader, size, tiled_min_pixels):
+        reader.setScaledSize(_overview_size(size))
+        image = reader.read()
+        if not image.isNull() and cache is not None:
+            cache.put(overview_key(path), (image, size), image.sizeInBytes())
+        return image, size, True
+
+    image = reader.read()
+    if not image.isNull() and cache is not None:
+        cache.put(key, image, image.sizeInBytes())
+    return image, image.size(), False
+
+
+def decode_preview(path, cache=None, tiled_min_pixels: int = 0):
+    """
+    快速解码缩小的预览，返回 (image, full_size)；不需要预览时 image 为 None
+
+    JPEG 在 DCT 阶段缩放，只需完整解码的一小部分时间。已在缓存中、会按分块显示
+    或尺寸不大的图片不做预览。
+    """
+    if cache is not None and is_display_cached(path, cache):
+        return None, QSize()
+    reader = QImageReader(str(path))
+    size = reader.size()
+    if not size.isValid() or max(size.width(), size.height()) < 2 * PREVIEW_MAX_SIDE:
+        return None, size
+    if _wants_tiles(reader, size, tiled_min_pixels):
+        return None, size
+    reader.setScaledSize(_fit_size(size, PREVIEW_MAX_SIDE))
+    image = reader.read()
+    return (None if image.isNull() else image), size
+
+
+def decode_tile(path, clip_rect, scaled_size: QSize) -> QImage:
+    """读取原图 clip_rect 区域并缩放到 scaled_size（支持的格式无需解码整图）"""
+    reader = QImageReader(str(path))
+    reader.setClipRect(clip_rect)
+    reader.setScaledSize(scaled_size)
+    return reader.read()
+
+
+def load_image(path, cache=None):
+    if cache is not None:
+        return QPixmap.fromImage(decode_image_cached(path, cache))
 
     pixmap = QPixmap(str(path))
-    return pixmap
\ No newline at end of file
+    return pixmap
@@ -0,0 +1,49 @@
+"""
+启动耗时测量与延迟导入
+
+main.py 启动时只导入显示第一个窗口所需的模块；numpy、sqlite3、设置对话框等
+在窗口显示后由 preload_deferred() 在后台线程导入，首次打开文件夹时不必再等。
+"""
+import importlib
+import json
+import threading
+import time
+
+# 首帧之后再导入的模块（代码中均为函数内导入）
+DEFERRED_MODULES = (
+    "core.yolo_io",
+    "core.polygon_simplify",
+    "core.dataset_index",
+    "ui.settings_dialog",
+)
+
+
+def preload_deferred():
+    def run():
+        for name in DEFERRED_MODULES:
+            importlib.import_module(name)
+
+    threading.Thread(target=run, name="preload", daemon=True).start()
+
+
+class StartupTimer:
+    """按阶段记录自 origin（进程内最早的 perf_counter 读数）起的耗时"""
+
+    def __init__(self, origin: float):
+        self._origin = origin
+        self._last = origin
+        self.phases = []  # (阶段名, 本阶段毫秒)
+
+    def mark(self, phase: str):
+        now = time.perf_counter()
+        self.phases.append((phase, (now - self._last) * 1000))
+        self._last = now
+
+    def total_ms(self) -> float:
+        return (self._last - self._origin) * 1000
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "phases_ms": {name: round(ms, 2) for name, ms in self.phases},
+            "total_ms": round(self.total_ms(), 2),
+        })
@@ -0,0 +1,177 @@
+"""
+Headless batch operations over a folder of YOLO label files (no PyQt5).
+
+Usage:
+    python yolo_batch.py validate LABEL_DIR [--classes 80]
+    python yolo_batch.py normalize LABEL_DIR [--dry-run]
+    python yolo_batch.py convert LABEL_DIR --to rect [--from obb polygon] [--dry-run]
+    python yolo_batch.py stats LABEL_DIR [--json]
+    python yolo_batch.py simplify LABEL_DIR [--tolerance 1.0] [--image-size 1920x1080] [--dry-run]
+
+Files are processed in chunks on a process pool (-j, default: all cores).
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from core.batch import DEFAULT_CHUNK_SIZE, list_label_files, run_batch
+from core.polygon_simplify import METHODS
+from core.yolo_io import TYPE_NAMES
+
+# 打印的问题/错误条数上限，完整列表用 --json 输出
+MAX_PRINTED = 50
+
+
+def _progress_printer(op: str, stream):
+    state = {"last": 0.0}
+
+    def progress(done, total):
+        now = time.monotonic()
+        if done < total and now - state["last"] < 0.2:
+            return
+        state["last"] = now
+        stream.write(f"\r[{op}] {done}/{total} files")
+        if done >= total:
+            stream.write("\n")
+        stream.flush()
+
+    return progress
+
+
+def _print_list(title, rows, fmt):
+    if not rows:
+        return
+    print(f"{title} ({len(rows)}):")
+    for row in rows[:MAX_PRINTED]:
+        print("  " + fmt(row))
+    if len(rows) > MAX_PRINTED:
+        print(f"  ... {len(rows) - MAX_PRINTED} more")
+
+
+def _saving(before, after):
+    return f"{before} -> {after} (-{(before - after) / before:.1%})" if before else "0"
+
+
+def _print_summary(op, summary, elapsed):
+    print(f"{op}: {summary.files} files in {elapsed:.2f}s")
+    if op in ("normalize", "convert", "simplify"):
+        print(f"  changed: {summary.changed}")
+    if op == "simplify":
+        print(f"  polygon vertices: {_saving(summary.vertices_before, summary.vertices_after)}")
+        print(f"  bytes: {_saving(summary.bytes_before, summary.bytes_after)}")
+    if op == "stats":
+        print(f"  boxes: {summary.boxes}")
+        print(f"  empty files: {summary.empty_files}")
+        print("  types: " + ", ".join(f"{t} {summary.type_counts.get(t, 0)}" for t in TYPE_NAMES))
+        for class_id, count in sorted(summary.class_counts.items()):
+            print(f"  class {class_id}: {count}")
+    _print_list("issues", summary.issues, lambda r: f"{r[0]}:{r[1]}: {r[2]}")
+    _print_list("errors", summary.errors, lambda r: f"{r[0]}: {r[1]}")
+
+
+def _summary_dict(summary):
+    return {
+        "files": summary.files,
+        "changed": summary.changed,
+        "boxes": summary.boxes,
+        "empty_files": summary.empty_files,
+        "class_counts": {str(k): v for k, v in sorted(summary.class_counts.items())},
+        "type_counts": dict(summary.type_counts),
+        "vertices_before": summary.vertices_before,
+        "vertices_after": summary.vertices_after,
+        "bytes_before": summary.bytes_before,
+        "bytes_after": summary.bytes_after,
+        "issues": [list(r) for r in summary.issues],
+        "errors": [list(r) for r in summary.errors],
+    }
+
+
+def _image_size(text):
+    """--image-size 的取值：640 或 1920x1080"""
+    try:
+        parts = [int(v) for v in text.lower().split("x")]
+    except ValueError:
+        parts = []
+    if len(parts) == 1:
+        parts *= 2
+    if len(parts) != 2 or min(parts) <= 0:
+        raise argparse.ArgumentTypeError(f"expected N or WxH, got {text!r}")
+    return tuple(parts)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Batch operations on YOLO label folders")
+    sub = parser.add_subparsers(dest="op", required=True)
+
+    def add(name, help_text):
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument("folder", type=Path, help="folder containing the .txt label files")
+        p.add_argument("-j", "--jobs", type=int, default=None,
+                       help="worker processes (default: CPU count, 1 = no pool)")
+        p.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                       help="files per task sent to a worker")
+        p.add_argument("-q", "--quiet", action="store_true", help="no progress output")
+        p.add_argument("--json", action="store_true", help="print the summary as JSON")
+        return p
+
+    p = add("validate", "report malformed lines, bad class ids and out-of-range coordinates")
+    p.add_argument("--classes", type=int, default=None,
+                   help="number of classes; class ids must be below it")
+
+    p = add("normalize", "rewrite every file in the canonical format (clamped, 6 decimals)")
+    p.add_argument("--dry-run", action="store_true", help="only count files that would change")
+
+    p = add("convert", "convert annotation types")
+    p.add_argument("--to", dest="target", choices=("rect", "obb"), required=True,
+                   help="target type (polygons become their bounding box)")
+    p.add_argument("--from", dest="sources", nargs="+", choices=TYPE_NAMES, default=None,
+                   help="only convert these types (default: all)")
+    p.add_argument("--dry-run", action="store_true", help="only count files that would change")
+
+    add("stats", "count boxes per class and per type")
+
+    p = add("simplify", "drop redundant polygon vertices within a pixel tolerance")
+    p.add_argument("--tolerance", type=float, default=1.0,
+                   help="max deviation in pixels (default: 1.0)")
+    p.add_argument("--image-size", type=_image_size, default=(640, 640),
+                   help="nominal image size the tolerance refers to, N or WxH (default: 640)")
+    p.add_argument("--method", choices=METHODS, default="rdp",
+                   help="rdp = Douglas-Peucker, visvalingam = smallest-area first")
+    p.add_argument("--dry-run", action="store_true", help="only report what would change")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if not args.folder.is_dir():
+        print(f"not a folder: {args.folder}", file=sys.stderr)
+        return 2
+
+    options = {
+        "num_classes": getattr(args, "classes", None),
+        "dry_run": getattr(args, "dry_run", False),
+        "target": getattr(args, "target", None),
+        "sources": getattr(args, "sources", None),
+        "tolerance": getattr(args, "tolerance", None),
+        "image_size": getattr(args, "image_size", None),
+        "method": getattr(args, "method", None),
+    }
+    paths = list_label_files(args.folder)
+    progress = None if args.quiet else _progress_printer(args.op, sys.stderr)
+
+    t0 = time.perf_counter()
+    summary = run_batch(args.op, paths, options, jobs=args.jobs,
+                        chunk_size=args.chunk_size, progress=progress)
+    elapsed = time.perf_counter() - t0
+
+    if args.json:
+        print(json.dumps(_summary_dict(summary), ensure_ascii=False, indent=2))
+    else:
+        _print_summary(args.op, summary, elapsed)
+    return 1 if summary.issues or summary.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())